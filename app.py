@@ -1,7 +1,7 @@
 import sys
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QTabWidget, QLabel, QFrame, QPushButton,
-                             QFileDialog)
+                             QFileDialog, QProgressDialog)
 from PyQt6.QtGui import QPalette, QColor
 from PyQt6.QtCore import Qt, QTimer
 
@@ -76,6 +76,11 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    def closeEvent(self, event):
+        # A calculation thread still running at exit would abort the process
+        self.calculations_widget.shutdown_calculation()
+        super().closeEvent(event)
+
     def setup_tabs(self):
         """Creates the tab widget and populates it with our custom widgets."""
         right_panel = QWidget()
@@ -118,7 +123,18 @@ class MainWindow(QMainWindow):
     def open_csv_file_dialog(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "Open CSV File", "", "CSV Files (*.csv)")
         if file_name:
-            self.data_manager.load_csv(file_name) 
+            # Modal progress dialog; setValue() pumps events so Cancel stays responsive
+            progress = QProgressDialog("Loading CSV...", "Cancel", 0, 100, self)
+            progress.setWindowTitle("Loading")
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setMinimumDuration(500)
+            progress.canceled.connect(self.data_manager.cancel_csv_load)
+            self.data_manager.load_progress.connect(progress.setValue)
+            try:
+                self.data_manager.load_csv(file_name)
+            finally:
+                self.data_manager.load_progress.disconnect(progress.setValue)
+                progress.close()
 
     def open_session_file_dialog(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "Open Session File", "", "JSON Files (*.json)")
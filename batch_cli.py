@@ -0,0 +1,241 @@
+"""
+batch_cli.py
+
+Headless Calculations-DDT pipeline over many saved sessions.
+
+Each job loads a session JSON and its CSV through DataManager, takes the
+rows the Calculations tab would use (the session's time window and
+Calculations resample setting; no ON-time filtering) and runs
+calculation_orchestrator.run_batch_processing, the entry point the
+Calculations tab also streams its batch through. Jobs run in parallel
+worker processes; each writes its results (the exported Calculations
+columns) as CSV or Parquet plus a log file with the pipeline output, and
+summary.csv lists timing and row counts per job.
+
+Rows the engine cannot evaluate stay in the results with empty values and
+their message in an extra "error" column; summary.csv counts them in
+error_rows. A job only fails when no row could be calculated.
+
+Usage:
+    python batch_cli.py "runs/*.json" --output-dir results [--format parquet] [--jobs 4]
+    python batch_cli.py --pair session.json data.csv --pair other.json other.csv
+
+A session's CSV is the file named by its csvPath (relative to the session
+folder), or else <session name>.csv next to it. Use --pair to give it
+explicitly. The exit status is 1 if any job failed.
+"""
+
+import argparse
+import contextlib
+import glob
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+SUMMARY_FILE = 'summary.csv'
+OUTPUT_FORMATS = ('csv', 'parquet')
+
+
+def _init_worker() -> None:
+    """Headless Qt: DataManager is a QObject and load_session builds QPixmaps."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt6.QtGui import QGuiApplication
+    if QGuiApplication.instance() is None:
+        _init_worker.app = QGuiApplication([])
+
+
+def find_session_csv(session_path: str) -> Optional[str]:
+    """CSV belonging to a session: its csvPath, else <session name>.csv beside it."""
+    folder = os.path.dirname(os.path.abspath(session_path))
+    candidates = []
+    try:
+        with open(session_path, 'r', encoding='utf-8') as f:
+            csv_path = json.load(f).get('csvPath')
+        if csv_path:
+            candidates += [csv_path, os.path.join(folder, os.path.basename(csv_path))]
+    except (OSError, ValueError):
+        pass
+    candidates.append(os.path.splitext(os.path.abspath(session_path))[0] + '.csv')
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def collect_jobs(patterns: List[str], pairs: List[List[str]]) -> List[Tuple[str, Optional[str]]]:
+    """(session, csv) pairs from session globs and explicit --pair arguments, in order."""
+    jobs = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) or [pattern]
+        for session_path in matches:
+            jobs.append((session_path, find_session_csv(session_path)))
+    for session_path, csv_path in pairs:
+        jobs.append((session_path, csv_path))
+    return jobs
+
+
+def _output_names(jobs: List[Tuple[str, Optional[str]]]) -> List[str]:
+    """Unique output base names derived from the session file names."""
+    names, used = [], set()
+    for session_path, _ in jobs:
+        stem = os.path.splitext(os.path.basename(session_path))[0]
+        name, n = stem, 2
+        while name in used:
+            name, n = f"{stem}_{n}", n + 1
+        used.add(name)
+        names.append(name)
+    return names
+
+
+def _write_results(df: pd.DataFrame, path: str, output_format: str) -> None:
+    if output_format == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        # Same encoding as the Calculations tab export
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def process_job(job: Dict) -> Dict:
+    """
+    Run one session + CSV through the pipeline and write its results.
+
+    Never raises: failures are reported in the returned summary row.
+    """
+    _init_worker()
+    summary = {
+        'session': job['session'], 'csv': job['csv'], 'output': None, 'status': 'failed',
+        'rows_in': 0, 'rows_filtered': 0, 'rows_out': 0, 'error_rows': 0,
+        'load_s': 0.0, 'calc_s': 0.0, 'write_s': 0.0, 'total_s': 0.0, 'error': '',
+    }
+    log_path = os.path.join(job['output_dir'], job['name'] + '.log')
+    start = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+        try:
+            if not job['csv']:
+                raise FileNotFoundError("no CSV found for this session (use --pair)")
+
+            from calculation_orchestrator import run_batch_processing
+            from data_manager import DataManager
+            from labels_config import COLUMN_NAMES
+
+            data_manager = DataManager()
+            data_manager.interactive = False
+            if not data_manager.load_session(job['session']):
+                raise RuntimeError(f"could not load session {job['session']}")
+            if not data_manager.load_csv(job['csv'], streaming=False):
+                raise RuntimeError(f"could not load CSV {job['csv']}")
+            input_df = data_manager.get_filtered_data(consumer='calculations')
+            summary['rows_in'] = len(data_manager.csv_data)
+            summary['rows_filtered'] = 0 if input_df is None else len(input_df)
+            summary['load_s'] = time.perf_counter() - start
+            if input_df is None or input_df.empty:
+                raise ValueError("no data rows after filtering")
+
+            t0 = time.perf_counter()
+            # Jobs are already spread over processes; each runs its batch serially.
+            # Only the exported columns are computed (no P-h enthalpies).
+            results = run_batch_processing(data_manager, input_df, workers=1, columns=COLUMN_NAMES)
+            summary['calc_s'] = time.perf_counter() - t0
+            errors = results['error'] if 'error' in results.columns else pd.Series(dtype=object)
+            error_rows = summary['error_rows'] = int(errors.notna().sum())
+            if error_rows == len(results):
+                raise RuntimeError(str(errors.dropna().iloc[0]) if error_rows else "no result rows")
+            if error_rows:
+                print(f"[BATCH CLI] {error_rows} of {len(results)} rows could not be calculated, "
+                      f"first error: {errors.dropna().iloc[0]}")
+
+            t0 = time.perf_counter()
+            export_df = results.reindex(columns=COLUMN_NAMES + (['error'] if error_rows else []))
+            output_path = os.path.join(job['output_dir'], f"{job['name']}.{job['format']}")
+            _write_results(export_df, output_path, job['format'])
+            summary['write_s'] = time.perf_counter() - t0
+            summary.update(output=output_path, status='ok', rows_out=len(export_df))
+        except Exception as e:
+            import traceback
+            traceback.print_exc(file=log)
+            summary['error'] = f"{type(e).__name__}: {e}"
+    summary['total_s'] = time.perf_counter() - start
+    return summary
+
+
+def run_jobs(jobs: List[Tuple[str, Optional[str]]], output_dir: str, output_format: str = 'csv',
+             n_jobs: Optional[int] = None) -> pd.DataFrame:
+    """Process all (session, csv) jobs and return the per-job summary (also written to output_dir)."""
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [
+        {'session': session, 'csv': csv_path, 'name': name, 'output_dir': output_dir, 'format': output_format}
+        for (session, csv_path), name in zip(jobs, _output_names(jobs))
+    ]
+    if n_jobs is None or n_jobs <= 0:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = max(1, min(n_jobs, len(tasks)))
+
+    rows = []
+    if n_jobs == 1:
+        for task in tasks:
+            rows.append(process_job(task))
+            _print_job(rows[-1], len(rows), len(tasks))
+    else:
+        # spawn: a fresh interpreter per worker, no forked Qt state
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=n_jobs, mp_context=context, initializer=_init_worker) as pool:
+            for row in pool.map(process_job, tasks):
+                rows.append(row)
+                _print_job(row, len(rows), len(tasks))
+
+    summary = pd.DataFrame(rows)
+    summary.to_csv(os.path.join(output_dir, SUMMARY_FILE), index=False)
+    return summary
+
+
+def _print_job(row: Dict, done: int, total: int) -> None:
+    if row['status'] == 'ok':
+        errors = f" ({row['error_rows']} with errors)" if row['error_rows'] else ""
+        print(f"[BATCH CLI] {done}/{total} {os.path.basename(row['session'])}: {row['rows_out']} rows{errors} "
+              f"in {row['total_s']:.1f} s (load {row['load_s']:.1f}, calc {row['calc_s']:.1f}, "
+              f"write {row['write_s']:.1f})")
+    else:
+        print(f"[BATCH CLI] {done}/{total} {os.path.basename(row['session'])}: FAILED - {row['error']}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the Calculations-DDT pipeline over saved sessions without the GUI.")
+    parser.add_argument('sessions', nargs='*', help="Session JSON files or glob patterns")
+    parser.add_argument('--pair', nargs=2, action='append', default=[], metavar=('SESSION', 'CSV'),
+                        help="Explicit session JSON + CSV pair (repeatable)")
+    parser.add_argument('--output-dir', '-o', default='batch_results', help="Output folder (default batch_results)")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='csv', help="Results file format (default csv)")
+    parser.add_argument('--jobs', '-j', type=int, default=0, help="Worker processes (default 0 = one per CPU core)")
+    args = parser.parse_args(argv)
+
+    jobs = collect_jobs(args.sessions, args.pair)
+    if not jobs:
+        parser.error("no sessions given")
+    if args.format == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            try:
+                import fastparquet  # noqa: F401
+            except ImportError:
+                parser.error("--format parquet requires pyarrow or fastparquet")
+
+    start = time.perf_counter()
+    summary = run_jobs(jobs, args.output_dir, args.format, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    ok = summary['status'] == 'ok'
+    rows = int(summary.loc[ok, 'rows_out'].sum())
+    print(f"[BATCH CLI] {int(ok.sum())}/{len(summary)} jobs succeeded, {rows} rows in {elapsed:.1f} s"
+          + (f" ({rows / elapsed:.0f} rows/s)" if elapsed > 0 else ""))
+    print(f"[BATCH CLI] Summary written to {os.path.join(args.output_dir, SUMMARY_FILE)}")
+    return 0 if ok.all() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
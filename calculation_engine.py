@@ -10,7 +10,12 @@ Assumptions:
 - Default refrigerant: R410A
 """
 
-from typing import Dict, List, Optional, Tuple
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 
 try:
@@ -18,6 +23,11 @@ try:
 except Exception:  # pragma: no cover - CoolProp may not be available in some environments
     CP = None  # type: ignore
 
+from labels_config import COLUMN_NAMES
+from property_backend import (
+    DEFAULT_BACKEND, PROPERTY_BACKENDS, PropertyBackend, get_property_backend, get_state_point_cache
+)
+
 
 # --- Helper Functions for Unit Conversion ---
 def f_to_k(temp_f: float) -> float:
@@ -74,27 +84,31 @@ def _compute_single_coil(
             "error": "CoolProp not available",
         }
 
+    # Saturation states come from the shared saturation cache
+    props = get_property_backend(refrigerant)
+    t_sat, h_sat_vap, s_sat_vap, _ = props.props_pq(suction_pressure_pa, 1.0)
+    t3, h3, _, _ = props.props_pq(discharge_pressure_pa, 0.0)
+    if t_sat != t_sat or t3 != t3:
+        raise ValueError(f"No saturation state at P={suction_pressure_pa:.0f}/{discharge_pressure_pa:.0f} Pa")
+
     # Point 1: Evaporator outlet
     if outlet_temp_k is None:
-        h1 = CP.PropsSI("H", "P", suction_pressure_pa, "Q", 1, refrigerant)
-        s1 = CP.PropsSI("S", "P", suction_pressure_pa, "Q", 1, refrigerant)
-        t1 = CP.PropsSI("T", "P", suction_pressure_pa, "Q", 1, refrigerant)
+        h1 = h_sat_vap
+        s1 = s_sat_vap
+        t1 = t_sat
     else:
         h1 = CP.PropsSI("H", "P", suction_pressure_pa, "T", outlet_temp_k, refrigerant)
         s1 = CP.PropsSI("S", "P", suction_pressure_pa, "T", outlet_temp_k, refrigerant)
         t1 = outlet_temp_k
 
     # Saturation at suction
-    t_sat = CP.PropsSI("T", "P", suction_pressure_pa, "Q", 1, refrigerant)
     superheat_f = (t1 - t_sat) * 9.0 / 5.0
 
     # Point 2: Compressor outlet (isentropic)
     h2 = CP.PropsSI("H", "P", discharge_pressure_pa, "S", s1, refrigerant)
     t2 = CP.PropsSI("T", "P", discharge_pressure_pa, "S", s1, refrigerant)
 
-    # Point 3: Condenser outlet (saturated liquid)
-    h3 = CP.PropsSI("H", "P", discharge_pressure_pa, "Q", 0, refrigerant)
-    t3 = CP.PropsSI("T", "P", discharge_pressure_pa, "Q", 0, refrigerant)
+    # Point 3: Condenser outlet (saturated liquid), t3/h3 from above
 
     # Point 4: TXV outlet (isenthalpic)
     h4 = h3
@@ -184,7 +198,8 @@ def compute_8_point_cycle(
     suction_pressure_pa: float,
     liquid_pressure_pa: float,
     temperatures_k: Dict[str, Optional[float]],
-    refrigerant: str = "R290"
+    refrigerant: str = "R290",
+    backend: Union[str, PropertyBackend, None] = DEFAULT_BACKEND
 ) -> Dict:
     """
     Compute all 8 state points per plan.txt methodology.
@@ -194,6 +209,7 @@ def compute_8_point_cycle(
         liquid_pressure_pa: High-side pressure (Pa absolute)
         temperatures_k: Dict with keys T_2a, T_2b, T_3a, T_3b, T_4a, T_4b (all optional)
         refrigerant: Refrigerant type (default R290)
+        backend: Property backend name or PropertyBackend instance (default: exact HEOS)
     
     Returns:
         Dict with state points, superheat, subcooling, vapor quality, etc.
@@ -216,15 +232,31 @@ def compute_8_point_cycle(
     }
     
     try:
+        props = backend if isinstance(backend, PropertyBackend) else get_property_backend(refrigerant, backend)
+
+        def checked(values, what):
+            if any(v != v for v in values):
+                raise ValueError(f"Property evaluation failed for {what}")
+            return values
+
+        def state_tp(t_k, p_pa):
+            """(h, s, rho) at T and P"""
+            return checked(props.props_pt(p_pa, t_k), f"T={t_k:.2f} K, P={p_pa:.0f} Pa")
+
+        def state_ph(p_pa, h):
+            """(T, s, rho, quality) at P and h"""
+            return checked(props.props_ph(p_pa, h), f"P={p_pa:.0f} Pa, h={h:.0f} J/kg")
+
+        def sat_t(p_pa, quality):
+            return checked((props.t_sat(p_pa, quality),), f"T_sat at P={p_pa:.0f} Pa")[0]
+
         # --- HIGH-PRESSURE SIDE ---
         
         # State 3a: Compressor Outlet
         T_3a = temperatures_k.get('T_3a')
         if T_3a:
-            h_3a = CP.PropsSI('H', 'P', liquid_pressure_pa, 'T', T_3a, refrigerant)
-            rho_3a = CP.PropsSI('D', 'P', liquid_pressure_pa, 'T', T_3a, refrigerant)
-            s_3a = CP.PropsSI('S', 'P', liquid_pressure_pa, 'T', T_3a, refrigerant)
-            T_sat_3a = CP.PropsSI('T', 'P', liquid_pressure_pa, 'Q', 1, refrigerant)
+            h_3a, s_3a, rho_3a = state_tp(T_3a, liquid_pressure_pa)
+            T_sat_3a = sat_t(liquid_pressure_pa, 1)
             superheat_3a = (T_3a - T_sat_3a) * 9/5  # Convert to °F
             
             result["states"]["3a"] = {
@@ -244,10 +276,8 @@ def compute_8_point_cycle(
         # State 3b: Condenser Inlet
         T_3b = temperatures_k.get('T_3b')
         if T_3b:
-            h_3b = CP.PropsSI('H', 'P', liquid_pressure_pa, 'T', T_3b, refrigerant)
-            rho_3b = CP.PropsSI('D', 'P', liquid_pressure_pa, 'T', T_3b, refrigerant)
-            s_3b = CP.PropsSI('S', 'P', liquid_pressure_pa, 'T', T_3b, refrigerant)
-            T_sat_3b = CP.PropsSI('T', 'P', liquid_pressure_pa, 'Q', 1, refrigerant)
+            h_3b, s_3b, rho_3b = state_tp(T_3b, liquid_pressure_pa)
+            T_sat_3b = sat_t(liquid_pressure_pa, 1)
             superheat_3b = (T_3b - T_sat_3b) * 9/5
             
             result["states"]["3b"] = {
@@ -267,10 +297,8 @@ def compute_8_point_cycle(
         # State 4a: Condenser Outlet
         T_4a = temperatures_k.get('T_4a')
         if T_4a:
-            h_4a = CP.PropsSI('H', 'P', liquid_pressure_pa, 'T', T_4a, refrigerant)
-            rho_4a = CP.PropsSI('D', 'P', liquid_pressure_pa, 'T', T_4a, refrigerant)
-            s_4a = CP.PropsSI('S', 'P', liquid_pressure_pa, 'T', T_4a, refrigerant)
-            T_sat_4a = CP.PropsSI('T', 'P', liquid_pressure_pa, 'Q', 0, refrigerant)
+            h_4a, s_4a, rho_4a = state_tp(T_4a, liquid_pressure_pa)
+            T_sat_4a = sat_t(liquid_pressure_pa, 0)
             subcooling_4a = (T_sat_4a - T_4a) * 9/5  # Convert to °F
             
             result["states"]["4a"] = {
@@ -291,10 +319,8 @@ def compute_8_point_cycle(
         T_4b = temperatures_k.get('T_4b')
         h_4b = None
         if T_4b:
-            h_4b = CP.PropsSI('H', 'P', liquid_pressure_pa, 'T', T_4b, refrigerant)
-            rho_4b = CP.PropsSI('D', 'P', liquid_pressure_pa, 'T', T_4b, refrigerant)
-            s_4b = CP.PropsSI('S', 'P', liquid_pressure_pa, 'T', T_4b, refrigerant)
-            T_sat_4b = CP.PropsSI('T', 'P', liquid_pressure_pa, 'Q', 0, refrigerant)
+            h_4b, s_4b, rho_4b = state_tp(T_4b, liquid_pressure_pa)
+            T_sat_4b = sat_t(liquid_pressure_pa, 0)
             subcooling_4b = (T_sat_4b - T_4b) * 9/5
             
             result["states"]["4b"] = {
@@ -316,11 +342,8 @@ def compute_8_point_cycle(
         # State 1: Evaporator Inlet (isenthalpic expansion from 4b)
         if h_4b:
             h_1 = h_4b  # Isenthalpic expansion
-            T_1 = CP.PropsSI('T', 'P', suction_pressure_pa, 'H', h_1, refrigerant)
-            rho_1 = CP.PropsSI('D', 'P', suction_pressure_pa, 'H', h_1, refrigerant)
-            s_1 = CP.PropsSI('S', 'P', suction_pressure_pa, 'H', h_1, refrigerant)
-            quality_1 = CP.PropsSI('Q', 'P', suction_pressure_pa, 'H', h_1, refrigerant)
-            T_sat_1 = CP.PropsSI('T', 'P', suction_pressure_pa, 'Q', 1, refrigerant)
+            T_1, s_1, rho_1, quality_1 = state_ph(suction_pressure_pa, h_1)
+            T_sat_1 = sat_t(suction_pressure_pa, 1)
             
             result["states"]["1"] = {
                 "label": "Evaporator Inlet (After TXV)",
@@ -342,10 +365,8 @@ def compute_8_point_cycle(
         h_2a = None
         s_2a = None
         if T_2a:
-            h_2a = CP.PropsSI('H', 'P', suction_pressure_pa, 'T', T_2a, refrigerant)
-            rho_2a = CP.PropsSI('D', 'P', suction_pressure_pa, 'T', T_2a, refrigerant)
-            s_2a = CP.PropsSI('S', 'P', suction_pressure_pa, 'T', T_2a, refrigerant)
-            T_sat_2a = CP.PropsSI('T', 'P', suction_pressure_pa, 'Q', 1, refrigerant)
+            h_2a, s_2a, rho_2a = state_tp(T_2a, suction_pressure_pa)
+            T_sat_2a = sat_t(suction_pressure_pa, 1)
             superheat_2a = (T_2a - T_sat_2a) * 9/5
             
             result["states"]["2a"] = {
@@ -368,10 +389,8 @@ def compute_8_point_cycle(
         s_2b = None
         rho_2b = None
         if T_2b:
-            h_2b = CP.PropsSI('H', 'P', suction_pressure_pa, 'T', T_2b, refrigerant)
-            rho_2b = CP.PropsSI('D', 'P', suction_pressure_pa, 'T', T_2b, refrigerant)
-            s_2b = CP.PropsSI('S', 'P', suction_pressure_pa, 'T', T_2b, refrigerant)
-            T_sat_2b = CP.PropsSI('T', 'P', suction_pressure_pa, 'Q', 1, refrigerant)
+            h_2b, s_2b, rho_2b = state_tp(T_2b, suction_pressure_pa)
+            T_sat_2b = sat_t(suction_pressure_pa, 1)
             superheat_2b = (T_2b - T_sat_2b) * 9/5
             
             result["states"]["2b"] = {
@@ -396,15 +415,15 @@ def compute_8_point_cycle(
             
             # Isentropic compression from 2b to 3a (if we have s_2b)
             if s_2b:
-                h_3a_isentropic = CP.PropsSI('H', 'P', liquid_pressure_pa, 'S', s_2b, refrigerant)
+                h_3a_isentropic = checked(props.props_ps(liquid_pressure_pa, s_2b), "isentropic compression")[1]
                 compressor_work = (h_3a_isentropic - h_2b) / 1000  # kJ/kg
             else:
                 compressor_work = None
             
             # Heat rejection (3a to 4a) - if we have both
             if T_3a and T_4a:
-                h_3a_actual = CP.PropsSI('H', 'P', liquid_pressure_pa, 'T', T_3a, refrigerant)
-                h_4a_actual = CP.PropsSI('H', 'P', liquid_pressure_pa, 'T', T_4a, refrigerant)
+                h_3a_actual = state_tp(T_3a, liquid_pressure_pa)[0]
+                h_4a_actual = state_tp(T_4a, liquid_pressure_pa)[0]
                 heat_rejected = (h_3a_actual - h_4a_actual) / 1000  # kJ/kg
             else:
                 heat_rejected = None
@@ -554,6 +573,274 @@ def calculate_system_performance(
     return result
 
 
+# States of compute_8_point_cycle_series: (measured temperature, side, margin to saturation)
+_SERIES_STATES = (
+    ('3a', 'liquid_side', 'superheat'),
+    ('3b', 'liquid_side', 'superheat'),
+    ('4a', 'liquid_side', 'subcooling'),
+    ('4b', 'liquid_side', 'subcooling'),
+    ('2a', 'suction_side', 'superheat'),
+    ('2b', 'suction_side', 'superheat'),
+)
+
+
+def compute_8_point_cycle_series(
+    suction_pressure_pa,
+    liquid_pressure_pa,
+    temperatures_k: Dict[str, object],
+    refrigerant: str = "R290",
+    backend: Union[str, PropertyBackend, None] = DEFAULT_BACKEND
+) -> pd.DataFrame:
+    """
+    compute_8_point_cycle over arrays: one output row per input element.
+
+    temperatures_k maps T_2a, T_2b, T_3a, T_3b, T_4a, T_4b to arrays (a
+    missing key, NaN or 0 means not measured, as in the scalar version).
+    Columns per state X: T_X_K, h_X_kJkg, s_X_kJkgK, rho_X_kgm3, T_sat_X_K
+    and superheat_X_F or subcooling_X_F; state 1 (after the TXV) adds
+    quality_1. Cycle columns: refrigeration_effect_kJkg,
+    compressor_work_kJkg, heat_rejected_kJkg, cop and
+    density_compressor_inlet_kgm3.
+
+    Where the scalar version would omit a value or report an error (missing
+    input, failed property call) the element is NaN; other rows are unaffected.
+    """
+    props = backend if isinstance(backend, PropertyBackend) else get_property_backend(refrigerant, backend)
+    p_suc, p_liq = np.broadcast_arrays(np.atleast_1d(np.asarray(suction_pressure_pa, dtype='float64')),
+                                       np.atleast_1d(np.asarray(liquid_pressure_pa, dtype='float64')))
+    n = p_suc.size
+    pressures = {'suction_side': p_suc, 'liquid_side': p_liq}
+
+    def measured(key):
+        values = temperatures_k.get(key)
+        if values is None:
+            return np.full(n, np.nan)
+        values = np.array(np.broadcast_to(np.asarray(values, dtype='float64'), (n,)))
+        values[values == 0] = np.nan
+        return values
+
+    # Dew point (quality 1) for superheat, bubble point (quality 0) for subcooling
+    t_sat = {(side, margin): props.t_sat(p, 1.0 if margin == 'superheat' else 0.0)
+             for side, p in pressures.items() for margin in ('superheat', 'subcooling')}
+
+    columns: Dict[str, np.ndarray] = {'P_suction_Pa': p_suc, 'P_liquid_Pa': p_liq}
+    h: Dict[str, np.ndarray] = {}
+    s_2b = rho_2b = None
+    with np.errstate(invalid='ignore'):
+        for name, side, margin in _SERIES_STATES:
+            t = measured(f'T_{name}')
+            sat = t_sat[(side, margin)]
+            h[name], s_x, rho_x = props.props_pt(pressures[side], t)
+            columns[f'T_{name}_K'] = t
+            columns[f'h_{name}_kJkg'] = h[name] / 1000
+            columns[f's_{name}_kJkgK'] = s_x / 1000
+            columns[f'rho_{name}_kgm3'] = rho_x
+            columns[f'T_sat_{name}_K'] = np.where(np.isnan(t), np.nan, sat)
+            columns[f'{margin}_{name}_F'] = ((t - sat) if margin == 'superheat' else (sat - t)) * 9 / 5
+            if name == '2b':
+                s_2b, rho_2b = s_x, rho_x
+
+        # State 1: Evaporator inlet (isenthalpic expansion from 4b)
+        t_1, s_1, rho_1, quality_1 = props.props_ph(p_suc, h['4b'])
+        columns.update({
+            'T_1_K': t_1, 'h_1_kJkg': h['4b'] / 1000, 's_1_kJkgK': s_1 / 1000, 'rho_1_kgm3': rho_1,
+            'T_sat_1_K': np.where(np.isnan(h['4b']), np.nan, t_sat[('suction_side', 'superheat')]),
+            'quality_1': quality_1,
+        })
+
+        # Performance: 2b -> isentropic 3a, 4b -> 2b, 3a -> 4a; like the scalar
+        # version, none of it without both the 2b and 4b states
+        h_3a_isentropic = props.props_ps(p_liq, s_2b)[1]
+        refrigeration_effect = (h['2b'] - h['4b']) / 1000
+        no_cycle = np.isnan(refrigeration_effect)
+        compressor_work = np.where(no_cycle, np.nan, (h_3a_isentropic - h['2b']) / 1000)
+        columns['refrigeration_effect_kJkg'] = refrigeration_effect
+        columns['compressor_work_kJkg'] = compressor_work
+        columns['heat_rejected_kJkg'] = np.where(no_cycle, np.nan, (h['3a'] - h['4a']) / 1000)
+        columns['cop'] = np.where(compressor_work > 0, refrigeration_effect / compressor_work, np.nan)
+        columns['density_compressor_inlet_kgm3'] = rho_2b
+
+    return pd.DataFrame(columns)
+
+
+def calculate_system_performance_series(cycle: pd.DataFrame, mass_flow_kgs) -> pd.DataFrame:
+    """
+    calculate_system_performance for every row of compute_8_point_cycle_series.
+
+    mass_flow_kgs is a scalar or one value per row. Metrics whose inputs are
+    missing are NaN.
+    """
+    m_dot = np.asarray(mass_flow_kgs, dtype='float64')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cooling_w = m_dot * (cycle['h_2b_kJkg'] - cycle['h_4b_kJkg']).to_numpy() * 1000
+        power_w = m_dot * cycle['compressor_work_kJkg'].to_numpy() * 1000
+        rejection_w = m_dot * (cycle['h_3a_kJkg'] - cycle['h_4a_kJkg']).to_numpy() * 1000
+        cooling_btu_hr = cooling_w * 3.41214
+        return pd.DataFrame({
+            'cooling_capacity_w': cooling_w,
+            'cooling_capacity_btu_hr': cooling_btu_hr,
+            'cooling_capacity_tons': cooling_btu_hr / 12000,
+            'compressor_power_w': power_w,
+            'compressor_power_hp': power_w / 745.7,
+            'heat_rejection_w': rejection_w,
+            'heat_rejection_btu_hr': rejection_w * 3.41214,
+            'cop': cycle['cop'].to_numpy(),
+            'eer': np.where(power_w != 0, cooling_btu_hr / power_w, np.nan),
+        }, index=cycle.index)
+
+
+def _as_series_array(values, n: int) -> np.ndarray:
+    """values (scalar, list or array) as a float array of length n."""
+    return np.array(np.broadcast_to(np.asarray(values, dtype='float64'), (n,)))
+
+
+def _coil_pressure_states(props: PropertyBackend, p_suc: np.ndarray, p_dis: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    States of the single-coil cycle that depend on the pressures only: the
+    suction dew point, point 3 (saturated liquid at discharge) and point 4
+    (isenthalpic expansion of point 3). Shared by all coils of compute_cycle_series.
+    """
+    t_sat, h_vap, s_vap, rho_vap = props.props_pq(p_suc, 1.0)
+    t_3, h_3, s_3, rho_3 = props.props_pq(p_dis, 0.0)
+    t_4, s_4, rho_4, quality_4 = props.props_ph(p_suc, h_3)
+    return {
+        'T_sat': t_sat, 'h_vap': h_vap, 's_vap': s_vap, 'rho_vap': rho_vap,
+        'T_3': t_3, 'h_3': h_3, 's_3': s_3, 'rho_3': rho_3,
+        'T_4': t_4, 's_4': s_4, 'rho_4': rho_4, 'quality_4': quality_4,
+    }
+
+
+def _single_coil_frame(props: PropertyBackend, p_suc: np.ndarray, p_dis: np.ndarray,
+                       outlet_temp_k: np.ndarray, sat: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Body of compute_single_coil_series, given the pressure-only states."""
+    measured = ~np.isnan(outlet_temp_k)
+    with np.errstate(invalid='ignore'):
+        # Point 1: Evaporator outlet (saturated vapor where no temperature is given)
+        h_1, s_1, rho_1 = (np.array(v) for v in (sat['h_vap'], sat['s_vap'], sat['rho_vap']))
+        t_1 = np.where(measured, outlet_temp_k, sat['T_sat'])
+        if measured.any():
+            h_pt, s_pt, rho_pt = props.props_pt(p_suc[measured], outlet_temp_k[measured])
+            h_1[measured], s_1[measured], rho_1[measured] = h_pt, s_pt, rho_pt
+        # A failed point 1 lookup fails the row, as the scalar version raises
+        t_1 = np.where(np.isnan(h_1), np.nan, t_1)
+
+        # Point 2: Compressor outlet (isentropic)
+        t_2, h_2 = props.props_ps(p_dis, s_1)
+        rho_2 = props.props_ph(p_dis, h_2)[2]
+
+        refrigeration_effect = (h_1 - sat['h_3']) / 1000
+        compressor_work = (h_2 - h_1) / 1000
+        cop = np.where(compressor_work > 0, refrigeration_effect / compressor_work, 0.0)
+        cop[np.isnan(compressor_work)] = np.nan
+
+        frame = pd.DataFrame({
+            'P_suction_Pa': p_suc, 'P_discharge_Pa': p_dis,
+            'T_outlet_K': outlet_temp_k, 'T_sat_K': sat['T_sat'],
+            'superheat_F': (t_1 - sat['T_sat']) * 9 / 5,
+            'T_1_K': t_1, 'h_1_kJkg': h_1 / 1000, 's_1_kJkgK': s_1 / 1000, 'rho_1_kgm3': rho_1,
+            'T_2_K': t_2, 'h_2_kJkg': h_2 / 1000, 's_2_kJkgK': s_1 / 1000, 'rho_2_kgm3': rho_2,
+            'T_3_K': sat['T_3'], 'h_3_kJkg': sat['h_3'] / 1000, 's_3_kJkgK': sat['s_3'] / 1000,
+            'rho_3_kgm3': sat['rho_3'],
+            'T_4_K': sat['T_4'], 'h_4_kJkg': sat['h_3'] / 1000, 's_4_kJkgK': sat['s_4'] / 1000,
+            'rho_4_kgm3': sat['rho_4'], 'quality_4': sat['quality_4'],
+            'refrigeration_effect_kJkg': refrigeration_effect,
+            'compressor_work_kJkg': compressor_work,
+            'heat_rejected_kJkg': (h_2 - sat['h_3']) / 1000,
+            'cop': cop,
+        })
+    # No saturation state at either pressure: the scalar version rejects the row
+    rejected = np.isnan(sat['T_sat']) | np.isnan(sat['T_3'])
+    frame.loc[rejected, frame.columns[3:]] = np.nan
+    return frame
+
+
+def compute_single_coil_series(
+    suction_pressure_pa,
+    discharge_pressure_pa,
+    outlet_temp_k=None,
+    refrigerant: str = "R410A",
+    backend: Union[str, PropertyBackend, None] = DEFAULT_BACKEND
+) -> pd.DataFrame:
+    """
+    _compute_single_coil over arrays: one output row per input element.
+
+    Pressures and outlet_temp_k are arrays or scalars (broadcast to a common
+    length). A NaN or missing outlet temperature means saturated vapor at
+    the evaporator outlet, as None does in the scalar version.
+    Columns: P_suction_Pa, P_discharge_Pa, T_outlet_K, T_sat_K, superheat_F;
+    T_X_K, h_X_kJkg, s_X_kJkgK, rho_X_kgm3 for points 1-4 plus quality_4;
+    refrigeration_effect_kJkg, compressor_work_kJkg, heat_rejected_kJkg and
+    cop. Point 3 is saturated liquid, so there is no subcooling column.
+
+    Rows the scalar version would reject (no saturation state, failed
+    property call) are NaN; other rows are unaffected.
+    """
+    props = backend if isinstance(backend, PropertyBackend) else get_property_backend(refrigerant, backend)
+    p_suc, p_dis = np.broadcast_arrays(np.atleast_1d(np.asarray(suction_pressure_pa, dtype='float64')),
+                                       np.atleast_1d(np.asarray(discharge_pressure_pa, dtype='float64')))
+    p_suc, p_dis = np.array(p_suc), np.array(p_dis)
+    t_out = _as_series_array(np.nan if outlet_temp_k is None else outlet_temp_k, p_suc.size)
+    return _single_coil_frame(props, p_suc, p_dis, t_out, _coil_pressure_states(props, p_suc, p_dis))
+
+
+def _aggregate_series(values: np.ndarray, method: str) -> np.ndarray:
+    """aggregate_values per row of an (n, k) array, ignoring NaN; all-NaN rows give NaN."""
+    if values.shape[1] == 0:
+        return np.full(values.shape[0], np.nan)
+    valid = ~np.isnan(values)
+    m = (method or "").strip().lower()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if m in ("avg", "mean", "average", ""):
+            return np.nansum(values, axis=1) / np.where(valid.any(axis=1), valid.sum(axis=1), np.nan)
+        if m in ("max", "maximum"):
+            return np.where(valid.any(axis=1), np.nanmax(np.where(valid, values, -np.inf), axis=1), np.nan)
+        if m in ("min", "minimum"):
+            return np.where(valid.any(axis=1), np.nanmin(np.where(valid, values, np.inf), axis=1), np.nan)
+    # default: last non-NaN value
+    last = values.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)
+    return np.where(valid.any(axis=1), values[np.arange(values.shape[0]), last], np.nan)
+
+
+def compute_cycle_series(
+    suction_pressure_pa,
+    discharge_pressure_pa,
+    coil_outlet_temps_k: Dict[str, object],
+    aggregation_method: str = "Average",
+    refrigerant: str = "R410A",
+    backend: Union[str, PropertyBackend, None] = DEFAULT_BACKEND
+) -> pd.DataFrame:
+    """
+    compute_cycle over arrays for the Left/Center/Right coils.
+
+    coil_outlet_temps_k: { "left": [array, ...], "center": ..., "right": ... }
+    with one array per outlet sensor (or an (n, sensors) array). Each row's
+    sensors are combined with aggregation_method, ignoring NaN.
+
+    Returns a frame with (coil, column) columns: result["left"] is the
+    compute_single_coil_series frame of that coil. The pressure-only states
+    (saturation, points 3 and 4) are evaluated once for all coils.
+    """
+    props = backend if isinstance(backend, PropertyBackend) else get_property_backend(refrigerant, backend)
+    p_suc, p_dis = np.broadcast_arrays(np.atleast_1d(np.asarray(suction_pressure_pa, dtype='float64')),
+                                       np.atleast_1d(np.asarray(discharge_pressure_pa, dtype='float64')))
+    p_suc, p_dis = np.array(p_suc), np.array(p_dis)
+    n = p_suc.size
+    sat = _coil_pressure_states(props, p_suc, p_dis)
+
+    coils = {}
+    for coil_name in ("left", "center", "right"):
+        raw = coil_outlet_temps_k.get(coil_name)
+        if raw is None or (not isinstance(raw, np.ndarray) and len(raw) == 0):
+            raw_values = np.empty((n, 0))
+        elif isinstance(raw, np.ndarray) and raw.ndim == 2:
+            raw_values = raw.astype('float64')
+        else:
+            raw_values = np.column_stack([_as_series_array(v, n) for v in raw])
+        effective = _aggregate_series(raw_values, aggregation_method)
+        coils[coil_name] = _single_coil_frame(props, p_suc, p_dis, effective, sat)
+    return pd.concat(coils, axis=1)
+
+
 # =========================================================================
 # NEW UNIFIED CALCULATION ENGINE (from goal.md)
 # Implements the two-step calculation process from Calculations-DDT.txt
@@ -687,12 +974,85 @@ def calculate_volumetric_efficiency(rated_inputs: Dict, refrigerant: str = 'R290
         }
 
 
+# Rated inputs calculate_volumetric_efficiency reads; the eta_vol memo is keyed on these
+ETA_VOL_INPUT_KEYS = ('m_dot_rated_lbhr', 'hz_rated', 'disp_ft3', 'rated_evap_temp_f', 'rated_return_gas_temp_f')
+# Property source of Step 1 (exact PropsSI whatever the batch backend); part of persisted records
+ETA_VOL_BACKEND = 'HEOS'
+_ETA_VOL_MEMO_SIZE = 32
+_eta_vol_memo: 'OrderedDict[Tuple, Dict]' = OrderedDict()
+
+
+def _eta_vol_key(rated_inputs: Dict, refrigerant: str) -> Tuple:
+    return (refrigerant, ETA_VOL_BACKEND) + tuple(rated_inputs.get(k) for k in ETA_VOL_INPUT_KEYS)
+
+
+def _remember_eta_vol(key: Tuple, result: Dict) -> None:
+    _eta_vol_memo[key] = result
+    _eta_vol_memo.move_to_end(key)
+    while len(_eta_vol_memo) > _ETA_VOL_MEMO_SIZE:
+        _eta_vol_memo.popitem(last=False)
+
+
+def cached_volumetric_efficiency(rated_inputs: Dict, refrigerant: str = 'R290') -> Dict:
+    """
+    calculate_volumetric_efficiency memoized on (refrigerant, rated inputs).
+
+    Settings stored alongside the rated inputs (property backend, workers)
+    are not part of the key. Returns a copy the caller may modify.
+    """
+    key = _eta_vol_key(rated_inputs, refrigerant)
+    result = _eta_vol_memo.get(key)
+    if result is None:
+        result = calculate_volumetric_efficiency(rated_inputs, refrigerant)
+        if 'error' in result:
+            return result
+        _remember_eta_vol(key, result)
+    else:
+        _eta_vol_memo.move_to_end(key)
+    return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+
+
+def eta_vol_record(rated_inputs: Dict, refrigerant: str = 'R290') -> Optional[Dict]:
+    """
+    The memoized Step 1 result for these inputs as a JSON-ready record
+    (saved with the session), or None if it has not been calculated.
+    """
+    result = _eta_vol_memo.get(_eta_vol_key(rated_inputs, refrigerant))
+    if result is None:
+        return None
+    return {
+        'refrigerant': refrigerant,
+        'backend': ETA_VOL_BACKEND,
+        'inputs': {k: rated_inputs.get(k) for k in ETA_VOL_INPUT_KEYS},
+        'result': {k: list(v) if isinstance(v, list) else v for k, v in result.items()},
+    }
+
+
+def restore_eta_vol_record(record: Optional[Dict]) -> bool:
+    """
+    Seeds the eta_vol memo from an eta_vol_record (e.g. from a saved session),
+    so the next cached_volumetric_efficiency call for the same inputs skips
+    Step 1. Records from another property source or malformed ones are ignored.
+    """
+    try:
+        if not record or record.get('backend') != ETA_VOL_BACKEND:
+            return False
+        result = dict(record['result'])
+        if not isinstance(result.get('eta_vol'), (int, float)) or 'method' not in result:
+            return False
+        _remember_eta_vol(_eta_vol_key(record['inputs'], record['refrigerant']), result)
+        return True
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return False
+
+
 def calculate_row_performance(
     row: pd.Series,
     sensor_map: Dict[str, str],
     eta_vol: float,
     comp_specs: Dict,
-    refrigerant: str = 'R290'
+    refrigerant: str = 'R290',
+    backend: Union[str, PropertyBackend, None] = DEFAULT_BACKEND
 ) -> pd.Series:
     """
     Performs the "Step 2" calculation from Calculations-DDT.txt
@@ -707,6 +1067,9 @@ def calculate_row_performance(
         eta_vol: Volumetric efficiency from Step 1
         comp_specs: Dict with 'displacement_m3' key
         refrigerant: Refrigerant name (default 'R290')
+        backend: Property backend name (see property_backend.PROPERTY_BACKENDS,
+                 e.g. 'TABLES' for the engine's interpolation tables) or a
+                 PropertyBackend instance (default: exact HEOS)
 
     Returns:
         pandas Series with all 54 calculated values PLUS P-h diagram columns
@@ -717,6 +1080,15 @@ def calculate_row_performance(
     results = {}
 
     try:
+        props = backend if isinstance(backend, PropertyBackend) else get_property_backend(refrigerant, backend)
+
+        def state_tp(t_k, p_pa):
+            """(h, s, rho) at T and P; raises if the point cannot be evaluated."""
+            h, s, d = props.props_pt(p_pa, t_k)
+            if h != h or s != s or d != d:
+                raise ValueError(f"Property evaluation failed at T={t_k:.2f} K, P={p_pa:.0f} Pa")
+            return h, s, d
+
         # Helper function to safely get values from the row
         # CRITICAL: Must validate that column exists to prevent ghost/duplicate values
         def get_val(key):
@@ -791,8 +1163,10 @@ def calculate_row_performance(
         p_disch_pa = psig_to_pa(p_disch_psig)
 
         # Get saturation temperatures
-        t_sat_suc_k = CP.PropsSI('T', 'P', p_suc_pa, 'Q', 0, refrigerant)
-        t_sat_disch_k = CP.PropsSI('T', 'P', p_disch_pa, 'Q', 0, refrigerant)
+        t_sat_suc_k = props.t_sat(p_suc_pa, 0.0)
+        t_sat_disch_k = props.t_sat(p_disch_pa, 0.0)
+        if t_sat_suc_k != t_sat_suc_k or t_sat_disch_k != t_sat_disch_k:
+            raise ValueError("Saturation temperature could not be evaluated for the row pressures")
 
         # Store intermediate enthalpy values for P-h diagram
         h_2a_lh, h_2a_ctr, h_2a_rh = None, None, None
@@ -810,9 +1184,7 @@ def calculate_row_performance(
             results['T_2a-LH'] = t_2a_lh_f
             # Calculate properties at evap outlet (columns 4-8)
             t_2a_lh_k = f_to_k(t_2a_lh_f)
-            h_2a_lh = CP.PropsSI('H', 'T', t_2a_lh_k, 'P', p_suc_pa, refrigerant)
-            s_2a_lh = CP.PropsSI('S', 'T', t_2a_lh_k, 'P', p_suc_pa, refrigerant)
-            d_2a_lh = CP.PropsSI('D', 'T', t_2a_lh_k, 'P', p_suc_pa, refrigerant)
+            h_2a_lh, s_2a_lh, d_2a_lh = state_tp(t_2a_lh_k, p_suc_pa)
             sh_lh = t_2a_lh_k - t_sat_suc_k
 
             results['T_sat.lh'] = (t_sat_suc_k - 273.15) * 9/5 + 32
@@ -829,9 +1201,7 @@ def calculate_row_performance(
         if t_2a_ctr_f is not None:
             results['T_2a-ctr'] = t_2a_ctr_f
             t_2a_ctr_k = f_to_k(t_2a_ctr_f)
-            h_2a_ctr = CP.PropsSI('H', 'T', t_2a_ctr_k, 'P', p_suc_pa, refrigerant)
-            s_2a_ctr = CP.PropsSI('S', 'T', t_2a_ctr_k, 'P', p_suc_pa, refrigerant)
-            d_2a_ctr = CP.PropsSI('D', 'T', t_2a_ctr_k, 'P', p_suc_pa, refrigerant)
+            h_2a_ctr, s_2a_ctr, d_2a_ctr = state_tp(t_2a_ctr_k, p_suc_pa)
             sh_ctr = t_2a_ctr_k - t_sat_suc_k
 
             results['T_sat.ctr'] = (t_sat_suc_k - 273.15) * 9/5 + 32
@@ -848,9 +1218,7 @@ def calculate_row_performance(
         if t_2a_rh_f is not None:
             results['T_2a-RH'] = t_2a_rh_f
             t_2a_rh_k = f_to_k(t_2a_rh_f)
-            h_2a_rh = CP.PropsSI('H', 'T', t_2a_rh_k, 'P', p_suc_pa, refrigerant)
-            s_2a_rh = CP.PropsSI('S', 'T', t_2a_rh_k, 'P', p_suc_pa, refrigerant)
-            d_2a_rh = CP.PropsSI('D', 'T', t_2a_rh_k, 'P', p_suc_pa, refrigerant)
+            h_2a_rh, s_2a_rh, d_2a_rh = state_tp(t_2a_rh_k, p_suc_pa)
             sh_rh = t_2a_rh_k - t_sat_suc_k
 
             results['T_sat.rh'] = (t_sat_suc_k - 273.15) * 9/5 + 32
@@ -865,9 +1233,7 @@ def calculate_row_performance(
         if t_2b_f is not None:
             results['T_2b'] = t_2b_f
             t_2b_k = f_to_k(t_2b_f)
-            h_2b = CP.PropsSI('H', 'T', t_2b_k, 'P', p_suc_pa, refrigerant)
-            s_2b = CP.PropsSI('S', 'T', t_2b_k, 'P', p_suc_pa, refrigerant)
-            rho_2b = CP.PropsSI('D', 'T', t_2b_k, 'P', p_suc_pa, refrigerant)
+            h_2b, s_2b, rho_2b = state_tp(t_2b_k, p_suc_pa)
             sh_total = t_2b_k - t_sat_suc_k
 
             results['T_sat.comp.in'] = (t_sat_suc_k - 273.15) * 9/5 + 32
@@ -882,7 +1248,7 @@ def calculate_row_performance(
             results['T_3a'] = t_3a_f
             # Calculate enthalpy for P-h diagram (MISSING IN OLD CODE)
             t_3a_k = f_to_k(t_3a_f)
-            h_3a = CP.PropsSI('H', 'T', t_3a_k, 'P', p_disch_pa, refrigerant)
+            h_3a = state_tp(t_3a_k, p_disch_pa)[0]
         results['rpm'] = rpm
 
         # ===== 8. AT CONDENSER (Columns 34-40) =====
@@ -891,7 +1257,7 @@ def calculate_row_performance(
             results['T_3b'] = t_3b_f
             # Calculate enthalpy for P-h diagram (MISSING IN OLD CODE)
             t_3b_k = f_to_k(t_3b_f)
-            h_3b = CP.PropsSI('H', 'T', t_3b_k, 'P', p_disch_pa, refrigerant)
+            h_3b = state_tp(t_3b_k, p_disch_pa)[0]
 
         results['P_disch'] = p_disch_psig
 
@@ -899,7 +1265,7 @@ def calculate_row_performance(
             results['T_4a'] = t_4a_f
             t_4a_k = f_to_k(t_4a_f)
             # Calculate enthalpy for P-h diagram (MISSING IN OLD CODE)
-            h_4a = CP.PropsSI('H', 'T', t_4a_k, 'P', p_disch_pa, refrigerant)
+            h_4a = state_tp(t_4a_k, p_disch_pa)[0]
             subcool_cond = t_sat_disch_k - t_4a_k
             results['T_sat.cond'] = (t_sat_disch_k - 273.15) * 9/5 + 32
             results['S.C'] = subcool_cond * 9/5
@@ -915,7 +1281,7 @@ def calculate_row_performance(
         if t_4b_lh_f is not None:
             results['T_4b-lh'] = t_4b_lh_f
             t_4b_lh_k = f_to_k(t_4b_lh_f)
-            h_4b_lh = CP.PropsSI('H', 'T', t_4b_lh_k, 'P', p_disch_pa, refrigerant)
+            h_4b_lh = state_tp(t_4b_lh_k, p_disch_pa)[0]
             subcool_lh = t_sat_disch_k - t_4b_lh_k
 
             results['T_sat.txv.lh'] = (t_sat_disch_k - 273.15) * 9/5 + 32
@@ -926,7 +1292,7 @@ def calculate_row_performance(
         if t_4b_ctr_f is not None:
             results['T_4b-ctr'] = t_4b_ctr_f
             t_4b_ctr_k = f_to_k(t_4b_ctr_f)
-            h_4b_ctr = CP.PropsSI('H', 'T', t_4b_ctr_k, 'P', p_disch_pa, refrigerant)
+            h_4b_ctr = state_tp(t_4b_ctr_k, p_disch_pa)[0]
             subcool_ctr = t_sat_disch_k - t_4b_ctr_k
 
             results['T_sat.txv.ctr'] = (t_sat_disch_k - 273.15) * 9/5 + 32
@@ -938,7 +1304,7 @@ def calculate_row_performance(
         if t_4b_rh_f is not None:
             results['T_4b-rh'] = t_4b_rh_f  # Using correct name not typo
             t_4b_rh_k = f_to_k(t_4b_rh_f)
-            h_4b_rh = CP.PropsSI('H', 'T', t_4b_rh_k, 'P', p_disch_pa, refrigerant)
+            h_4b_rh = state_tp(t_4b_rh_k, p_disch_pa)[0]
             subcool_rh = t_sat_disch_k - t_4b_rh_k
 
             results['T_sat.txv.rh'] = (t_sat_disch_k - 273.15) * 9/5 + 32
@@ -1009,6 +1375,671 @@ def calculate_row_performance(
         return pd.Series({'error': str(e)})
 
 
+# Columns the batch output keeps even when every value is NaN
+_ALWAYS_PRESENT_COLUMNS = ('P_suction', 'rpm', 'P_disch', 'P_suc', 'P_cond')
+
+# P-h diagram columns appended after the Calculations tab columns
+# (enthalpies in kJ/kg, pressures in Pa absolute)
+PH_COLUMN_NAMES = [
+    'h_2b', 'h_3a', 'h_3b', 'h_4a',
+    'h_2a_LH', 'h_2a_CTR', 'h_2a_RH',
+    'h_4b_LH', 'h_4b_CTR', 'h_4b_RH',
+    'P_suc', 'P_cond',
+]
+
+# Output schema of the batch engine, in output column order
+BATCH_OUTPUT_COLUMNS = list(dict.fromkeys(COLUMN_NAMES + PH_COLUMN_NAMES))
+
+# Bump whenever a change alters batch results; stored results of older
+# versions (results_cache.py) are then recalculated instead of reloaded
+ENGINE_VERSION = 1
+
+
+class _ColumnarResults:
+    """
+    Preallocated float64 output columns (NaN = not computed) for n rows.
+
+    Columns are filled in place and the DataFrame is built once at the end.
+    Keys outside the schema are allocated on first use and appended, so
+    editing labels_config never drops an engine output.
+    """
+
+    def __init__(self, n: int, columns: Iterable[str] = BATCH_OUTPUT_COLUMNS):
+        self.n = n
+        self.arrays: Dict[str, np.ndarray] = {key: np.full(n, np.nan) for key in columns}
+        self.filled = set()
+
+    def put(self, key: str, values, mask: Optional[np.ndarray] = None) -> None:
+        target = self.arrays.get(key)
+        if target is None:
+            target = self.arrays[key] = np.full(self.n, np.nan)
+        if mask is None:
+            np.copyto(target, values)
+        else:
+            np.copyto(target, values, where=mask)
+        self.filled.add(key)
+
+    def to_frame(self, index, ok: np.ndarray, keep_empty_columns: bool = False) -> pd.DataFrame:
+        """
+        Blank the rows that are not ok and build the frame.
+
+        Only columns the engine filled are returned, and unless
+        keep_empty_columns only those with data in some row (or listed in
+        _ALWAYS_PRESENT_COLUMNS).
+        """
+        columns = {}
+        for key, values in self.arrays.items():
+            if key not in self.filled:
+                continue
+            values[~ok] = np.nan
+            if keep_empty_columns or (ok.any() and (key in _ALWAYS_PRESENT_COLUMNS or not np.isnan(values).all())):
+                columns[key] = values
+        return pd.DataFrame(columns, index=index, copy=False)
+
+
+def _props_pt_unique(props: PropertyBackend, pressure_pa: np.ndarray, temp_k: np.ndarray,
+                     use_cache: bool = True) -> Tuple[Tuple[np.ndarray, ...], int]:
+    """
+    props.props_pt for every row, evaluated once per distinct (P, T) pair.
+
+    Logged sensors are quantized and a cycling unit keeps returning to the
+    same steady states, so a column usually holds far fewer distinct pairs
+    than rows. With use_cache, pairs already evaluated by an earlier run come
+    from the shared StatePointCache. Returns ((h, s, rho) per row, number of
+    distinct pairs).
+    """
+    outputs = tuple(np.full(len(pressure_pa), np.nan) for _ in range(3))
+    has = ~np.isnan(pressure_pa) & ~np.isnan(temp_k)
+    if not has.any():
+        return outputs, 0
+    pairs, inverse = np.unique(np.column_stack((pressure_pa[has], temp_k[has])), axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    if use_cache:
+        values = get_state_point_cache().lookup(props.cache_key, pairs, int(has.sum()), props.props_pt).T
+    else:
+        values = props.props_pt(pairs[:, 0], pairs[:, 1])
+    for target, column in zip(outputs, values):
+        target[has] = column[inverse]
+    return outputs, len(pairs)
+
+
+def _k_to_f(temp_k):
+    return (temp_k - 273.15) * 9/5 + 32
+
+
+class _BatchNode(NamedTuple):
+    """One batch quantity: the nodes it needs and how to compute it from them."""
+    inputs: Tuple[str, ...]
+    compute: Callable
+    output: bool
+
+
+def _build_batch_nodes() -> Dict[str, _BatchNode]:
+    """
+    Dependency graph of the batch engine, output columns in output order.
+
+    Node names:
+    - 'sensor:<role>'  mapped sensor column (REQUIRED_SENSOR_ROLES keys), raw units
+    - 'const:<name>'   eta_vol / displacement_m3, available when > 0
+    - 'state:<role>'   (T_K, h, s, rho, has_input) of a temperature sensor at
+                       its side's pressure - the only nodes that cost property calls
+    - lower-case names are intermediates, everything else an output column
+    An input prefixed with '?' is optional (NaN when unavailable); a node is
+    available only if all its other inputs are.
+    compute(graph, *input_values) returns the node's value.
+    """
+    nodes: Dict[str, _BatchNode] = {}
+
+    def node(name, inputs, compute, output=True):
+        nodes[name] = _BatchNode(tuple(inputs), compute, output)
+
+    def sensor(role):
+        node(role, [f'sensor:{role}'], lambda g, values: values)
+
+    def state(role, pressure):
+        node(f'state:{role}', [f'sensor:{role}', pressure], lambda g, t, p: g.state_at(t, p), output=False)
+
+    def saturation(name, t_sat, state_name):
+        """T_sat reported only on rows where the state point has its input."""
+        node(name, [t_sat, state_name], lambda g, t, st: np.where(st[4], _k_to_f(t), np.nan))
+
+    # Pressures and saturation temperatures
+    node('p_suc_pa', ['sensor:P_suc'], lambda g, p: np.where(g.valid, psig_to_pa(p), np.nan), output=False)
+    node('p_disch_pa', ['sensor:P_disch'], lambda g, p: np.where(g.valid, psig_to_pa(p), np.nan), output=False)
+    node('t_sat_suc_k', ['p_suc_pa'], lambda g, p: g.t_sat(p), output=False)
+    node('t_sat_disch_k', ['p_disch_pa'], lambda g, p: g.t_sat(p), output=False)
+
+    # ===== 3-5. EVAPORATOR COILS (Columns 1-24) =====
+    for coil, inlet, coil_in, outlet in (('lh', 'T_1a-lh', 'T_1b-lh', 'T_2a-LH'),
+                                         ('ctr', 'T_1a-ctr', 'T_1b-ctr', 'T_2a-ctr'),
+                                         ('rh', 'T_1a-rh', 'T_1c-rh', 'T_2a-RH')):
+        sensor(inlet)
+        sensor(coil_in)
+        sensor(outlet)
+        state(outlet, 'p_suc_pa')
+        st = f'state:{outlet}'
+        saturation(f'T_sat.{coil}', 't_sat_suc_k', st)
+        node(f'S.H_{coil} coil', [st, 't_sat_suc_k'], lambda g, st, t: (st[0] - t) * 9/5)
+        node(f'D_coil {coil}', [st], lambda g, st: st[3])
+        node(f'H_coil {coil}', [st], lambda g, st: st[1] / 1000)
+        node(f'S_coil {coil}', [st], lambda g, st: st[2] / 1000)
+
+    # ===== 6. AT COMPRESSOR INLET (Columns 25-31) =====
+    node('P_suction', ['sensor:P_suc'], lambda g, p: p)
+    sensor('T_2b')
+    state('T_2b', 'p_suc_pa')
+    saturation('T_sat.comp.in', 't_sat_suc_k', 'state:T_2b')
+    node('S.H_total', ['state:T_2b', 't_sat_suc_k'], lambda g, st, t: (st[0] - t) * 9/5)
+    node('D_comp.in', ['state:T_2b'], lambda g, st: st[3])
+    node('H_comp.in', ['state:T_2b'], lambda g, st: st[1] / 1000)
+    node('S_comp.in', ['state:T_2b'], lambda g, st: st[2] / 1000)
+
+    # ===== 7. COMP OUTLET (Columns 32-33) =====
+    sensor('T_3a')
+    state('T_3a', 'p_disch_pa')
+    node('rpm', ['sensor:RPM'], lambda g, rpm: rpm)
+
+    # ===== 8. AT CONDENSER (Columns 34-40) =====
+    sensor('T_3b')
+    state('T_3b', 'p_disch_pa')
+    node('P_disch', ['sensor:P_disch'], lambda g, p: p)
+    sensor('T_4a')
+    state('T_4a', 'p_disch_pa')
+    saturation('T_sat.cond', 't_sat_disch_k', 'state:T_4a')
+    node('S.C', ['state:T_4a', 't_sat_disch_k'], lambda g, st, t: (t - st[0]) * 9/5)
+    # Prefer Excel water names per row; fall back to legacy keys
+    node('T_waterin', ['?sensor:T_waterin', '?sensor:Cond.water.in'],
+         lambda g, excel, legacy: np.where(~np.isnan(excel), excel, legacy))
+    node('T_waterout', ['?sensor:T_waterout', '?sensor:Cond.water.out'],
+         lambda g, excel, legacy: np.where(~np.isnan(excel), excel, legacy))
+
+    # ===== 9-11. AT TXVs (Columns 41-52) =====
+    for txv, role in (('lh', 'T_4b-lh'), ('ctr', 'T_4b-ctr'), ('rh', 'T_4b-rh')):
+        sensor(role)
+        state(role, 'p_disch_pa')
+        st = f'state:{role}'
+        saturation(f'T_sat.txv.{txv}', 't_sat_disch_k', st)
+        node(f'S.C-txv.{txv}', [st, 't_sat_disch_k'], lambda g, st, t: (t - st[0]) * 9/5)
+        node(f'H_txv.{txv}', [st], lambda g, st: st[1] / 1000)
+        node(f'h_4b.{txv}', [st], lambda g, st: st[1], output=False)
+
+    # ===== 12. TOTAL (Columns 53-54) =====
+    def h_4b_average(g, *h_4b):
+        stack = np.vstack(h_4b)
+        count = (~np.isnan(stack)).sum(axis=0)
+        with np.errstate(invalid='ignore'):
+            return np.nansum(stack, axis=0) / np.where(count > 0, count, np.nan)
+
+    def runs(g, rpm, st_2b, h_4b_avg):
+        rho_2b = st_2b[3]
+        with np.errstate(invalid='ignore'):
+            return (rpm > 0) & ~np.isnan(rho_2b) & (rho_2b != 0) & ~np.isnan(h_4b_avg) & ~np.isnan(st_2b[1])
+
+    node('h_4b_avg', ['?h_4b.lh', '?h_4b.ctr', '?h_4b.rh'], h_4b_average, output=False)
+    node('mass_flow_kgs', ['const:eta_vol', 'const:displacement_m3', 'sensor:RPM', 'state:T_2b'],
+         lambda g, eta_vol, disp_m3, rpm, st: st[3] * eta_vol * disp_m3 * (rpm / 60), output=False)
+    node('runs', ['sensor:RPM', 'state:T_2b', 'h_4b_avg'], runs, output=False)
+    node('m_dot', ['mass_flow_kgs', 'runs'],
+         lambda g, m, ok: np.where(ok, m * 2.20462 * 3600, np.nan))  # to lb/hr
+    node('qc', ['mass_flow_kgs', 'state:T_2b', 'h_4b_avg', 'runs'],
+         lambda g, m, st, h_4b_avg, ok: np.where(ok, m * (st[1] - h_4b_avg) * 3.41214, np.nan))  # to BTU/hr
+
+    # ===== 13. P-H DIAGRAM SPECIFIC COLUMNS (kJ/kg, Pa) =====
+    for column, state_name in (('h_2b', 'state:T_2b'), ('h_3a', 'state:T_3a'),
+                               ('h_3b', 'state:T_3b'), ('h_4a', 'state:T_4a'),
+                               ('h_2a_LH', 'state:T_2a-LH'), ('h_2a_CTR', 'state:T_2a-ctr'),
+                               ('h_2a_RH', 'state:T_2a-RH'), ('h_4b_LH', 'state:T_4b-lh'),
+                               ('h_4b_CTR', 'state:T_4b-ctr'), ('h_4b_RH', 'state:T_4b-rh')):
+        node(column, [state_name], lambda g, st: st[1] / 1000)
+    node('P_suc', ['p_suc_pa'], lambda g, p: p)
+    node('P_cond', ['p_disch_pa'], lambda g, p: p)
+    return nodes
+
+
+_BATCH_NODES = _build_batch_nodes()
+
+# Every column the batch engine can produce, in output order
+ENGINE_OUTPUT_COLUMNS = [name for name, node in _BATCH_NODES.items() if node.output]
+_ENGINE_OUTPUTS = set(ENGINE_OUTPUT_COLUMNS)
+
+
+def required_sensor_roles(columns: Optional[Iterable[str]] = None) -> List[str]:
+    """Sensor roles the requested output columns (default: all) depend on."""
+    roles: List[str] = []
+    seen = set()
+    stack = list(ENGINE_OUTPUT_COLUMNS if columns is None else columns)
+    while stack:
+        name = stack.pop().lstrip('?')
+        if name in seen:
+            continue
+        seen.add(name)
+        if name.startswith('sensor:'):
+            roles.append(name[len('sensor:'):])
+        elif name in _BATCH_NODES:
+            stack.extend(_BATCH_NODES[name].inputs)
+    # Row validity always needs both pressures
+    return sorted(set(roles) | {'P_suc', 'P_disch'})
+
+
+class _BatchGraph:
+    """
+    Evaluates _BATCH_NODES on demand for one DataFrame, each node at most
+    once, so only the property calls the requested columns need are made.
+    """
+
+    def __init__(self, dataframe: pd.DataFrame, sensor_map: Dict[str, str],
+                 constants: Dict[str, float], props: PropertyBackend):
+        self.dataframe = dataframe
+        self.sensor_map = sensor_map
+        self.constants = constants
+        self.props = props
+        self.n = len(dataframe)
+        self.missing = np.full(self.n, np.nan)
+        self._values: Dict[str, object] = {}
+        self._available: Dict[str, bool] = {}
+
+        # Rows where CoolProp rejects a state point (the row-wise version raised)
+        self.failed = np.zeros(self.n, dtype=bool)
+        # (distinct (P, T) pairs evaluated, state points requested)
+        self.evaluations = [0, 0]
+
+        # Rows without both pressures only get an error message
+        self.valid = np.zeros(self.n, dtype=bool)
+        if self.available('sensor:P_suc') and self.available('sensor:P_disch'):
+            self.valid = ~np.isnan(self.value('sensor:P_suc')) & ~np.isnan(self.value('sensor:P_disch'))
+
+    def available(self, name: str) -> bool:
+        if name in self._available:
+            return self._available[name]
+        if name.startswith('sensor:'):
+            role = name[len('sensor:'):]
+            col_name = self.sensor_map.get(role)
+            result = col_name is not None and col_name in self.dataframe.columns
+            if col_name is not None and not result:
+                print(f"WARNING: Column '{col_name}' for role '{role}' not found in DataFrame")
+        elif name.startswith('const:'):
+            result = (self.constants.get(name[len('const:'):]) or 0) > 0
+        else:
+            node = _BATCH_NODES[name]
+            result = all(self.available(i) for i in node.inputs if not i.startswith('?'))
+        self._available[name] = result
+        return result
+
+    def value(self, name: str):
+        if name in self._values:
+            return self._values[name]
+        if name.startswith('sensor:'):
+            col_name = self.sensor_map[name[len('sensor:'):]]
+            result = pd.to_numeric(self.dataframe[col_name], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        elif name.startswith('const:'):
+            result = float(self.constants[name[len('const:'):]])
+        else:
+            node = _BATCH_NODES[name]
+            args = []
+            for i in node.inputs:
+                i = i.lstrip('?')
+                args.append(self.value(i) if self.available(i) else self.missing)
+            result = node.compute(self, *args)
+        self._values[name] = result
+        return result
+
+    def check(self, inputs_ok: np.ndarray, *outputs):
+        for values in outputs:
+            self.failed |= inputs_ok & np.isnan(values)
+        return outputs
+
+    def t_sat(self, pressure_pa: np.ndarray) -> np.ndarray:
+        return self.check(self.valid, self.props.t_sat(pressure_pa, 0.0))[0]
+
+    def state_at(self, temp_f: np.ndarray, pressure_pa: np.ndarray):
+        """(T_k, h, s, rho, has_input) for a temperature column at a pressure column."""
+        has = self.valid & ~np.isnan(temp_f)
+        temp_k = np.where(has, f_to_k(temp_f), np.nan)
+        values, evaluated = _props_pt_unique(self.props, pressure_pa, temp_k)
+        self.evaluations[0] += evaluated
+        self.evaluations[1] += int(has.sum())
+        h, s, d = self.check(has, *values)
+        return temp_k, h, s, d, has
+
+
+def calculate_batch_performance(
+    dataframe: pd.DataFrame,
+    sensor_map: Dict[str, str],
+    eta_vol: float,
+    comp_specs: Dict,
+    refrigerant: str = 'R290',
+    backend: Union[str, PropertyBackend, None] = DEFAULT_BACKEND,
+    keep_empty_columns: bool = False,
+    columns: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
+    """
+    Column-wise equivalent of dataframe.apply(calculate_row_performance, axis=1).
+
+    Each output column is a node of a dependency graph (_BATCH_NODES) over
+    sensor roles, intermediate properties and constants. Only the nodes the
+    requested columns need are evaluated, and a node whose sensor role is
+    unmapped is pruned together with everything that depends on it.
+
+    Every state point is evaluated for the whole column at once through a
+    PropertyBackend (one AbstractState update per point instead of separate
+    PropsSI calls for H, S and D), only once per distinct (P, T) pair, and
+    the saturation temperatures are computed once per row instead of once
+    per coil. Outputs are written into preallocated columns
+    (BATCH_OUTPUT_COLUMNS: labels_config.COLUMN_NAMES plus the P-h columns)
+    and the DataFrame is built once. results_df.attrs['property_evaluations']
+    holds (distinct pairs evaluated, state points requested).
+
+    Produces the same columns and values as the row-wise function:
+    - a column appears only if at least one row has its inputs
+    - rows without suction/discharge pressure, or whose properties CoolProp
+      cannot evaluate, carry only an 'error' message
+
+    Args:
+        dataframe: Raw CSV data (or filtered data)
+        sensor_map: Dict mapping internal role keys to CSV column names
+        eta_vol: Volumetric efficiency from Step 1
+        comp_specs: Dict with 'displacement_m3' key
+        refrigerant: Refrigerant name (default 'R290')
+        backend: CoolProp backend name ('HEOS', 'BICUBIC&HEOS', 'TTSE&HEOS')
+                 or a PropertyBackend instance (default: exact HEOS)
+        keep_empty_columns: Return every column even if no row has data
+                 (used to reassemble chunks of a parallel run)
+        columns: Output columns to compute (default: ENGINE_OUTPUT_COLUMNS).
+                 Rows only fail on the state points these columns need.
+
+    Returns:
+        DataFrame indexed like dataframe with all calculated columns
+    """
+    index = dataframe.index
+    n = len(dataframe)
+    if CP is None:
+        return pd.DataFrame({'error': ['CoolProp not available'] * n}, index=index)
+
+    if isinstance(backend, PropertyBackend):
+        props = backend
+    else:
+        props = get_property_backend(refrigerant, backend)
+
+    # Output columns to produce; unmapped sensors prune whole subtrees
+    if columns is None:
+        requested = ENGINE_OUTPUT_COLUMNS
+    else:
+        requested = [c for c in dict.fromkeys(columns) if c in _ENGINE_OUTPUTS]
+        unknown = [c for c in columns if c not in _ENGINE_OUTPUTS]
+        if unknown:
+            print(f"[CALC ENGINE] Ignoring unknown output columns: {unknown}")
+
+    constants = {'eta_vol': eta_vol, 'displacement_m3': comp_specs.get('displacement_m3', 0)}
+    graph = _BatchGraph(dataframe, sensor_map, constants, props)
+    valid = graph.valid
+
+    results = _ColumnarResults(n)
+    for key in requested:
+        if graph.available(key):
+            results.put(key, graph.value(key))
+        elif key in _ALWAYS_PRESENT_COLUMNS:
+            results.put(key, graph.missing)
+    failed = graph.failed
+    evaluations = graph.evaluations
+
+    # Blank out error rows and keep only columns some row produced
+    ok = valid & ~failed
+    results_df = results.to_frame(index, ok, keep_empty_columns)
+    results_df.attrs['property_evaluations'] = tuple(evaluations)
+
+    if not ok.all():
+        errors = np.full(n, np.nan, dtype=object)
+        errors[~valid] = 'Missing pressure sensors - Please map suction and discharge pressure sensors in the Diagram tab'
+        errors[valid & failed] = 'CoolProp could not evaluate one or more state points for this row'
+        results_df['error'] = errors
+        if failed.any():
+            print(f"[CALC ENGINE] {int((valid & failed).sum())} rows failed property evaluation")
+
+    return results_df
+
+
+# Parallel batch mode: frames with fewer rows than this per worker are run
+# serially. The column-wise engine does roughly 75k rows/s per core, and
+# starting a worker (pandas + CoolProp imports, state warm-up) costs seconds.
+PARALLEL_MIN_ROWS_PER_WORKER = 50000
+PARALLEL_MAX_WORKERS = 16
+
+# Warm worker pool kept between runs: (key, executor)
+_pool: Optional[Tuple[Tuple, ProcessPoolExecutor]] = None
+
+
+def resolve_worker_count(workers: Optional[int], n_rows: int) -> int:
+    """
+    Number of worker processes for a batch of n_rows.
+
+    workers <= 0 or None means one per CPU core (capped at
+    PARALLEL_MAX_WORKERS). The count is reduced so every worker gets at least
+    PARALLEL_MIN_ROWS_PER_WORKER rows; 1 means run serially.
+    """
+    if workers is None or workers <= 0:
+        workers = min(os.cpu_count() or 1, PARALLEL_MAX_WORKERS)
+    return max(1, min(int(workers), n_rows // PARALLEL_MIN_ROWS_PER_WORKER))
+
+
+def _warm_up_worker(refrigerant: str, backend: str) -> None:
+    """Process pool initializer: build this worker's CoolProp state (and tables) once."""
+    props = get_property_backend(refrigerant, backend)
+    props.t_sat(101325.0, 0.0)
+
+
+def _get_worker_pool(n_workers: int, refrigerant: str, backend: str) -> ProcessPoolExecutor:
+    """Process pool for (workers, refrigerant, backend), reused across batch runs."""
+    global _pool
+    key = (n_workers, refrigerant, backend)
+    if _pool is not None and _pool[0] == key:
+        return _pool[1]
+    shutdown_worker_pool()
+    # spawn: forking a process that runs Qt threads is unsafe
+    context = multiprocessing.get_context('spawn')
+    executor = ProcessPoolExecutor(max_workers=n_workers, mp_context=context,
+                                   initializer=_warm_up_worker, initargs=(refrigerant, backend))
+    _pool = (key, executor)
+    return executor
+
+
+def shutdown_worker_pool() -> None:
+    """Stop the parallel batch worker processes, if any."""
+    global _pool
+    if _pool is not None:
+        _pool[1].shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+def _batch_chunk(args) -> pd.DataFrame:
+    chunk, sensor_map, eta_vol, comp_specs, refrigerant, backend, columns = args
+    return calculate_batch_performance(chunk, sensor_map, eta_vol, comp_specs, refrigerant, backend,
+                                       keep_empty_columns=True, columns=columns)
+
+
+def combine_batch_chunks(parts: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate chunk results (computed with keep_empty_columns=True) in
+    row order and apply calculate_batch_performance's column rule over the
+    whole frame, so the result equals a single serial run.
+    """
+    if not parts:
+        return pd.DataFrame()
+    results_df = pd.concat(parts)
+    ok = results_df['error'].isna() if 'error' in results_df.columns else pd.Series(True, index=results_df.index)
+    keep = [c for c in results_df.columns
+            if c != 'error' and ok.any() and (c in _ALWAYS_PRESENT_COLUMNS or results_df[c].notna().any())]
+    if 'error' in results_df.columns:
+        keep.append('error')
+    results_df = results_df[keep]
+    results_df.attrs['property_evaluations'] = tuple(
+        int(sum(part.attrs.get('property_evaluations', (0, 0))[k] for part in parts)) for k in range(2)
+    )
+    return results_df
+
+
+# Rows per chunk when streaming results (progress granularity)
+DEFAULT_CHUNK_ROWS = 5000
+
+
+def iter_batch_performance(
+    dataframe: pd.DataFrame,
+    sensor_map: Dict[str, str],
+    eta_vol: float,
+    comp_specs: Dict,
+    refrigerant: str = 'R290',
+    backend: Union[str, PropertyBackend, None] = DEFAULT_BACKEND,
+    columns: Optional[Iterable[str]] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    workers: Optional[int] = 1
+) -> Iterator[Tuple[int, int, pd.DataFrame]]:
+    """
+    calculate_batch_performance over consecutive row chunks, yielding
+    (start_row, stop_row, chunk_results) in row order as each completes.
+
+    Chunks keep all columns; combine_batch_chunks() turns the collected
+    chunks into the serial result. With more than one worker (see
+    resolve_worker_count) the chunks are evaluated in the warm process pool.
+    Closing the generator early cancels the chunks not yet started.
+    """
+    n = len(dataframe)
+    columns = None if columns is None else list(columns)
+    chunk_rows = max(int(chunk_rows), 1)
+    bounds = [(lo, min(lo + chunk_rows, n)) for lo in range(0, n, chunk_rows)]
+
+    n_workers = resolve_worker_count(workers, n)
+    if n_workers <= 1 or isinstance(backend, PropertyBackend) or CP is None:
+        for lo, hi in bounds:
+            yield lo, hi, calculate_batch_performance(dataframe.iloc[lo:hi], sensor_map, eta_vol, comp_specs,
+                                                      refrigerant, backend, keep_empty_columns=True,
+                                                      columns=columns)
+        return
+
+    # Only ship the sensor columns the requested outputs need to the workers
+    roles = required_sensor_roles(columns)
+    used = [c for c in dict.fromkeys(sensor_map[r] for r in roles if r in sensor_map) if c in dataframe.columns]
+    tasks = [
+        (dataframe.iloc[lo:hi][used], sensor_map, eta_vol, comp_specs, refrigerant, backend, columns)
+        for lo, hi in bounds
+    ]
+    print(f"[CALC ENGINE] Parallel batch: {n} rows in {n_workers} worker processes")
+    results = _get_worker_pool(n_workers, refrigerant, backend).map(_batch_chunk, tasks)
+    for (lo, hi), part in zip(bounds, results):
+        yield lo, hi, part
+
+
+def calculate_batch_performance_parallel(
+    dataframe: pd.DataFrame,
+    sensor_map: Dict[str, str],
+    eta_vol: float,
+    comp_specs: Dict,
+    refrigerant: str = 'R290',
+    backend: str = DEFAULT_BACKEND,
+    workers: Optional[int] = None,
+    columns: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
+    """
+    calculate_batch_performance split into row chunks over a process pool.
+
+    Each worker warms up its own CoolProp state once (the pool is kept for
+    later runs with the same settings), chunks are evaluated independently
+    and reassembled in the original row order, so the result equals the
+    serial function's. Frames too small to benefit (see
+    resolve_worker_count) run serially in this process.
+
+    Args:
+        workers: Worker processes; None or <= 0 = one per CPU core
+        columns: Output columns to compute (default: all)
+        (other args as calculate_batch_performance; backend must be a name)
+    """
+    n_workers = resolve_worker_count(workers, len(dataframe))
+    if n_workers <= 1 or isinstance(backend, PropertyBackend) or CP is None:
+        return calculate_batch_performance(dataframe, sensor_map, eta_vol, comp_specs, refrigerant, backend,
+                                           columns=columns)
+
+    chunk_rows = -(-len(dataframe) // n_workers)
+    try:
+        parts = [part for _, _, part in iter_batch_performance(
+            dataframe, sensor_map, eta_vol, comp_specs, refrigerant, backend,
+            columns=columns, chunk_rows=chunk_rows, workers=n_workers)]
+    except Exception as e:
+        # Broken pool (worker crashed or could not start): drop it, run serially
+        print(f"[CALC ENGINE] Parallel batch failed ({e}), running serially")
+        shutdown_worker_pool()
+        return calculate_batch_performance(dataframe, sensor_map, eta_vol, comp_specs, refrigerant, backend,
+                                           columns=columns)
+    return combine_batch_chunks(parts)
+
+
+def compare_property_backends(
+    dataframe: pd.DataFrame,
+    sensor_map: Dict[str, str],
+    eta_vol: float,
+    comp_specs: Dict,
+    refrigerant: str = 'R290',
+    backends: Iterable[str] = PROPERTY_BACKENDS,
+    reference: str = DEFAULT_BACKEND,
+    sample_size: int = 200
+) -> pd.DataFrame:
+    """
+    Accuracy report: run a sample of rows through each backend and compare
+    every output column against the reference backend.
+
+    Rows are sampled evenly across the frame. For each non-reference backend
+    the report has the max absolute deviation, the max relative deviation (%)
+    and the number of rows whose output presence differs from the reference
+    (a value on one side, NaN/error on the other).
+
+    Returns:
+        DataFrame indexed by output column; report.attrs['seconds'] holds
+        the evaluation time of the sample per backend and
+        report.attrs['rows'] the sample size.
+    """
+    import time
+
+    if len(dataframe) > sample_size > 0:
+        positions = np.unique(np.linspace(0, len(dataframe) - 1, sample_size).round().astype(int))
+        sample = dataframe.iloc[positions]
+    else:
+        sample = dataframe
+
+    outputs = {}
+    seconds = {}
+    for name in [reference] + [b for b in backends if b != reference]:
+        props = get_property_backend(refrigerant, name)
+        start = time.perf_counter()
+        outputs[name] = calculate_batch_performance(sample, sensor_map, eta_vol, comp_specs, refrigerant, props)
+        seconds[name] = time.perf_counter() - start
+
+    ref_df = outputs[reference]
+    ref_cols = [c for c in ref_df.columns if c != 'error']
+    report = pd.DataFrame(index=pd.Index(ref_cols, name='column'))
+    for name, df in outputs.items():
+        if name == reference:
+            continue
+        max_abs, max_rel, mismatched = [], [], []
+        for col in ref_cols:
+            a = ref_df[col].to_numpy(dtype='float64', na_value=np.nan)
+            b = df[col].to_numpy(dtype='float64', na_value=np.nan) if col in df.columns else np.full(len(a), np.nan)
+            both = ~np.isnan(a) & ~np.isnan(b)
+            mismatched.append(int((np.isnan(a) != np.isnan(b)).sum()))
+            if both.any():
+                diff = np.abs(a[both] - b[both])
+                max_abs.append(float(diff.max()))
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    rel = np.where(a[both] != 0, diff / np.abs(a[both]), 0.0)
+                max_rel.append(float(rel.max()) * 100)
+            else:
+                max_abs.append(np.nan)
+                max_rel.append(np.nan)
+        report[f'{name} max abs'] = max_abs
+        report[f'{name} max rel %'] = max_rel
+        report[f'{name} mismatched rows'] = mismatched
+
+    report.attrs['seconds'] = seconds
+    report.attrs['rows'] = len(sample)
+    return report
+
+
 def calculate_performance_from_compressor(
     dataframe: pd.DataFrame,
     mappings: Dict[str, str],
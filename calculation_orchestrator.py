@@ -5,92 +5,85 @@ Orchestrates the complete 8-point cycle calculation using port_resolver and calc
 This module bridges the diagram model with the calculation engine.
 """
 
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List
 import pandas as pd
-from port_resolver import resolve_mapped_sensor, get_sensor_value
+from port_resolver import PortSnapshot, resolve_mapped_sensor
+from property_backend import get_saturation_cache, get_state_point_cache, resolve_backend_name
 from calculation_engine import (
     compute_8_point_cycle,
+    compute_8_point_cycle_series,
     calculate_mass_flow_rate,
     calculate_system_performance,
-    calculate_volumetric_efficiency,
-    calculate_row_performance,
+    calculate_system_performance_series,
+    cached_volumetric_efficiency,
+    calculate_batch_performance_parallel,
+    combine_batch_chunks,
+    iter_batch_performance,
+    resolve_worker_count,
+    shutdown_worker_pool,
+    DEFAULT_CHUNK_ROWS,
+    compare_property_backends,
     f_to_k,
     psig_to_pa,
     ft3_to_m3
 )
 
 
-def gather_temperatures_from_ports(data_manager) -> Dict[str, Optional[float]]:
+def gather_temperatures_from_ports(data_manager, snapshot: Optional[PortSnapshot] = None) -> Dict[str, Optional[float]]:
     """
     Gather all required temperature measurements from mapped ports.
     
     Returns dict with keys: T_2a, T_2b, T_3a, T_3b, T_4a, T_4b (in Kelvin)
     Each value can be None if sensor not mapped or no data available.
     """
-    model = data_manager.diagram_model
-    components = model.get('components', {})
+    snapshot = snapshot or PortSnapshot(data_manager)
     
     temps = {}
     
     # Find Compressor for T_2b (inlet) and T_3a (outlet)
-    for comp_id, comp in components.items():
-        if comp.get('type') == 'Compressor':
-            # T_2b: Compressor Inlet
-            sensor = resolve_mapped_sensor(model, 'Compressor', comp_id, 'inlet')
-            val = get_sensor_value(data_manager, sensor)
-            if val is not None:
-                temps['T_2b'] = f_to_k(val)  # Convert °F to K
-            
-            # T_3a: Compressor Outlet
-            sensor = resolve_mapped_sensor(model, 'Compressor', comp_id, 'outlet')
-            val = get_sensor_value(data_manager, sensor)
-            if val is not None:
-                temps['T_3a'] = f_to_k(val)
-            
-            break  # Assume single compressor
+    for comp_id, _ in snapshot.components('Compressor')[:1]:  # Assume single compressor
+        # T_2b: Compressor Inlet
+        val = snapshot.value(comp_id, 'inlet')
+        if val is not None:
+            temps['T_2b'] = f_to_k(val)  # Convert °F to K
+        
+        # T_3a: Compressor Outlet
+        val = snapshot.value(comp_id, 'outlet')
+        if val is not None:
+            temps['T_3a'] = f_to_k(val)
     
     # Find Condenser for T_3b (inlet) and T_4a (outlet)
-    for comp_id, comp in components.items():
-        if comp.get('type') == 'Condenser':
-            # T_3b: Condenser Inlet (optional)
-            sensor = resolve_mapped_sensor(model, 'Condenser', comp_id, 'inlet')
-            val = get_sensor_value(data_manager, sensor)
-            if val is not None:
-                temps['T_3b'] = f_to_k(val)
-            
-            # T_4a: Condenser Outlet
-            sensor = resolve_mapped_sensor(model, 'Condenser', comp_id, 'outlet')
-            val = get_sensor_value(data_manager, sensor)
-            if val is not None:
-                temps['T_4a'] = f_to_k(val)
-            
-            break  # Assume single condenser
+    for comp_id, _ in snapshot.components('Condenser')[:1]:  # Assume single condenser
+        # T_3b: Condenser Inlet (optional)
+        val = snapshot.value(comp_id, 'inlet')
+        if val is not None:
+            temps['T_3b'] = f_to_k(val)
+        
+        # T_4a: Condenser Outlet
+        val = snapshot.value(comp_id, 'outlet')
+        if val is not None:
+            temps['T_4a'] = f_to_k(val)
     
     # Find TXVs for T_4b (inlet) - average all TXVs
     txv_temps = []
-    for comp_id, comp in components.items():
-        if comp.get('type') == 'TXV':
-            sensor = resolve_mapped_sensor(model, 'TXV', comp_id, 'inlet')
-            val = get_sensor_value(data_manager, sensor)
-            if val is not None:
-                txv_temps.append(f_to_k(val))
+    for comp_id, _ in snapshot.components('TXV'):
+        val = snapshot.value(comp_id, 'inlet')
+        if val is not None:
+            txv_temps.append(f_to_k(val))
     
     if txv_temps:
         temps['T_4b'] = sum(txv_temps) / len(txv_temps)  # Average
     
     # Find Evaporators for T_2a (outlet) - average all outlets
     evap_temps = []
-    for comp_id, comp in components.items():
-        if comp.get('type') == 'Evaporator':
-            props = comp.get('properties', {})
-            circuits = props.get('circuits', 1)
-            
-            # Average all outlet circuits for this evaporator
-            for i in range(1, circuits + 1):
-                sensor = resolve_mapped_sensor(model, 'Evaporator', comp_id, f'outlet_circuit_{i}')
-                val = get_sensor_value(data_manager, sensor)
-                if val is not None:
-                    evap_temps.append(f_to_k(val))
+    for comp_id, props in snapshot.components('Evaporator'):
+        circuits = props.get('circuits', 1)
+        
+        # Average all outlet circuits for this evaporator
+        for i in range(1, circuits + 1):
+            val = snapshot.value(comp_id, f'outlet_circuit_{i}')
+            if val is not None:
+                evap_temps.append(f_to_k(val))
     
     if evap_temps:
         temps['T_2a'] = sum(evap_temps) / len(evap_temps)  # Average
@@ -98,67 +91,54 @@ def gather_temperatures_from_ports(data_manager) -> Dict[str, Optional[float]]:
     return temps
 
 
-def gather_pressures_from_ports(data_manager) -> Dict[str, Optional[float]]:
+def gather_pressures_from_ports(data_manager, snapshot: Optional[PortSnapshot] = None) -> Dict[str, Optional[float]]:
     """
     Gather pressure measurements from compressor ports.
     
     Returns dict with keys: suction_pa, liquid_pa (in Pascals absolute)
     """
-    model = data_manager.diagram_model
-    components = model.get('components', {})
+    snapshot = snapshot or PortSnapshot(data_manager)
     
     pressures = {}
     
     # Find Compressor for SP and DP
-    for comp_id, comp in components.items():
-        if comp.get('type') == 'Compressor':
-            # Suction Pressure (SP)
-            sensor = resolve_mapped_sensor(model, 'Compressor', comp_id, 'SP')
-            val = get_sensor_value(data_manager, sensor)
-            if val is not None:
-                pressures['suction_pa'] = psig_to_pa(val)  # Convert PSIG to Pa
-            
-            # Discharge/Liquid Pressure (DP)
-            sensor = resolve_mapped_sensor(model, 'Compressor', comp_id, 'DP')
-            val = get_sensor_value(data_manager, sensor)
-            if val is not None:
-                pressures['liquid_pa'] = psig_to_pa(val)
-            
-            break  # Assume single compressor
+    for comp_id, _ in snapshot.components('Compressor')[:1]:  # Assume single compressor
+        # Suction Pressure (SP)
+        val = snapshot.value(comp_id, 'SP')
+        if val is not None:
+            pressures['suction_pa'] = psig_to_pa(val)  # Convert PSIG to Pa
+        
+        # Discharge/Liquid Pressure (DP)
+        val = snapshot.value(comp_id, 'DP')
+        if val is not None:
+            pressures['liquid_pa'] = psig_to_pa(val)
     
     return pressures
 
 
-def gather_compressor_specs(data_manager) -> Dict[str, Optional[float]]:
+def gather_compressor_specs(data_manager, snapshot: Optional[PortSnapshot] = None) -> Dict[str, Optional[float]]:
     """
     Gather compressor specifications from diagram and ports.
     
     Returns dict with keys: displacement_cm3, speed_rpm, vol_eff
     """
-    model = data_manager.diagram_model
-    components = model.get('components', {})
+    snapshot = snapshot or PortSnapshot(data_manager)
     
     specs = {}
     
     # Find Compressor
-    for comp_id, comp in components.items():
-        if comp.get('type') == 'Compressor':
-            props = comp.get('properties', {})
-            
-            # Get displacement and vol_eff from properties
-            specs['displacement_cm3'] = props.get('displacement_cm3')
-            specs['vol_eff'] = props.get('vol_eff', 0.85)
-            
-            # Get RPM from mapped sensor
-            sensor = resolve_mapped_sensor(model, 'Compressor', comp_id, 'RPM')
-            val = get_sensor_value(data_manager, sensor)
-            if val is not None:
-                specs['speed_rpm'] = val
-            else:
-                # Fallback to property if sensor not mapped
-                specs['speed_rpm'] = props.get('speed_rpm')
-            
-            break  # Assume single compressor
+    for comp_id, props in snapshot.components('Compressor')[:1]:  # Assume single compressor
+        # Get displacement and vol_eff from properties
+        specs['displacement_cm3'] = props.get('displacement_cm3')
+        specs['vol_eff'] = props.get('vol_eff', 0.85)
+        
+        # Get RPM from mapped sensor
+        val = snapshot.value(comp_id, 'RPM')
+        if val is not None:
+            specs['speed_rpm'] = val
+        else:
+            # Fallback to property if sensor not mapped
+            specs['speed_rpm'] = props.get('speed_rpm')
     
     return specs
 
@@ -193,6 +173,9 @@ def calculate_full_system(data_manager) -> Dict:
     
     # Get refrigerant
     refrigerant = data_manager.refrigerant
+
+    # Every port resolved and aggregated once for all gather_* calls below
+    snapshot = PortSnapshot(data_manager)
     
     # Gather ON-time stats
     result["on_time"] = {
@@ -204,7 +187,7 @@ def calculate_full_system(data_manager) -> Dict:
     }
     
     # Gather pressures
-    pressures = gather_pressures_from_ports(data_manager)
+    pressures = gather_pressures_from_ports(data_manager, snapshot)
     suction_pa = pressures.get('suction_pa')
     liquid_pa = pressures.get('liquid_pa')
     
@@ -217,7 +200,7 @@ def calculate_full_system(data_manager) -> Dict:
         return result
     
     # Gather temperatures
-    temps_k = gather_temperatures_from_ports(data_manager)
+    temps_k = gather_temperatures_from_ports(data_manager, snapshot)
     
     # Check for critical temperatures
     if not temps_k.get('T_2b'):
@@ -244,7 +227,7 @@ def calculate_full_system(data_manager) -> Dict:
         result["errors"].extend(state_points["errors"])
     
     # Gather compressor specs
-    comp_specs = gather_compressor_specs(data_manager)
+    comp_specs = gather_compressor_specs(data_manager, snapshot)
     displacement = comp_specs.get('displacement_cm3')
     speed_rpm = comp_specs.get('speed_rpm')
     vol_eff = comp_specs.get('vol_eff', 0.85)
@@ -283,20 +266,20 @@ def calculate_full_system(data_manager) -> Dict:
     return result
 
 
-def calculate_per_circuit(data_manager, circuit_label: str) -> Dict:
+def calculate_per_circuit(data_manager, circuit_label: str, snapshot: Optional[PortSnapshot] = None) -> Dict:
     """
     Calculate 8-point cycle for a specific circuit (Left, Center, or Right).
     
     Args:
         data_manager: DataManager instance
         circuit_label: "Left", "Center", or "Right"
+        snapshot: PortSnapshot to reuse across circuits (built if omitted)
     
     Returns:
         Dict with calculation results for that circuit
     """
     
-    model = data_manager.diagram_model
-    components = model.get('components', {})
+    snapshot = snapshot or PortSnapshot(data_manager)
     refrigerant = data_manager.refrigerant
     
     result = {
@@ -307,7 +290,7 @@ def calculate_per_circuit(data_manager, circuit_label: str) -> Dict:
     }
     
     # Gather pressures (same for all circuits)
-    pressures = gather_pressures_from_ports(data_manager)
+    pressures = gather_pressures_from_ports(data_manager, snapshot)
     suction_pa = pressures.get('suction_pa')
     liquid_pa = pressures.get('liquid_pa')
     
@@ -319,51 +302,38 @@ def calculate_per_circuit(data_manager, circuit_label: str) -> Dict:
     temps_k = {}
     
     # Compressor temps (same for all circuits)
-    for comp_id, comp in components.items():
-        if comp.get('type') == 'Compressor':
-            sensor = resolve_mapped_sensor(model, 'Compressor', comp_id, 'inlet')
-            val = get_sensor_value(data_manager, sensor)
-            if val is not None:
-                temps_k['T_2b'] = f_to_k(val)
-            
-            sensor = resolve_mapped_sensor(model, 'Compressor', comp_id, 'outlet')
-            val = get_sensor_value(data_manager, sensor)
-            if val is not None:
-                temps_k['T_3a'] = f_to_k(val)
-            break
+    for comp_id, _ in snapshot.components('Compressor')[:1]:
+        val = snapshot.value(comp_id, 'inlet')
+        if val is not None:
+            temps_k['T_2b'] = f_to_k(val)
+        
+        val = snapshot.value(comp_id, 'outlet')
+        if val is not None:
+            temps_k['T_3a'] = f_to_k(val)
     
     # Condenser temps (same for all circuits)
-    for comp_id, comp in components.items():
-        if comp.get('type') == 'Condenser':
-            sensor = resolve_mapped_sensor(model, 'Condenser', comp_id, 'outlet')
-            val = get_sensor_value(data_manager, sensor)
-            if val is not None:
-                temps_k['T_4a'] = f_to_k(val)
-            break
+    for comp_id, _ in snapshot.components('Condenser')[:1]:
+        val = snapshot.value(comp_id, 'outlet')
+        if val is not None:
+            temps_k['T_4a'] = f_to_k(val)
     
     # TXV inlet for this circuit
-    for comp_id, comp in components.items():
-        if comp.get('type') == 'TXV':
-            props = comp.get('properties', {})
-            if props.get('circuit_label') == circuit_label:
-                sensor = resolve_mapped_sensor(model, 'TXV', comp_id, 'inlet')
-                val = get_sensor_value(data_manager, sensor)
-                if val is not None:
-                    temps_k['T_4b'] = f_to_k(val)
-                break
+    for comp_id, props in snapshot.components('TXV'):
+        if props.get('circuit_label') == circuit_label:
+            val = snapshot.value(comp_id, 'inlet')
+            if val is not None:
+                temps_k['T_4b'] = f_to_k(val)
+            break
     
     # Evaporator outlet for this circuit (average all outlets)
     evap_temps = []
-    for comp_id, comp in components.items():
-        if comp.get('type') == 'Evaporator':
-            props = comp.get('properties', {})
-            if props.get('circuit_label') == circuit_label:
-                circuits = props.get('circuits', 1)
-                for i in range(1, circuits + 1):
-                    sensor = resolve_mapped_sensor(model, 'Evaporator', comp_id, f'outlet_circuit_{i}')
-                    val = get_sensor_value(data_manager, sensor)
-                    if val is not None:
-                        evap_temps.append(f_to_k(val))
+    for comp_id, props in snapshot.components('Evaporator'):
+        if props.get('circuit_label') == circuit_label:
+            circuits = props.get('circuits', 1)
+            for i in range(1, circuits + 1):
+                val = snapshot.value(comp_id, f'outlet_circuit_{i}')
+                if val is not None:
+                    evap_temps.append(f_to_k(val))
     
     if evap_temps:
         temps_k['T_2a'] = sum(evap_temps) / len(evap_temps)
@@ -386,6 +356,121 @@ def calculate_per_circuit(data_manager, circuit_label: str) -> Dict:
     return result
 
 
+DEFAULT_CYCLE_BUCKET_MINUTES = 5
+
+
+def gather_cycle_port_sensors(data_manager, snapshot: Optional[PortSnapshot] = None) -> Dict[str, List[str]]:
+    """
+    Mapped sensors behind each calculate_full_system input, using the same
+    ports as the gather_* helpers: suction, liquid and rpm plus T_2a..T_4b.
+    T_4b averages all TXV inlets, T_2a all evaporator outlet circuits.
+    """
+    snapshot = snapshot or PortSnapshot(data_manager)
+    ports = {key: [] for key in ('suction', 'liquid', 'rpm', 'T_2a', 'T_2b', 'T_3a', 'T_3b', 'T_4a', 'T_4b')}
+    
+    def add(key, comp_id, port):
+        sensor = snapshot.sensor(comp_id, port)
+        if sensor:
+            ports[key].append(sensor)
+    
+    for comp_id, _ in snapshot.components('Compressor')[:1]:  # Assume single compressor
+        add('suction', comp_id, 'SP')
+        add('liquid', comp_id, 'DP')
+        add('rpm', comp_id, 'RPM')
+        add('T_2b', comp_id, 'inlet')
+        add('T_3a', comp_id, 'outlet')
+    for comp_id, _ in snapshot.components('Condenser')[:1]:  # Assume single condenser
+        add('T_3b', comp_id, 'inlet')
+        add('T_4a', comp_id, 'outlet')
+    for comp_id, _ in snapshot.components('TXV'):
+        add('T_4b', comp_id, 'inlet')
+    for comp_id, props in snapshot.components('Evaporator'):
+        for i in range(1, props.get('circuits', 1) + 1):
+            add('T_2a', comp_id, f'outlet_circuit_{i}')
+    return ports
+
+
+def calculate_cycle_series(
+    data_manager,
+    bucket_minutes: float = DEFAULT_CYCLE_BUCKET_MINUTES,
+    on_time_only: bool = True
+) -> pd.DataFrame:
+    """
+    calculate_full_system per N-minute time bucket instead of per window.
+    
+    The (ON-time) filtered data is resampled once to the mean of every
+    mapped port per bucket; ports feeding one input (TXV inlets, evaporator
+    outlets) are then averaged as in gather_temperatures_from_ports. The
+    8-point cycle, mass flow and system performance are evaluated for all
+    buckets in one vectorized pass (compute_8_point_cycle_series).
+    
+    Returns:
+        DataFrame indexed by bucket start: 'rows' (samples in the bucket),
+        the cycle columns of compute_8_point_cycle_series, mass_flow_kgs /
+        mass_flow_lbhr and the calculate_system_performance_series metrics.
+        Buckets without samples are dropped; missing inputs give NaN.
+    """
+    data = data_manager.get_on_time_filtered_data() if on_time_only else data_manager.get_filtered_data()
+    if data is None or data.empty or 'Timestamp' not in data.columns:
+        print("[CYCLE SERIES] No timestamped data to bucket")
+        return pd.DataFrame()
+    
+    snapshot = PortSnapshot(data_manager)
+    port_sensors = gather_cycle_port_sensors(data_manager, snapshot)
+    sensors = list(dict.fromkeys(s for names in port_sensors.values() for s in names if s in data.columns))
+    
+    # One resampling pass over all mapped ports
+    frame = data[sensors].apply(pd.to_numeric, errors='coerce')
+    frame.index = pd.DatetimeIndex(data['Timestamp'])
+    frame = frame[frame.index.notna()]
+    buckets = frame.resample(pd.Timedelta(minutes=bucket_minutes))
+    means = buckets.mean()
+    rows = buckets.size()
+    means = means[rows > 0]
+    rows = rows[rows > 0]
+    print(f"[CYCLE SERIES] {len(frame)} rows -> {len(means)} buckets of {bucket_minutes} min")
+    
+    def port_mean(key):
+        names = [s for s in port_sensors[key] if s in means.columns]
+        if not names:
+            return pd.Series(float('nan'), index=means.index)
+        return means[names].mean(axis=1)
+    
+    temps_k = {key: f_to_k(port_mean(key).to_numpy()) for key in ('T_2a', 'T_2b', 'T_3a', 'T_3b', 'T_4a', 'T_4b')}
+    settings = getattr(data_manager, 'calculation_settings', None) or {}
+    cycle = compute_8_point_cycle_series(
+        psig_to_pa(port_mean('suction').to_numpy()),
+        psig_to_pa(port_mean('liquid').to_numpy()),
+        temps_k,
+        refrigerant=data_manager.refrigerant,
+        backend=resolve_backend_name(settings.get('property_backend'))
+    )
+    cycle.index = means.index
+    
+    # Mass flow: compressor displacement method, RPM sensor or property per bucket
+    comp_specs = gather_compressor_specs(data_manager, snapshot)
+    speed_rpm = port_mean('rpm')
+    if comp_specs.get('speed_rpm') is not None:
+        speed_rpm = speed_rpm.fillna(comp_specs['speed_rpm'])
+    mass_flow = calculate_mass_flow_rate(
+        density_kgm3=cycle['density_compressor_inlet_kgm3'].to_numpy(),
+        displacement_cm3=comp_specs.get('displacement_cm3') or float('nan'),
+        speed_rpm=speed_rpm.to_numpy(dtype='float64'),
+        volumetric_efficiency=comp_specs.get('vol_eff', 0.85)
+    )
+    
+    performance = calculate_system_performance_series(cycle, mass_flow['actual_kgs'])
+    result = pd.concat([
+        rows.rename('rows'),
+        cycle,
+        pd.DataFrame({'mass_flow_kgs': mass_flow['actual_kgs'], 'mass_flow_lbhr': mass_flow['actual_lbhr']},
+                     index=means.index),
+        performance.drop(columns=['cop']),
+    ], axis=1)
+    result.index.name = 'Timestamp'
+    return result
+
+
 # =========================================================================
 # NEW UNIFIED BATCH PROCESSING ENGINE (from goal.md Step 3)
 # This replaces coolprop_calculator.py entirely
@@ -509,39 +594,31 @@ def _find_sensor_for_role(model: Dict, role_def: tuple) -> Optional[str]:
     return None
 
 
-def run_batch_processing(
+def prepare_batch_inputs(
     data_manager,
     input_dataframe: pd.DataFrame
-) -> pd.DataFrame:
+) -> Dict:
     """
-    The NEW main entry point for the "Calculations" tab.
-
-    This function implements the complete two-step calculation process from goal.md:
-    - Step 1: Calculate volumetric efficiency from rated inputs (one-time)
-    - Step 2: Apply row-by-row performance calculations (for each timestamp)
-
-    This replaces coolprop_calculator.py entirely with a flexible, port-mapping-based system.
-
-    Args:
-        data_manager: DataManager instance with diagram_model and rated_inputs
-        input_dataframe: Raw CSV data (or filtered data)
+    Steps 1-3 of batch processing: eta_vol, compressor specs and the
+    role -> column sensor map validated against input_dataframe.
 
     Returns:
-        DataFrame with all calculated columns matching Calculations-DDT.xlsx structure
+        Dict with eta_vol, comp_specs, sensor_map, refrigerant,
+        property_backend and batch_workers, or {'error': message} if Step 1
+        failed.
     """
-    print(f"[BATCH PROCESSING] Starting batch processing on {len(input_dataframe)} rows...")
-
     # === STEP 1: GET RATED INPUTS AND CALCULATE ETA_VOL ===
     rated_inputs = data_manager.rated_inputs
     refrigerant = data_manager.refrigerant or 'R290'
 
-    eta_vol_results = calculate_volumetric_efficiency(rated_inputs, refrigerant)
+    # Memoized on the rated inputs: only a rated input change recomputes it
+    eta_vol_results = cached_volumetric_efficiency(rated_inputs, refrigerant)
 
     # Goal-2C: Handle CoolProp errors (fatal)
     if 'error' in eta_vol_results:
         print(f"[BATCH PROCESSING] ERROR in Step 1 (eta_vol): {eta_vol_results['error']}")
         print("[BATCH PROCESSING] Please ensure CoolProp is installed.")
-        return pd.DataFrame({'error': [eta_vol_results['error']]})
+        return {'error': eta_vol_results['error']}
 
     # Goal-2C: Handle graceful degradation warnings (non-fatal)
     eta_vol = eta_vol_results.get('eta_vol', 0.85)
@@ -629,21 +706,197 @@ def run_batch_processing(
         duplicates = [item for item, count in Counter(sensor_values).items() if count > 1]
         print(f"[BATCH PROCESSING] Duplicate sensor columns: {duplicates}")
 
-    # === STEP 4: RUN STEP 2 (ROW-BY-ROW PROCESSING) ===
-    print(f"[BATCH PROCESSING] Starting row-by-row calculation...")
+    settings = getattr(data_manager, 'calculation_settings', None) or {}
+    property_backend = resolve_backend_name(settings.get('property_backend'))
+    try:
+        batch_workers = int(settings.get('batch_workers') or 0)
+    except (TypeError, ValueError):
+        batch_workers = 0
+
+    return {
+        'eta_vol': eta_vol,
+        'comp_specs': comp_specs,
+        'sensor_map': sensor_map,
+        'refrigerant': refrigerant,
+        'property_backend': property_backend,
+        'batch_workers': batch_workers,
+    }
 
-    results_df = input_dataframe.apply(
-        calculate_row_performance,
-        axis=1,
-        sensor_map=sensor_map,
-        eta_vol=eta_vol,
-        comp_specs=comp_specs,
-        refrigerant=refrigerant
-    )
 
-    print(f"[BATCH PROCESSING] Row-by-row calculation complete!")
+def run_batch_processing(
+    data_manager,
+    input_dataframe: pd.DataFrame,
+    workers: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    inputs: Optional[Dict] = None,
+    on_chunk: Optional[Callable[[int, int, pd.DataFrame], bool]] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> pd.DataFrame:
+    """
+    The NEW main entry point for the "Calculations" tab (and batch_cli.py).
+
+    This function implements the complete two-step calculation process from goal.md:
+    - Step 1: Calculate volumetric efficiency from rated inputs (one-time)
+    - Step 2: Apply row-by-row performance calculations (for each timestamp)
+
+    The CoolProp backend comes from data_manager.calculation_settings['property_backend']
+    ('HEOS' by default; 'BICUBIC&HEOS' / 'TTSE&HEOS' trade a little accuracy
+    for speed, see build_backend_accuracy_report).
+
+    Large frames are split over worker processes (calculation_settings['batch_workers'],
+    0 = one per CPU core); small frames always run serially in-process.
+
+    This replaces coolprop_calculator.py entirely with a flexible, port-mapping-based system.
+
+    Args:
+        data_manager: DataManager instance with diagram_model and rated_inputs
+        input_dataframe: Raw CSV data (or filtered data)
+        workers: Override for the worker process count (1 = serial)
+        columns: Only compute these output columns (batch_cli.py asks for
+                 the exported COLUMN_NAMES); None = all columns, which the
+                 Calculations tab needs because the P-h tab plots its frame
+        inputs: prepare_batch_inputs() result to use instead of preparing it
+                from data_manager (the Calculations tab prepares it on the
+                GUI thread and runs the batch in a worker thread)
+        on_chunk: Stream the batch in chunk_rows row chunks and call
+                  on_chunk(start_row, stop_row, chunk_results) after each;
+                  returning True stops after that chunk, and the result then
+                  holds the rows done so far with attrs['cancelled'] = True
+        chunk_rows: Rows per chunk when on_chunk is given
+
+    Returns:
+        DataFrame with all calculated columns matching Calculations-DDT.xlsx structure
+    """
+    print(f"[BATCH PROCESSING] Starting batch processing on {len(input_dataframe)} rows...")
+
+    if inputs is None:
+        inputs = prepare_batch_inputs(data_manager, input_dataframe)
+    if 'error' in inputs:
+        return pd.DataFrame({'error': [inputs['error']]})
+
+    # === STEP 4: RUN STEP 2 (COLUMN-WISE OVER ALL ROWS) ===
+    print(f"[BATCH PROCESSING] Starting batch calculation (property backend: {inputs['property_backend']})...")
+
+    sat_before = get_saturation_cache().stats()
+    states_before = get_state_point_cache().stats()
+    workers = inputs['batch_workers'] if workers is None else workers
+    if on_chunk is None:
+        results_df = calculate_batch_performance_parallel(
+            input_dataframe,
+            sensor_map=inputs['sensor_map'],
+            eta_vol=inputs['eta_vol'],
+            comp_specs=inputs['comp_specs'],
+            refrigerant=inputs['refrigerant'],
+            backend=inputs['property_backend'],
+            workers=workers,
+            columns=columns
+        )
+    else:
+        results_df = _run_batch_chunks(input_dataframe, inputs, workers, columns, chunk_rows, on_chunk)
+
+    if results_df.attrs.get('cancelled'):
+        print(f"[BATCH PROCESSING] Batch calculation stopped after {len(results_df)} of {len(input_dataframe)} rows")
+    else:
+        print(f"[BATCH PROCESSING] Batch calculation complete!")
+    evaluated, requested = results_df.attrs.get('property_evaluations', (0, 0))
+    print(f"[BATCH PROCESSING] Property evaluations: {evaluated} distinct (P, T) pairs for {requested} state points")
+    # Cache counters for this run (worker processes keep their own caches)
+    for label, cache, before in (('State point', get_state_point_cache(), states_before),
+                                 ('Saturation', get_saturation_cache(), sat_before)):
+        after = cache.stats()
+        print(f"[BATCH PROCESSING] {label} cache: {after['hits'] - before['hits']} hits, "
+              f"{after['misses'] - before['misses']} misses, {after['entries']} entries")
     print(f"[BATCH PROCESSING] Output DataFrame has {len(results_df)} rows and {len(results_df.columns)} columns")
     print(f"[BATCH PROCESSING] Output columns: {list(results_df.columns)}")
 
     return results_df
 
+
+def _run_batch_chunks(
+    input_dataframe: pd.DataFrame,
+    inputs: Dict,
+    workers: Optional[int],
+    columns: Optional[List[str]],
+    chunk_rows: int,
+    on_chunk: Callable[[int, int, pd.DataFrame], bool]
+) -> pd.DataFrame:
+    """
+    Streaming body of run_batch_processing: chunks in row order, stoppable by on_chunk.
+
+    As in calculate_batch_performance_parallel, a broken process pool is
+    dropped (so the next run starts a fresh one) and the batch carries on
+    serially from the first chunk that did not finish.
+    """
+    def chunks_from(first_row, n_workers):
+        chunks = iter_batch_performance(
+            input_dataframe.iloc[first_row:],
+            sensor_map=inputs['sensor_map'],
+            eta_vol=inputs['eta_vol'],
+            comp_specs=inputs['comp_specs'],
+            refrigerant=inputs['refrigerant'],
+            backend=inputs['property_backend'],
+            columns=columns,
+            chunk_rows=chunk_rows,
+            workers=n_workers
+        )
+        try:
+            for start, stop, part in chunks:
+                yield first_row + start, first_row + stop, part
+        finally:
+            chunks.close()
+
+    parts = []
+    done = 0
+    parallel = resolve_worker_count(workers, len(input_dataframe)) > 1
+    chunks = chunks_from(0, workers)
+    while True:
+        try:
+            start, stop, part = next(chunks)
+        except StopIteration:
+            break
+        except Exception as e:
+            if not parallel:
+                raise
+            # Broken pool (worker crashed or could not start): drop it, finish serially
+            print(f"[BATCH PROCESSING] Parallel batch failed after {done} rows ({e}), continuing serially")
+            shutdown_worker_pool()
+            parallel = False
+            chunks = chunks_from(done, 1)
+            continue
+        parts.append(part)
+        done = stop
+        if on_chunk(start, stop, part) and stop < len(input_dataframe):
+            chunks.close()
+            results_df = combine_batch_chunks(parts)
+            results_df.attrs['cancelled'] = True
+            return results_df
+    return combine_batch_chunks(parts)
+
+
+def build_backend_accuracy_report(
+    data_manager,
+    input_dataframe: pd.DataFrame,
+    sample_size: int = 200
+) -> pd.DataFrame:
+    """
+    Compare the selectable CoolProp backends on a sample of input rows.
+
+    Uses the same eta_vol, specs and sensor map as run_batch_processing and
+    reports the max deviation of each output column from exact HEOS
+    (see calculation_engine.compare_property_backends).
+    """
+    inputs = prepare_batch_inputs(data_manager, input_dataframe)
+    if 'error' in inputs:
+        return pd.DataFrame({'error': [inputs['error']]})
+
+    report = compare_property_backends(
+        input_dataframe,
+        inputs['sensor_map'],
+        inputs['eta_vol'],
+        inputs['comp_specs'],
+        refrigerant=inputs['refrigerant'],
+        sample_size=sample_size
+    )
+    for name, seconds in report.attrs.get('seconds', {}).items():
+        print(f"[BATCH PROCESSING] Backend {name}: {seconds * 1000:.1f} ms for {report.attrs.get('rows')} rows")
+    return report
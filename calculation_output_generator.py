@@ -10,6 +10,7 @@ from pathlib import Path
 from datetime import datetime
 from calculation_orchestrator import CalculationOrchestrator
 from data_manager import DataManager
+from compressor_cycles import build_cycle_index
 
 
 class CalculationOutputGenerator:
@@ -22,6 +23,7 @@ class CalculationOutputGenerator:
         self.data_manager = data_manager
         self.config_json_path = config_json_path
         self.orchestrator = CalculationOrchestrator(data_manager, config_json_path)
+        self.cycle_stats = None
         
     def generate_full_output(self, output_dir='calculation_outputs'):
         """
@@ -114,43 +116,50 @@ class CalculationOutputGenerator:
     
     def _segregate_on_off_time(self, full_df):
         """Segregate data into ON-time and OFF-time based on suction pressure."""
-        # Get suction pressure sensor
-        with open(self.config_json_path, 'r') as f:
-            data = json.load(f)
-        
-        # Try different JSON formats
-        sensor_roles = data.get('sensor_roles', {})
-        if not sensor_roles:
-            sensor_roles = data.get('diagramModel', {}).get('sensor_roles', {})
+        threshold = self.data_manager.on_time_threshold_psig
         
-        # Find suction pressure sensor
-        suction_sensor = None
-        for key, value in sensor_roles.items():
-            if '.SP' in key and 'Compressor' in key:
-                suction_sensor = value
-                break
+        # Shared ON/OFF definition; its masks line up with get_filtered_data()
+        cycles = self.data_manager.get_compressor_cycles()
+        if cycles is None or cycles.total_rows != len(full_df):
+            cycles = build_cycle_index(full_df, self._find_suction_sensor_in_config(), threshold,
+                                       self.data_manager.on_time_hysteresis_psig)
         
-        if not suction_sensor or suction_sensor not in full_df.columns:
+        if cycles is None:
             print(f"⚠️  Warning: Suction pressure sensor not found. Using all data as ON-time.")
             return full_df.copy(), pd.DataFrame()
         
-        threshold = self.data_manager.on_time_threshold_psig
-        
         # Segregate
-        on_time_df = full_df[full_df[suction_sensor] > threshold].copy()
-        off_time_df = full_df[full_df[suction_sensor] <= threshold].copy()
+        on_time_df = full_df[cycles.on_mask].copy()
+        off_time_df = full_df[cycles.off_mask].copy()
         
         # Add a flag column
         on_time_df['COMPRESSOR_STATE'] = 'ON'
         off_time_df['COMPRESSOR_STATE'] = 'OFF'
         
-        print(f"   Suction Pressure Sensor: {suction_sensor}")
+        print(f"   Suction Pressure Sensor: {cycles.sensor}")
         print(f"   Threshold: {threshold} psig")
         print(f"   ON-time rows: {len(on_time_df)} ({len(on_time_df)/len(full_df)*100:.1f}%)")
         print(f"   OFF-time rows: {len(off_time_df)} ({len(off_time_df)/len(full_df)*100:.1f}%)")
         
+        self.cycle_stats = cycles.cycle_stats()
         return on_time_df, off_time_df
     
+    def _find_suction_sensor_in_config(self):
+        """Suction pressure sensor from the config JSON (Compressor .SP role)."""
+        with open(self.config_json_path, 'r') as f:
+            data = json.load(f)
+        
+        # Try different JSON formats
+        sensor_roles = data.get('sensor_roles', {})
+        if not sensor_roles:
+            sensor_roles = data.get('diagramModel', {}).get('sensor_roles', {})
+        
+        # Find suction pressure sensor
+        for key, value in sensor_roles.items():
+            if '.SP' in key and 'Compressor' in key:
+                return value
+        return None
+    
     def _calculate_state_points(self, on_time_df):
         """Calculate all 8 state points for each row."""
         if on_time_df.empty:
@@ -270,6 +279,13 @@ class CalculationOutputGenerator:
             f.write(f"ON-time rows: {len(on_time_df)} ({len(on_time_df)/len(full_df)*100:.1f}%)\n")
             f.write(f"OFF-time rows: {len(off_time_df)} ({len(off_time_df)/len(full_df)*100:.1f}%)\n")
             f.write(f"ON-time threshold: {self.data_manager.on_time_threshold_psig} psig\n")
+            if self.cycle_stats and self.cycle_stats.get('cycles_per_hour') is not None:
+                f.write(f"Compressor cycles: {self.cycle_stats['cycles']} "
+                        f"({self.cycle_stats['cycles_per_hour']:.2f}/hour)\n")
+                if self.cycle_stats.get('mean_on_time_s') is not None:
+                    f.write(f"Mean ON time: {self.cycle_stats['mean_on_time_s'] / 60:.1f} min\n")
+                if self.cycle_stats.get('mean_off_time_s') is not None:
+                    f.write(f"Mean OFF time: {self.cycle_stats['mean_off_time_s'] / 60:.1f} min\n")
             f.write(f"Refrigerant: {self.data_manager.refrigerant}\n")
             f.write("\n")
             
@@ -8,14 +8,23 @@ Provides the new unified calculation tab with:
 - Replaces old coolprop_calculator.py system entirely
 """
 
+import math
+import time
+import traceback
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QTreeWidget, QTreeWidgetItem, QHeaderView, QLabel,
-                             QMessageBox, QApplication, QDialog)
-from PyQt6.QtCore import Qt, pyqtSignal
+                             QMessageBox, QApplication, QDialog, QProgressBar)
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QThread
 from PyQt6.QtGui import QPainter, QFont, QColor
 import pandas as pd
+from calculation_engine import DEFAULT_CHUNK_ROWS, combine_batch_chunks
+from calculation_orchestrator import run_batch_processing
 from input_dialog import InputDialog
 
+# Minimum seconds between partial-result updates of the P-h tab while streaming
+PH_PARTIAL_UPDATE_INTERVAL_S = 1.0
+
 
 class NestedHeaderView(QHeaderView):
     """
@@ -184,6 +193,59 @@ class NestedHeaderView(QHeaderView):
         return size
 
 
+class CalculationWorker(QObject):
+    """
+    Runs the batch calculation off the GUI thread, one row chunk at a time,
+    through calculation_orchestrator.run_batch_processing (the inputs are
+    prepared on the GUI thread).
+
+    After every chunk it emits chunk_ready(start_row, chunk_df) and
+    progress(done_rows, total_rows); it then ends with exactly one of
+    finished(results_df), cancelled(partial_df) or failed(message).
+    Cancellation takes effect between chunks.
+    """
+
+    progress = pyqtSignal(int, int)
+    chunk_ready = pyqtSignal(int, object)
+    finished = pyqtSignal(object)
+    cancelled = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, input_df: pd.DataFrame, inputs: dict, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        super().__init__()
+        self.input_df = input_df
+        self.inputs = inputs
+        self.chunk_rows = chunk_rows
+        self._cancel_requested = False
+
+    def cancel(self):
+        """Request cancellation (safe to call from the GUI thread)."""
+        self._cancel_requested = True
+
+    def _on_chunk(self, start: int, stop: int, part) -> bool:
+        self.chunk_ready.emit(start, part)
+        self.progress.emit(stop, len(self.input_df))
+        return self._cancel_requested
+
+    def run(self):
+        try:
+            results_df = run_batch_processing(
+                None,
+                self.input_df,
+                inputs=self.inputs,
+                on_chunk=self._on_chunk,
+                chunk_rows=self.chunk_rows,
+            )
+            if results_df.attrs.get('cancelled'):
+                print(f"[CALCULATIONS] Calculation cancelled after {len(results_df)} of {len(self.input_df)} rows")
+                self.cancelled.emit(results_df)
+            else:
+                self.finished.emit(results_df)
+        except Exception as e:
+            traceback.print_exc()
+            self.failed.emit(str(e))
+
+
 class CalculationsWidget(QWidget):
     """
     New unified Calculations tab widget.
@@ -200,7 +262,31 @@ class CalculationsWidget(QWidget):
         self.data_manager = data_manager
         self.processed_df = None
 
+        # Background calculation state
+        self._calc_thread = None
+        self._calc_worker = None
+        self._partial_parts = []
+        self._partial_has_errors = False
+        self._last_partial_emit = 0.0
+        self._results_key = None
+
         self.setup_ui()
+        self.update_eta_vol_label()
+        self.data_manager.data_changed.connect(self.update_eta_vol_label)
+        self.data_manager.results_loaded.connect(self.show_stored_results)
+
+    def update_eta_vol_label(self):
+        """Show eta_vol for the current rated inputs (memoized, restored with the session)."""
+        try:
+            result = self.data_manager.get_eta_vol()
+        except Exception as e:
+            result = {'error': str(e)}
+        if 'error' in result:
+            self.eta_vol_label.setText("η_vol: n/a")
+            self.eta_vol_label.setToolTip(result['error'])
+            return
+        self.eta_vol_label.setText(f"η_vol: {result['eta_vol']:.4f} ({result.get('method', 'calculated')})")
+        self.eta_vol_label.setToolTip("\n".join(result.get('warnings') or []) or "Calculated from the rated inputs")
 
     def setup_ui(self):
         """Create the UI layout."""
@@ -217,6 +303,11 @@ class CalculationsWidget(QWidget):
 
         title_layout.addStretch()
 
+        # Current volumetric efficiency (Step 1), shown without running the batch
+        self.eta_vol_label = QLabel()
+        self.eta_vol_label.setFont(QFont("Arial", 10))
+        title_layout.addWidget(self.eta_vol_label)
+
         # Add "Enter Rated Inputs" button (Goal-2 Phase 3)
         self.enter_inputs_button = QPushButton("⚙️ Enter Rated Inputs")
         self.enter_inputs_button.setFont(QFont("Arial", 10))
@@ -255,12 +346,26 @@ class CalculationsWidget(QWidget):
         """)
         title_layout.addWidget(self.run_button)
 
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setFont(QFont("Arial", 10))
+        self.cancel_button.setToolTip("Stop after the current chunk and keep the rows calculated so far")
+        self.cancel_button.clicked.connect(self.cancel_calculation)
+        self.cancel_button.setVisible(False)
+        title_layout.addWidget(self.cancel_button)
+
         layout.addLayout(title_layout)
 
         # ==================== Status Label ====================
+        status_layout = QHBoxLayout()
         self.status_label = QLabel("Ready. Click 'Run Full Calculation' to process data.")
         self.status_label.setStyleSheet("color: gray; font-size: 10pt;")
-        layout.addWidget(self.status_label)
+        status_layout.addWidget(self.status_label, 1)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedWidth(250)
+        self.progress_bar.setVisible(False)
+        status_layout.addWidget(self.progress_bar)
+        layout.addLayout(status_layout)
 
         # ==================== Tree Widget with Nested Headers ====================
         self.tree_widget = QTreeWidget()
@@ -293,6 +398,12 @@ class CalculationsWidget(QWidget):
         self.export_mapping_button.clicked.connect(self.export_mapping_audit)
         export_layout.addWidget(self.export_mapping_button)
 
+        # Compare tabular CoolProp backends against exact HEOS
+        self.backend_report_button = QPushButton("Backend Accuracy")
+        self.backend_report_button.setToolTip("Compare HEOS / BICUBIC / TTSE property backends on sample rows")
+        self.backend_report_button.clicked.connect(self.show_backend_accuracy_report)
+        export_layout.addWidget(self.backend_report_button)
+
         export_layout.addStretch()
 
         layout.addLayout(export_layout)
@@ -311,6 +422,7 @@ class CalculationsWidget(QWidget):
 
         # Pre-fill with existing values from data_manager
         dialog.set_data(self.data_manager.rated_inputs)
+        dialog.set_settings(self.data_manager.calculation_settings)
 
         # Show dialog and wait for user action
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -319,6 +431,8 @@ class CalculationsWidget(QWidget):
 
             # Save to data_manager
             self.data_manager.rated_inputs = new_data
+            self.data_manager.calculation_settings.update(dialog.get_settings())
+            self.update_eta_vol_label()
 
             # Provide feedback
             QMessageBox.information(
@@ -385,116 +499,256 @@ class CalculationsWidget(QWidget):
             if reply == QMessageBox.StandardButton.No:
                 return  # User chose to stop
 
+        if self._calc_thread is not None:
+            return  # A calculation is already running
+
+        # 1. Get filtered data from data manager
+        input_df = self.data_manager.get_filtered_data(consumer='calculations')
+
+        if input_df is None or input_df.empty:
+            self.status_label.setText("❌ No data to process. Please load a CSV file.")
+            self.status_label.setStyleSheet("color: red; font-size: 10pt;")
+            QMessageBox.warning(self, "No Data", "Please load a CSV file first.")
+            return
+
+        print(f"[CALCULATIONS] Starting calculation on {len(input_df)} rows...")
+
+        # 2. eta_vol, specs and sensor map are resolved on the GUI thread;
+        #    only the row calculation runs in the background
+        try:
+            from calculation_orchestrator import prepare_batch_inputs
+            inputs = prepare_batch_inputs(self.data_manager, input_df)
+        except Exception as e:
+            traceback.print_exc()
+            self._show_calculation_error(str(e))
+            return
+        if 'error' in inputs:
+            self._show_calculation_error(inputs['error'])
+            return
+
+        # Key of the state this run starts from; the results are stored under it
+        try:
+            self._results_key = self.data_manager.results_key(inputs)
+        except Exception as e:
+            print(f"[CALCULATIONS] Results will not be stored: {e}")
+            self._results_key = None
+
         self.run_button.setText("Calculating...")
         self.run_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.setVisible(True)
+        self.progress_bar.setRange(0, len(input_df))
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
         self.status_label.setText("Processing...")
         self.status_label.setStyleSheet("color: blue; font-size: 10pt;")
-        QApplication.processEvents()  # Allow UI to update
+        self.export_button.setEnabled(False)
 
-        try:
-            # 1. Get filtered data from data manager
-            input_df = self.data_manager.get_filtered_data()
+        self.tree_widget.clear()
+        self._partial_parts = []
+        self._partial_has_errors = False
+        self._last_partial_emit = time.monotonic()
+
+        # 3. Run the orchestrated batch calculation in a worker thread
+        self._calc_thread = QThread(self)
+        self._calc_worker = CalculationWorker(input_df, inputs)
+        self._calc_worker.moveToThread(self._calc_thread)
+        self._calc_thread.started.connect(self._calc_worker.run)
+        self._calc_worker.progress.connect(self._on_calculation_progress)
+        self._calc_worker.chunk_ready.connect(self._on_calculation_chunk)
+        self._calc_worker.finished.connect(self._on_calculation_finished)
+        self._calc_worker.cancelled.connect(self._on_calculation_cancelled)
+        self._calc_worker.failed.connect(self._on_calculation_failed)
+        for signal in (self._calc_worker.finished, self._calc_worker.cancelled, self._calc_worker.failed):
+            signal.connect(self._calc_thread.quit)
+        self._calc_thread.finished.connect(self._calc_worker.deleteLater)
+        self._calc_thread.finished.connect(self._calc_thread.deleteLater)
+        self._calc_thread.finished.connect(self._on_calculation_thread_done)
+        self._calc_thread.start()
+
+    def cancel_calculation(self):
+        """Stop the running calculation after its current chunk."""
+        if self._calc_worker is not None:
+            self._calc_worker.cancel()
+            self.cancel_button.setEnabled(False)
+            self.status_label.setText("Cancelling...")
+
+    def shutdown_calculation(self):
+        """
+        Cancel a running calculation and wait for its thread to finish.
 
-            if input_df is None or input_df.empty:
-                self.status_label.setText("❌ No data to process. Please load a CSV file.")
-                self.status_label.setStyleSheet("color: red; font-size: 10pt;")
-                QMessageBox.warning(self, "No Data", "Please load a CSV file first.")
-                return
+        Call before the application exits (MainWindow.closeEvent): Qt aborts
+        when a running QThread is destroyed, and tab widgets never receive a
+        closeEvent of their own when the main window closes.
+        """
+        if self._calc_thread is not None:
+            self._calc_worker.cancel()
+            self._calc_thread.quit()
+            self._calc_thread.wait()
+
+    def closeEvent(self, event):
+        # Never destroy a running QThread
+        self.shutdown_calculation()
+        super().closeEvent(event)
+
+    def _on_calculation_progress(self, done_rows: int, total_rows: int):
+        self.progress_bar.setValue(done_rows)
+        percent = done_rows / total_rows * 100 if total_rows else 100.0
+        self.status_label.setText(f"Processing... {done_rows} / {total_rows} rows ({percent:.0f}%)")
+
+    def _on_calculation_chunk(self, start_row: int, chunk_df):
+        """Stream a finished chunk into the table and (throttled) the P-h tab."""
+        self._partial_parts.append(chunk_df)
+        if 'error' in chunk_df.columns and chunk_df['error'].notna().any():
+            # The finished run reports the error; stop showing partial rows
+            self._partial_has_errors = True
+        if self._partial_has_errors:
+            return
 
-            print(f"[CALCULATIONS] Starting calculation on {len(input_df)} rows...")
+        self.append_tree_rows(self._display_frame(chunk_df, verbose=False))
+        if start_row == 0:
+            self._resize_tree_columns()
 
-            # 2. Call the NEW orchestrator function (replaces coolprop_calculator.py)
-            from calculation_orchestrator import run_batch_processing
-            processed_df = run_batch_processing(self.data_manager, input_df)
+        now = time.monotonic()
+        if now - self._last_partial_emit >= PH_PARTIAL_UPDATE_INTERVAL_S:
+            self._last_partial_emit = now
+            partial_df = self._display_frame(combine_batch_chunks(self._partial_parts), verbose=False)
+            self.filtered_data_ready.emit(partial_df)
 
-            # 3. Check for errors
+    def _on_calculation_finished(self, processed_df):
+        try:
+            # Check for errors
             if 'error' in processed_df.columns:
-                error_msg = processed_df['error'].iloc[0] if len(processed_df) > 0 else "Unknown error"
-                self.status_label.setText(f"❌ Error: {error_msg}")
-                self.status_label.setStyleSheet("color: red; font-size: 10pt;")
-                QMessageBox.critical(
-                    self,
-                    "Calculation Error",
-                    f"An error occurred during calculation:\n\n{error_msg}\n\n"
-                    "Please ensure:\n"
-                    "1. Rated inputs are entered (click '⚙️ Enter Rated Inputs' button)\n"
-                    "2. All required sensors are mapped in the Diagram tab"
-                )
+                error_msg = processed_df['error'].dropna().iloc[0] if processed_df['error'].notna().any() else "Unknown error"
+                self.tree_widget.clear()
+                self._show_calculation_error(error_msg)
                 return
 
-            # 4. Store and display results
-            # CRITICAL FIX: Force a stable schema to prevent adjacent/shifted values
-            # This ensures ALL expected columns exist, filling missing ones with NaN
-            expected_cols = list(self.header.data_keys)
-
-            print(f"[CALCULATIONS] Expected columns: {len(expected_cols)}")
-            print(f"[CALCULATIONS] Returned columns: {len(processed_df.columns)}")
-
-            # Check for any unexpected columns that might indicate a problem
-            returned_cols = set(processed_df.columns)
-            expected_cols_set = set(expected_cols)
-            unexpected_cols = returned_cols - expected_cols_set
-            if unexpected_cols:
-                print(f"[CALCULATIONS] WARNING: Unexpected columns in results: {unexpected_cols}")
-
-            # Reindex to enforce exact column order and add missing columns as NaN
-            processed_df = processed_df.reindex(columns=expected_cols)
-
-            # Explicit verification: Check that unmapped columns are truly NaN
-            for col in expected_cols:
-                if col not in returned_cols:
-                    # This column was not in the results, so should be all NaN after reindex
-                    if not processed_df[col].isna().all():
-                        print(f"[CALCULATIONS] ERROR: Column '{col}' should be NaN but has values!")
-                        # Force it to NaN to prevent ghost values
-                        processed_df[col] = pd.NA
-
+            # Store and display results (rows were streamed into the table)
+            processed_df = self._display_frame(processed_df)
             self.processed_df = processed_df
-            self.populate_tree(processed_df)
+            self._resize_tree_columns()
 
-            # 5. Enable export
+            # Keep the results beside the CSV so reopening the session skips the batch
+            if self._results_key:
+                self.data_manager.store_results(processed_df, self._results_key)
+
+            # Enable export
             self.export_button.setEnabled(True)
 
-            # 6. Emit signal for P-h Diagram
+            # Emit signal for P-h Diagram
             self.filtered_data_ready.emit(processed_df)
 
-            # 7. Update status
+            # Update status
             self.status_label.setText(f"✓ Calculation complete! Processed {len(processed_df)} rows.")
             self.status_label.setStyleSheet("color: green; font-size: 10pt;")
 
             print(f"[CALCULATIONS] Calculation complete! {len(processed_df)} rows processed.")
 
         except Exception as e:
-            print(f"[CALCULATIONS] ERROR during calculation: {e}")
-            import traceback
-            traceback.print_exc()
+            self._on_calculation_failed(str(e))
+
+    def show_stored_results(self, results_df):
+        """Show results restored by DataManager (session + CSV unchanged since they were calculated)."""
+        if self._calc_thread is not None:
+            return  # A fresh calculation is running and will replace them
+        self.processed_df = self._display_frame(results_df, verbose=False)
+        self.populate_tree(self.processed_df)
+        self.export_button.setEnabled(True)
+        self.filtered_data_ready.emit(self.processed_df)
+        self.status_label.setText(f"✓ Loaded {len(self.processed_df)} saved result rows (inputs unchanged).")
+        self.status_label.setStyleSheet("color: green; font-size: 10pt;")
+
+    def _on_calculation_cancelled(self, partial_df):
+        """Keep the rows calculated before cancellation."""
+        total = self.progress_bar.maximum()
+        if partial_df.empty or 'error' in partial_df.columns:
+            self.processed_df = None
+            self.tree_widget.clear()
+        else:
+            self.processed_df = self._display_frame(partial_df, verbose=False)
+            self.export_button.setEnabled(True)
+            self.filtered_data_ready.emit(self.processed_df)
+        rows = 0 if self.processed_df is None else len(self.processed_df)
+        self.status_label.setText(f"Calculation cancelled - showing {rows} of {total} rows.")
+        self.status_label.setStyleSheet("color: orange; font-size: 10pt;")
+
+    def _on_calculation_failed(self, message: str):
+        print(f"[CALCULATIONS] ERROR during calculation: {message}")
+        self.status_label.setText(f"❌ Error: {message}")
+        self.status_label.setStyleSheet("color: red; font-size: 10pt;")
+        QMessageBox.critical(self, "Calculation Error", f"An error occurred:\n\n{message}")
+
+    def _on_calculation_thread_done(self):
+        self._calc_thread = None
+        self._calc_worker = None
+        self._partial_parts = []
+        self.run_button.setText("Run Full Calculation")
+        self.run_button.setEnabled(True)
+        self.cancel_button.setVisible(False)
+        self.progress_bar.setVisible(False)
+
+    def _show_calculation_error(self, error_msg: str):
+        self.status_label.setText(f"❌ Error: {error_msg}")
+        self.status_label.setStyleSheet("color: red; font-size: 10pt;")
+        QMessageBox.critical(
+            self,
+            "Calculation Error",
+            f"An error occurred during calculation:\n\n{error_msg}\n\n"
+            "Please ensure:\n"
+            "1. Rated inputs are entered (click '⚙️ Enter Rated Inputs' button)\n"
+            "2. All required sensors are mapped in the Diagram tab"
+        )
 
-            self.status_label.setText(f"❌ Error: {str(e)}")
-            self.status_label.setStyleSheet("color: red; font-size: 10pt;")
-            QMessageBox.critical(self, "Calculation Error", f"An error occurred:\n\n{str(e)}")
+    def _display_frame(self, processed_df, verbose: bool = True):
+        """Results reindexed to the table's column schema (missing columns as NaN)."""
+        # CRITICAL FIX: Force a stable schema to prevent adjacent/shifted values
+        # This ensures ALL expected columns exist, filling missing ones with NaN
+        expected_cols = list(self.header.data_keys)
+
+        # Check for any unexpected columns that might indicate a problem
+        returned_cols = set(processed_df.columns)
+        if verbose:
+            print(f"[CALCULATIONS] Expected columns: {len(expected_cols)}")
+            print(f"[CALCULATIONS] Returned columns: {len(processed_df.columns)}")
+            unexpected_cols = returned_cols - set(expected_cols)
+            if unexpected_cols:
+                print(f"[CALCULATIONS] WARNING: Unexpected columns in results: {unexpected_cols}")
+
+        # Reindex to enforce exact column order and add missing columns as NaN
+        processed_df = processed_df.reindex(columns=expected_cols)
 
-        finally:
-            self.run_button.setText("Run Full Calculation")
-            self.run_button.setEnabled(True)
+        # Explicit verification: Check that unmapped columns are truly NaN
+        for col in expected_cols:
+            if col not in returned_cols:
+                # This column was not in the results, so should be all NaN after reindex
+                if not processed_df[col].isna().all():
+                    print(f"[CALCULATIONS] ERROR: Column '{col}' should be NaN but has values!")
+                    # Force it to NaN to prevent ghost values
+                    processed_df[col] = pd.NA
+        return processed_df
 
     def populate_tree(self, df):
         """Populate the tree widget with calculated data."""
         self.tree_widget.clear()
+        self.append_tree_rows(df)
+        self._resize_tree_columns()
+        print(f"[CALCULATIONS] Populated tree with {len(df)} rows and {len(self.header.data_keys)} columns")
 
+    def append_tree_rows(self, df):
+        """Append calculated rows to the tree widget."""
         # Get the data keys from the header
         data_keys = self.header.data_keys
 
         items = []
-        for index, row in df.iterrows():
+        for _, row in df.iterrows():
             row_data = []
             for key in data_keys:
                 val = row.get(key)
                 # Treat NaN/NA as missing
                 try:
-                    import math
-                    is_missing = val is None or (isinstance(val, float) and math.isnan(val))
+                    is_missing = val is None or val is pd.NA or (isinstance(val, float) and math.isnan(val))
                 except Exception:
-                    # Fallback for pandas NA
                     is_missing = val is None
                 if is_missing:
                     row_data.append("---")
@@ -503,17 +757,14 @@ class CalculationsWidget(QWidget):
                 else:
                     row_data.append(str(val))
 
-            item = QTreeWidgetItem(row_data)
-            items.append(item)
+            items.append(QTreeWidgetItem(row_data))
 
         self.tree_widget.addTopLevelItems(items)
 
-        # Resize columns after adding data
-        for i in range(len(data_keys)):
+    def _resize_tree_columns(self):
+        for i in range(len(self.header.data_keys)):
             self.tree_widget.resizeColumnToContents(i)
 
-        print(f"[CALCULATIONS] Populated tree with {len(items)} rows and {len(data_keys)} columns")
-
     def export_to_csv(self):
         """Export the processed data to CSV."""
         if self.processed_df is None or self.processed_df.empty:
@@ -561,3 +812,53 @@ class CalculationsWidget(QWidget):
         except Exception as e:
             print(f"[MAPPING EXPORT] ERROR: {e}")
             QMessageBox.critical(self, "Mapping Export Error", str(e))
+
+    def show_backend_accuracy_report(self):
+        """Run the backend accuracy report on a sample of the filtered data and show it."""
+        input_df = self.data_manager.get_filtered_data(consumer='calculations')
+        if input_df is None or input_df.empty:
+            QMessageBox.warning(self, "No Data", "Please load a CSV file first.")
+            return
+
+        self.status_label.setText("Comparing property backends (first use builds CoolProp tables)...")
+        self.status_label.setStyleSheet("color: blue; font-size: 10pt;")
+        QApplication.processEvents()
+
+        try:
+            from calculation_orchestrator import build_backend_accuracy_report
+            report = build_backend_accuracy_report(self.data_manager, input_df)
+            if 'error' in report.columns:
+                raise RuntimeError(report['error'].iloc[0])
+
+            rows = report.attrs.get('rows', 0)
+            seconds = report.attrs.get('seconds', {})
+            reference_s = seconds.get('HEOS') or 0.0
+            lines = [f"Compared {rows} sample rows against HEOS (exact).", ""]
+            for name, elapsed in seconds.items():
+                if name == 'HEOS':
+                    continue
+                rel = report[f'{name} max rel %']
+                worst_col = rel.idxmax() if rel.notna().any() else None
+                speedup = reference_s / elapsed if elapsed > 0 else float('inf')
+                lines.append(f"{name}: {speedup:.1f}x faster")
+                if worst_col is not None:
+                    lines.append(f"    max deviation {rel.max():.4f} % ({worst_col})")
+                mismatched = int(report[f'{name} mismatched rows'].max())
+                if mismatched:
+                    lines.append(f"    {mismatched} rows evaluated on one backend only")
+            current = self.data_manager.calculation_settings.get('property_backend') or 'HEOS'
+            lines += ["", f"Current backend: {current} (change it in 'Enter Rated Inputs')."]
+
+            box = QMessageBox(self)
+            box.setWindowTitle("Property Backend Accuracy")
+            box.setText("\n".join(lines))
+            box.setDetailedText(report.to_string(float_format=lambda v: f"{v:.6g}"))
+            box.exec()
+
+            self.status_label.setText("✓ Backend accuracy report complete.")
+            self.status_label.setStyleSheet("color: green; font-size: 10pt;")
+        except Exception as e:
+            print(f"[CALCULATIONS] ERROR during backend comparison: {e}")
+            self.status_label.setText(f"❌ Error: {str(e)}")
+            self.status_label.setStyleSheet("color: red; font-size: 10pt;")
+            QMessageBox.critical(self, "Backend Comparison Error", str(e))
@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QColor, QBrush, QFont
 from mapping_dialog import MappingDialog
+from data_manager import resample_frame
 
 
 class ComparisonWidget(QWidget):
@@ -25,6 +26,7 @@ class ComparisonWidget(QWidget):
                 'csv_data': None,
                 'sensor_list': [],
                 'sensor_mapping': {},  # base_sensor -> comparison_sensor
+                'resampled': {},  # (rule, method) -> csv_data at that resolution
             },
             2: {
                 'file_path': None,
@@ -32,6 +34,7 @@ class ComparisonWidget(QWidget):
                 'csv_data': None,
                 'sensor_list': [],
                 'sensor_mapping': {},
+                'resampled': {},
             }
         }
         
@@ -163,6 +166,16 @@ class ComparisonWidget(QWidget):
         except Exception:
             return df
         
+    def resampled_comparison_data(self, comp_data):
+        """A comparison file's data at the DataManager's 'comparison' resolution (cached per setting)."""
+        rule, method = self.data_manager.get_resample('comparison') if hasattr(self.data_manager, 'get_resample') else (None, 'mean')
+        if rule is None or comp_data['csv_data'] is None:
+            return comp_data['csv_data']
+        cache = comp_data.setdefault('resampled', {})
+        if (rule, method) not in cache:
+            cache[(rule, method)] = resample_frame(comp_data['csv_data'], rule, method)
+        return cache[(rule, method)]
+        
     def load_comparison_csv(self, slot_number):
         """Load a CSV file for comparison."""
         # Check if base CSV is loaded
@@ -199,6 +212,7 @@ class ComparisonWidget(QWidget):
         self.comparison_files[slot_number]['file_path'] = file_name
         self.comparison_files[slot_number]['label'] = label
         self.comparison_files[slot_number]['csv_data'] = csv_data
+        self.comparison_files[slot_number]['resampled'] = {}
         self.comparison_files[slot_number]['sensor_list'] = sensor_list
         
         # Show mapping dialog
@@ -339,7 +353,7 @@ class ComparisonWidget(QWidget):
         aggregation = self.data_manager.value_aggregation
 
         # Get filtered base data according to DataManager's current time range
-        base_filtered = self.data_manager.get_filtered_data() if hasattr(self.data_manager, 'get_filtered_data') else self.data_manager.csv_data
+        base_filtered = self.data_manager.get_filtered_data(consumer='comparison') if hasattr(self.data_manager, 'get_filtered_data') else self.data_manager.csv_data
         
         # Populate table
         self.group_to_row_indexes = {}
@@ -399,7 +413,7 @@ class ComparisonWidget(QWidget):
                 
                 if comparison_sensor:
                     comp_value = self.get_aggregated_value_from_data(
-                        self.filter_data_like_manager(comp_data['csv_data']),
+                        self.filter_data_like_manager(self.resampled_comparison_data(comp_data)),
                         comparison_sensor,
                         aggregation
                     )
@@ -598,6 +612,7 @@ class ComparisonWidget(QWidget):
                     'csv_data': None,
                     'sensor_list': [],
                     'sensor_mapping': {},
+                    'resampled': {},
                 }
             
             self.load_comp1_btn.setText("Load Comparison 1")
@@ -0,0 +1,161 @@
+"""
+compressor_cycles.py
+
+Single definition of "compressor ON" shared by DataManager (on-time filter,
+pressure threshold filter) and CalculationOutputGenerator (ON/OFF export).
+
+A row is ON when the Compressor SP (suction pressure) reading is above the
+threshold. With a hysteresis band the compressor only switches back OFF once
+the pressure drops to threshold - hysteresis, which stops a noisy signal
+hovering around the threshold from being counted as many short cycles.
+Rows without a reading keep the previous state for cycle counting but are
+never part of the ON or OFF row masks.
+
+CompressorCycleIndex also run-length encodes the state into events
+(start row, stop row, duration) so cycle statistics never rescan the data.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def compressor_state(pressure: np.ndarray, threshold: float, hysteresis: float = 0.0) -> np.ndarray:
+    """
+    Held ON/OFF state per row (True = ON) for a suction pressure array.
+
+    ON when pressure > threshold, OFF when pressure <= threshold - hysteresis;
+    rows inside the band or without a reading keep the previous state, and
+    leading undecided rows count as OFF.
+    """
+    pressure = np.asarray(pressure, dtype='float64')
+    decision = np.zeros(len(pressure), dtype=np.int8)
+    with np.errstate(invalid='ignore'):
+        decision[pressure > threshold] = 1
+        decision[pressure <= threshold - max(hysteresis, 0.0)] = -1
+
+    # Forward-fill the last decision over undecided rows
+    decided_at = np.where(decision != 0, np.arange(len(decision)), -1)
+    np.maximum.accumulate(decided_at, out=decided_at)
+    held = np.where(decided_at >= 0, decision[np.maximum(decided_at, 0)], -1)
+    return held == 1
+
+
+class CompressorCycleIndex:
+    """
+    ON/OFF masks and run-length encoded cycle events for one pressure series.
+
+    Attributes:
+        on_mask / off_mask: boolean row masks (rows with a reading only)
+        state: held ON/OFF state per row, used for the event index
+        events: list of {'state', 'start_row', 'stop_row', 'duration_s'}
+                (stop_row is exclusive; duration_s is None without timestamps)
+    """
+
+    def __init__(self, pressure, threshold: float, hysteresis: float = 0.0,
+                 timestamps=None, sensor: Optional[str] = None):
+        self.threshold = float(threshold)
+        self.hysteresis = float(hysteresis or 0.0)
+        self.sensor = sensor
+
+        pressure = np.asarray(pressure, dtype='float64')
+        self.valid_mask = ~np.isnan(pressure)
+        self.state = compressor_state(pressure, self.threshold, self.hysteresis)
+        self.on_mask = self.state & self.valid_mask
+        self.off_mask = ~self.state & self.valid_mask
+
+        self._epoch = self._to_epoch_seconds(timestamps, len(pressure))
+        self.events = self._build_events()
+
+    @staticmethod
+    def _to_epoch_seconds(timestamps, n) -> Optional[np.ndarray]:
+        if timestamps is None or n == 0:
+            return None
+        try:
+            ts = pd.to_datetime(pd.Series(timestamps), errors='coerce')
+            if ts.isna().any():
+                return None
+            return ts.to_numpy(dtype='datetime64[ns]').view('int64') / 1e9
+        except Exception:
+            return None
+
+    def _build_events(self) -> List[Dict]:
+        n = len(self.state)
+        if n == 0:
+            return []
+        change_rows = np.flatnonzero(self.state[1:] != self.state[:-1]) + 1
+        starts = np.concatenate(([0], change_rows))
+        stops = np.concatenate((change_rows, [n]))
+
+        durations = None
+        if self._epoch is not None:
+            # A run lasts until the first sample of the next run; the last run
+            # is closed with the typical sample interval
+            step = float(np.median(np.diff(self._epoch))) if n > 1 else 0.0
+            ends = np.append(self._epoch[1:], self._epoch[-1] + step)
+            durations = ends[stops - 1] - self._epoch[starts]
+
+        return [
+            {
+                'state': 'ON' if self.state[start] else 'OFF',
+                'start_row': int(start),
+                'stop_row': int(stop),
+                'duration_s': float(durations[i]) if durations is not None else None,
+            }
+            for i, (start, stop) in enumerate(zip(starts, stops))
+        ]
+
+    @property
+    def total_rows(self) -> int:
+        return len(self.state)
+
+    @property
+    def on_rows(self) -> int:
+        return int(self.on_mask.sum())
+
+    @property
+    def on_percentage(self) -> float:
+        return (self.on_rows / self.total_rows * 100) if self.total_rows > 0 else 0.0
+
+    def cycle_stats(self) -> Dict[str, Optional[float]]:
+        """
+        Cycle statistics from the event index.
+
+        Mean ON/OFF times use runs that start and end inside the window when
+        there are any, since the first and last runs are usually truncated.
+        """
+        on_events = [e for e in self.events if e['state'] == 'ON']
+        off_events = [e for e in self.events if e['state'] == 'OFF']
+        stats = {
+            'cycles': len(on_events),
+            'on_time_pct': self.on_percentage,
+            'cycles_per_hour': None,
+            'mean_on_time_s': None,
+            'mean_off_time_s': None,
+        }
+        if self._epoch is None or not self.events:
+            return stats
+
+        span_s = sum(e['duration_s'] for e in self.events)
+        if span_s > 0:
+            stats['cycles_per_hour'] = len(on_events) / (span_s / 3600.0)
+
+        def mean_duration(events):
+            inner = [e for e in events if e['start_row'] > 0 and e['stop_row'] < self.total_rows]
+            chosen = inner or events
+            return float(np.mean([e['duration_s'] for e in chosen])) if chosen else None
+
+        stats['mean_on_time_s'] = mean_duration(on_events)
+        stats['mean_off_time_s'] = mean_duration(off_events)
+        return stats
+
+
+def build_cycle_index(df: pd.DataFrame, suction_sensor: Optional[str], threshold: float,
+                      hysteresis: float = 0.0) -> Optional[CompressorCycleIndex]:
+    """CompressorCycleIndex for df's suction pressure column, or None if it is missing."""
+    if df is None or not suction_sensor or suction_sensor not in df.columns:
+        return None
+    pressure = pd.to_numeric(df[suction_sensor], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    timestamps = df['Timestamp'] if 'Timestamp' in df.columns else None
+    return CompressorCycleIndex(pressure, threshold, hysteresis, timestamps=timestamps, sensor=suction_sensor)
@@ -0,0 +1,167 @@
+"""
+csv_cache.py
+
+Sidecar cache for parsed logger CSV files.
+
+DataManager.load_csv spends most of its time in pd.read_csv and in building
+the Timestamp column from Date+Time. The parsed, timestamp-normalized frame is
+stored next to the CSV as "<name>.csv.ddtcache" (Parquet) together with a
+small JSON key file "<name>.csv.ddtcache.json". Without pyarrow nothing is
+cached: the sidecar often sits on a shared drive, so it is never read with
+pickle, which can run arbitrary code.
+
+A cache entry is valid when the CSV's size and mtime still match the key. If
+only the mtime differs (file copied or touched), the content hash decides and
+the key is refreshed. Anything else is treated as stale and the caller falls
+back to parsing the CSV.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+import pandas as pd
+
+# Bump when the parsing pipeline changes in a way that alters the cached frame
+CACHE_FORMAT_VERSION = 3
+CACHE_SUFFIX = '.ddtcache'
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except Exception:
+        return False
+
+
+def cache_paths(csv_path: str):
+    """Return (data_path, key_path) of the sidecar cache for a CSV file."""
+    data_path = f"{csv_path}{CACHE_SUFFIX}"
+    return data_path, f"{data_path}.json"
+
+
+def hash_file(file_path: str) -> str:
+    """SHA-1 of the file contents, read in fixed-size blocks."""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def compute_file_key(file_path: str, with_hash: bool = True) -> Dict:
+    """Build the identity key (size, mtime, content hash) for a file."""
+    stat = os.stat(file_path)
+    key = {
+        'version': CACHE_FORMAT_VERSION,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha1': None,
+    }
+    if with_hash:
+        key['sha1'] = hash_file(file_path)
+    return key
+
+
+def _read_key(key_path: str) -> Optional[Dict]:
+    try:
+        with open(key_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _write_key(key_path: str, key: Dict) -> None:
+    tmp_path = f"{key_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(key, f, indent=2)
+    os.replace(tmp_path, key_path)
+
+
+def validate_cache(csv_path: str) -> Optional[Dict]:
+    """
+    Check the sidecar cache of csv_path against the current file.
+
+    Returns the (possibly refreshed) stored key if the cache is usable,
+    otherwise None.
+    """
+    data_path, key_path = cache_paths(csv_path)
+    if not os.path.exists(data_path) or not os.path.exists(key_path):
+        return None
+
+    stored = _read_key(key_path)
+    if not stored or stored.get('version') != CACHE_FORMAT_VERSION:
+        return None
+
+    current = compute_file_key(csv_path, with_hash=False)
+    if stored.get('size') != current['size']:
+        return None
+    if stored.get('mtime_ns') == current['mtime_ns']:
+        return stored
+
+    # Same size, different mtime: let the content hash decide
+    sha1 = hash_file(csv_path)
+    if sha1 != stored.get('sha1'):
+        return None
+    stored['mtime_ns'] = current['mtime_ns']
+    try:
+        _write_key(key_path, stored)
+    except Exception as e:
+        print(f"[CSV_CACHE] Could not refresh cache key: {e}")
+    return stored
+
+
+def load_cached_frame(csv_path: str) -> Optional[pd.DataFrame]:
+    """Return the cached parsed frame for csv_path, or None if missing/stale."""
+    if not _parquet_available():
+        return None
+    try:
+        stored = validate_cache(csv_path)
+        if stored is None or stored.get('format') != 'parquet':
+            return None
+        data_path, _ = cache_paths(csv_path)
+        df = pd.read_parquet(data_path)
+        print(f"[CSV_CACHE] Loaded {len(df)} rows from cache: {data_path}")
+        return df
+    except Exception as e:
+        print(f"[CSV_CACHE] Cache read failed, falling back to CSV: {e}")
+        return None
+
+
+def store_cached_frame(csv_path: str, df: pd.DataFrame, file_key: Optional[Dict] = None) -> bool:
+    """Write df as the sidecar cache of csv_path. Returns True on success."""
+    if df is None or not _parquet_available():
+        return False
+    data_path, key_path = cache_paths(csv_path)
+    tmp_path = f"{data_path}.tmp"
+    try:
+        key = dict(file_key) if file_key else compute_file_key(csv_path)
+        # Mixed-type object columns cannot always be stored as Parquet; then nothing is cached
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, data_path)
+        key['format'] = 'parquet'
+        key['rows'] = len(df)
+        _write_key(key_path, key)
+        print(f"[CSV_CACHE] Stored {len(df)} rows (parquet) in {data_path}")
+        return True
+    except Exception as e:
+        print(f"[CSV_CACHE] Could not write cache for {csv_path}: {e}")
+        try:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        except Exception:
+            pass
+        return False
+
+
+def clear_cache(csv_path: str) -> None:
+    """Remove the sidecar cache files for csv_path, if any."""
+    for path in cache_paths(csv_path):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except Exception as e:
+            print(f"[CSV_CACHE] Could not remove {path}: {e}")
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_datetime64_any_dtype
 import json
@@ -8,22 +9,152 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QPixmap
 from mapping_dialog import MappingDialog
 import sys
-from timestamp_diagnostics import log_conversion, compare_timestamps, verify_range_selection
-from timestamp_fixer import fix_ambiguous_dates
+from timestamp_diagnostics import log_conversion, compare_timestamps
+from timestamp_fixer import TimestampFixer, fix_ambiguous_dates
+from csv_cache import load_cached_frame, store_cached_frame
+from range_stats import RangeStatsIndex
+from compressor_cycles import build_cycle_index
 
 # Force stdout to flush immediately so logs appear in real-time
 sys.stdout.reconfigure(line_buffering=True) if hasattr(sys.stdout, 'reconfigure') else None
 
+
+def _copy_on_write_enabled():
+    """True when pandas copy-on-write makes positional slices safe to hand out."""
+    try:
+        if int(pd.__version__.split('.')[0]) >= 3:
+            return True
+        return pd.get_option('mode.copy_on_write') is True
+    except Exception:
+        return False
+
+
+def _share(df):
+    """
+    Hands out a cached frame without exposing it to caller modifications.
+    
+    Under copy-on-write a shallow copy is enough; otherwise a real copy is made.
+    """
+    if df is None:
+        return None
+    return df.copy(deep=not _copy_on_write_enabled())
+
+
+def _aggregate_snapshot(df):
+    """One-pass mean/min/max/last/count over the numeric columns of df (NaN-aware)."""
+    snapshot = {'mean': {}, 'min': {}, 'max': {}, 'last': {}, 'count': {}}
+    if df is None or df.empty:
+        return snapshot
+    numeric = df.select_dtypes(include='number')
+    if numeric.shape[1] == 0:
+        return snapshot
+    
+    values = numeric.to_numpy(dtype='float64', na_value=np.nan)
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    has_data = counts > 0
+    # Last valid row per column: first True when scanning the rows backwards
+    last_rows = len(values) - 1 - np.argmax(valid[::-1], axis=0)
+    last_values = values[last_rows, np.arange(values.shape[1])]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sums = np.where(valid, values, 0.0).sum(axis=0)
+        means = sums / counts
+        mins = np.where(valid, values, np.inf).min(axis=0)
+        maxs = np.where(valid, values, -np.inf).max(axis=0)
+    
+    for i, col in enumerate(numeric.columns):
+        snapshot['count'][col] = int(counts[i])
+        if has_data[i]:
+            snapshot['mean'][col] = float(means[i])
+            snapshot['min'][col] = float(mins[i])
+            snapshot['max'][col] = float(maxs[i])
+            snapshot['last'][col] = float(last_values[i])
+    return snapshot
+
+
+RESAMPLE_METHODS = ('mean', 'min', 'max', 'last')
+# Consumers that pick their own resolution; None = raw rows
+RESAMPLE_CONSUMERS = ('graph', 'calculations', 'comparison')
+DEFAULT_RESAMPLE_SETTINGS = {
+    'graph': {'rule': None, 'method': 'mean'},
+    'calculations': {'rule': '1min', 'method': 'mean'},
+    'comparison': {'rule': '1min', 'method': 'mean'},
+}
+
+# How the Calculations batch is run; kept apart from rated_inputs (data sheet values)
+DEFAULT_CALCULATION_SETTINGS = {
+    'property_backend': 'HEOS',  # CoolProp backend: 'HEOS', 'BICUBIC&HEOS', 'TTSE&HEOS' or 'TABLES'
+    'batch_workers': 0,  # Worker processes for large batches (0 = one per CPU core, 1 = serial)
+}
+
+
+def resample_frame(df, rule, method='mean'):
+    """
+    Downsamples df to one row per time bucket of width rule (e.g. '1min').
+    
+    Numeric columns get the bucket mean/min/max/last, other columns their last
+    value; Timestamp becomes the bucket start and empty buckets are dropped.
+    df itself is returned when it has no usable Timestamp column or its
+    samples are already at least rule apart (median spacing), so coarse
+    loggers are never upsampled or shifted.
+    """
+    if method not in RESAMPLE_METHODS:
+        raise ValueError(f"Unknown resample method '{method}' (expected one of {RESAMPLE_METHODS})")
+    width = pd.Timedelta(rule)
+    if df is None or df.empty or 'Timestamp' not in df.columns:
+        return df
+    timestamps = pd.to_datetime(df['Timestamp'], errors='coerce')
+    valid = timestamps.notna().to_numpy()
+    if valid.sum() < 2 or not timestamps[valid].sort_values().diff().median() < width:
+        return df
+    
+    data = df.loc[valid].drop(columns='Timestamp')
+    data.index = pd.DatetimeIndex(timestamps[valid])
+    numeric_cols = data.select_dtypes(include='number').columns
+    other_cols = [col for col in data.columns if col not in numeric_cols]
+    buckets = data[numeric_cols].resample(width)
+    out = getattr(buckets, method)()
+    if other_cols:
+        out = out.join(data[other_cols].resample(width).last())
+    out = out[buckets.size() > 0][list(data.columns)]
+    out.insert(0, 'Timestamp', out.index)
+    return out.reset_index(drop=True)
+
+
+def _epoch_ns(value):
+    """Nanoseconds since the epoch for a timestamp-like value (naive UTC for tz-aware)."""
+    ts = pd.Timestamp(value)
+    if ts.tz is not None:
+        ts = ts.tz_convert(None)
+    return ts.value
+
+
 class DataManager(QObject):
     """
     Centralized class to manage all application data, including sensor groups.
     """
     data_changed = pyqtSignal()
     diagram_model_changed = pyqtSignal()
+    load_progress = pyqtSignal(int)  # Percent of the CSV consumed by load_csv (0-100)
+    results_loaded = pyqtSignal(object)  # Stored calculation results matching the loaded session + CSV
+
+    # CSVs at or above this size are streamed in row chunks instead of read at once
+    STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
+    CSV_CHUNK_ROWS = 50000
+    # Number of memoized filter results kept (time ranges x on-time settings)
+    FILTER_CACHE_SIZE = 16
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
+        # False for headless use (batch_cli.py): never open dialogs
+        self.interactive = True
+        self._load_cancel_requested = False
+        # Bumped whenever csv_data or a filter input changes; part of every filter cache key
+        self._data_version = 0
+        self._filter_cache = {}
+        # Resampled csv_data per (rule, method); survives filter changes, not data changes
+        self._resample_cache = {}
         self._reset_state()
 
     def _reset_state(self):
@@ -53,12 +184,17 @@ class DataManager(QObject):
 
         # ON-time filtering settings
         self.on_time_threshold_psig = 40.0  # Default threshold for R290 low-temp systems
+        self.on_time_hysteresis_psig = 0.0  # ON above threshold, OFF again at threshold - hysteresis
         self.on_time_filtering_enabled = True
         self.on_time_percentage = 0.0
         self.on_time_row_count = 0
         self.total_row_count = 0
         self.aggregation_method = 'Average'
 
+        # Resolution each consumer reads get_filtered_data at (see resample_frame)
+        self.resample_settings = {k: dict(v) for k, v in DEFAULT_RESAMPLE_SETTINGS.items()}
+        self.calculation_settings = dict(DEFAULT_CALCULATION_SETTINGS)
+
         # Rated inputs for volumetric efficiency calculation (Step 1 from spec)
         # Updated for Goal-2C: Added rated_capacity and rated_power (7 total)
         self.rated_inputs = {
@@ -80,61 +216,189 @@ class DataManager(QObject):
         }
 
     # --- load_csv and reconcile_csv are unchanged ---
-    def load_csv(self, file_path):
+    def load_csv(self, file_path, use_cache=True, streaming=None):
         """
         Loads a CSV. If a config is already loaded, it triggers
         the reconciliation process.
+
+        The parsed, timestamp-normalized frame is kept in a sidecar cache
+        next to the CSV (see csv_cache.py); a second open of an unchanged
+        file skips parsing entirely.
+
+        streaming: True to read in chunks (progress + cancel), False to read
+        in one call, None to decide by file size (STREAMING_THRESHOLD_BYTES).
         """
         try:
+            new_csv_data = load_cached_frame(file_path) if use_cache else None
+            if new_csv_data is None:
+                if streaming is None:
+                    streaming = os.path.getsize(file_path) >= self.STREAMING_THRESHOLD_BYTES
+                if streaming:
+                    new_csv_data = self._read_csv_chunked(file_path)
+                    if new_csv_data is None:
+                        print(f"[LOAD_CSV] Load cancelled, keeping current data")
+                        return False
+                else:
+                    new_csv_data = self._read_csv_file(file_path)
+                if use_cache:
+                    store_cached_frame(file_path, new_csv_data)
+            else:
+                print(f"[LOAD_CSV] Using cached parse of {file_path}")
+            self.csv_path = file_path
+
+            new_sensor_list = [col for col in new_csv_data.columns if col != 'Timestamp'] 
+
+            print(f"[LOAD_CSV] config_path={self.config_path}, config_sensor_list has {len(self.config_sensor_list)} sensors")
+            print(f"[LOAD_CSV] new CSV has {len(new_sensor_list)} sensors")
+            
+            if self.config_path and self.config_sensor_list:
+                print(f"[LOAD_CSV] Triggering reconciliation...")
+                self.reconcile_csv(new_csv_data, new_sensor_list)
+            else:
+                print(f"[LOAD_CSV] Skipping reconciliation (no config loaded)")
+                self.csv_data = new_csv_data
+                self.data_changed.emit()
+            self._restore_stored_results()
+            return True
+        except Exception as e:
+            print(f"Error loading CSV file: {e}")
+            return False
+
+    def _read_csv_file(self, file_path):
+        """Parses a CSV file and builds the Timestamp column (uncached path)."""
+        self.load_progress.emit(0)
+        new_csv_data = pd.read_csv(file_path)
+        new_csv_data = self._build_timestamp_column(new_csv_data, fixer=TimestampFixer())
+        self.load_progress.emit(100)
+        return new_csv_data
+
+    def _read_csv_chunked(self, file_path, chunk_rows=None):
+        """
+        Streams a CSV in fixed-size row chunks, building timestamps per chunk.
+
+        Emits load_progress (percent of bytes consumed) after every chunk and
+        checks for cancel_csv_load() between chunks. Date/Time text columns are
+        dropped per chunk; only while the date format is still ambiguous (every
+        day so far <= 12) are they kept, so those chunks can be re-parsed once
+        a later chunk settles day- vs month-first. Peak memory is the parsed
+        chunks plus the final frame during the closing concat.
+
+        Returns the concatenated frame, or None if the load was cancelled.
+        """
+        chunk_rows = chunk_rows or self.CSV_CHUNK_ROWS
+        total_bytes = max(os.path.getsize(file_path), 1)
+        self._load_cancel_requested = False
+        self.load_progress.emit(0)
+
+        chunks = []
+        rows_read = 0
+        # One fixer per file: every chunk is parsed with the format inferred for this file
+        fixer = TimestampFixer()
+        # (chunk position, Date, Time, format used) of chunks parsed before the format was settled
+        unsettled = []
+        with open(file_path, 'rb') as f:
+            reader = pd.read_csv(f, chunksize=chunk_rows)
+            for i, chunk in enumerate(reader):
+                raw = None
+                if not fixer.format_confirmed and {'Date', 'Time'} <= set(chunk.columns) and 'Timestamp' not in chunk.columns:
+                    raw = (chunk['Date'], chunk['Time'])
+                chunk = self._build_timestamp_column(chunk, verbose=(i == 0), fixer=fixer)
+                chunks.append(chunk)
+                rows_read += len(chunk)
+                if raw is not None:
+                    unsettled.append((len(chunks) - 1, raw[0], raw[1], fixer.inferred_format))
+                if fixer.format_confirmed and unsettled:
+                    self._reparse_unsettled_chunks(chunks, unsettled, fixer)
+                    unsettled = []
+
+                percent = min(99, int(f.tell() * 100 / total_bytes))
+                print(f"[LOAD_CSV] Streamed chunk {i + 1}: {rows_read} rows ({percent}%)")
+                self.load_progress.emit(percent)
+
+                if self._load_cancel_requested:
+                    print(f"[LOAD_CSV] Streaming load cancelled after {rows_read} rows")
+                    self._load_cancel_requested = False
+                    return None
+
+        if not chunks:
             new_csv_data = pd.read_csv(file_path)
+        else:
+            new_csv_data = pd.concat(chunks, ignore_index=True)
+        del chunks
+        print(f"[LOAD_CSV] Streaming load complete: {new_csv_data.shape}")
+        self.load_progress.emit(100)
+        return new_csv_data
+
+    def _reparse_unsettled_chunks(self, chunks, unsettled, fixer):
+        """Re-parses the timestamps of chunks read before fixer settled on another date format."""
+        for position, date, time, used_format in unsettled:
+            if used_format == fixer.inferred_format:
+                continue
+            print(f"[LOAD_CSV] Re-parsing timestamps of chunk {position + 1} with '{fixer.inferred_format}'")
+            chunks[position]['Timestamp'] = fix_ambiguous_dates(date, time, fixer=fixer)
+
+    def cancel_csv_load(self):
+        """Requests cancellation of a streaming CSV load (checked between chunks)."""
+        self._load_cancel_requested = True
+
+    def _build_timestamp_column(self, new_csv_data, verbose=True, fixer=None):
+        """
+        Creates/normalizes the Timestamp column and moves it to the front.
+        
+        fixer is the TimestampFixer of the file being loaded (shared by its
+        chunks); None uses a fresh one.
+        """
+        if verbose:
             print(f"[LOAD_CSV] CSV columns: {list(new_csv_data.columns)}")
-            
-            # Handle timestamp column creation
-            if 'Timestamp' in new_csv_data.columns:
-                # Already has Timestamp column
-                try:
-                    new_csv_data['Timestamp'] = pd.to_datetime(new_csv_data['Timestamp'], errors='coerce')
-                    print(f"[LOAD_CSV] Parsed existing Timestamp column successfully")
-                except Exception:
-                    print(f"[LOAD_CSV] Failed to parse existing Timestamp column")
-                    pass
-            elif 'Date' in new_csv_data.columns and 'Time' in new_csv_data.columns:
-                # Combine Date and Time columns to create Timestamp
-                try:
+
+        # Handle timestamp column creation
+        if 'Timestamp' in new_csv_data.columns:
+            # Already has Timestamp column
+            try:
+                new_csv_data['Timestamp'] = pd.to_datetime(new_csv_data['Timestamp'], errors='coerce')
+                print(f"[LOAD_CSV] Parsed existing Timestamp column successfully")
+            except Exception:
+                print(f"[LOAD_CSV] Failed to parse existing Timestamp column")
+                pass
+        elif 'Date' in new_csv_data.columns and 'Time' in new_csv_data.columns:
+            # Combine Date and Time columns to create Timestamp
+            try:
+                if verbose:
                     print(f"[LOAD_CSV] Found Date and Time columns, combining them...")
                     print(f"[LOAD_CSV] Sample Date values: {new_csv_data['Date'].head(3).tolist()}")
                     print(f"[LOAD_CSV] Sample Time values: {new_csv_data['Time'].head(3).tolist()}")
                     
                     # Convert Date and Time to strings and combine
-                    date_str = new_csv_data['Date'].astype(str)
-                    time_str = new_csv_data['Time'].astype(str)
-                    timestamp_str = date_str + ' ' + time_str
-                    print(f"[LOAD_CSV] Sample combined timestamp strings: {timestamp_str.head(3).tolist()}")
+                    sample = new_csv_data[['Date', 'Time']].head(3).astype(str)
+                    timestamp_str = sample['Date'] + ' ' + sample['Time']
+                    print(f"[LOAD_CSV] Sample combined timestamp strings: {timestamp_str.tolist()}")
                     
                     # CRITICAL FIX: Use intelligent timestamp fixing
                     print(f"[LOAD_CSV] Using intelligent timestamp fixing...")
-                    new_csv_data['Timestamp'] = fix_ambiguous_dates(
-                        new_csv_data['Date'], 
-                        new_csv_data['Time']
-                    )
-                    
+                new_csv_data['Timestamp'] = fix_ambiguous_dates(
+                    new_csv_data['Date'], 
+                    new_csv_data['Time'],
+                    fixer=fixer
+                )
+                
+                if verbose:
                     print(f"[LOAD_CSV] Created Timestamp column from Date and Time columns")
                     print(f"[LOAD_CSV] Sample timestamps: {new_csv_data['Timestamp'].head(3).tolist()}")
                     print(f"[LOAD_CSV] Timestamp column created successfully: {new_csv_data['Timestamp'].dtype}")
-                    
+                
                     # Verify the timestamp range makes sense
                     if not new_csv_data['Timestamp'].dropna().empty:
                         first_ts = new_csv_data['Timestamp'].dropna().iloc[0]
                         last_ts = new_csv_data['Timestamp'].dropna().iloc[-1]
                         print(f"[LOAD_CSV] Timestamp range: {first_ts} to {last_ts}")
                         print(f"[LOAD_CSV] Duration: {last_ts - first_ts}")
-                        
+                    
                         # Check for reasonable date range (not in distant future)
                         current_year = pd.Timestamp.now().year
                         if first_ts.year > current_year + 1:
                             print(f"[LOAD_CSV] WARNING: Data appears to be from future year {first_ts.year}")
                             print(f"[LOAD_CSV] This may indicate incorrect year parsing")
-                    
+                
                     # DIAGNOSTIC: Log the timestamp creation
                     log_conversion(
                         stage="DATA_LOAD",
@@ -144,42 +408,28 @@ class DataManager(QObject):
                         result_dtype=str(new_csv_data['Timestamp'].dtype),
                         sample_values=new_csv_data['Timestamp'].head(3).tolist()
                     )
-                    
-                    # Move Timestamp to the front
-                    cols = ['Timestamp'] + [col for col in new_csv_data.columns if col not in ['Timestamp', 'Date', 'Time']]
-                    new_csv_data = new_csv_data[cols]
+
+                # Move Timestamp to the front
+                cols = ['Timestamp'] + [col for col in new_csv_data.columns if col not in ['Timestamp', 'Date', 'Time']]
+                new_csv_data = new_csv_data[cols]
+                if verbose:
                     print(f"[LOAD_CSV] Reordered columns, new shape: {new_csv_data.shape}")
                     print(f"[LOAD_CSV] New column order: {list(new_csv_data.columns[:5])}...")
-                except Exception as e:
-                    print(f"[LOAD_CSV] Failed to create Timestamp from Date and Time: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Fallback: use first column as timestamp if it looks like a datetime
-                    first_col = new_csv_data.columns[0]
-                    try:
-                        new_csv_data['Timestamp'] = pd.to_datetime(new_csv_data[first_col], errors='coerce')
-                        print(f"[LOAD_CSV] Created Timestamp from first column: {first_col}")
-                    except Exception:
-                        print(f"[LOAD_CSV] No suitable timestamp column found")
-            else:
-                print(f"[LOAD_CSV] No 'Timestamp' column or Date/Time columns found in CSV")
-            
-            new_sensor_list = [col for col in new_csv_data.columns if col != 'Timestamp'] 
+            except Exception as e:
+                print(f"[LOAD_CSV] Failed to create Timestamp from Date and Time: {e}")
+                import traceback
+                traceback.print_exc()
+                # Fallback: use first column as timestamp if it looks like a datetime
+                first_col = new_csv_data.columns[0]
+                try:
+                    new_csv_data['Timestamp'] = pd.to_datetime(new_csv_data[first_col], errors='coerce')
+                    print(f"[LOAD_CSV] Created Timestamp from first column: {first_col}")
+                except Exception:
+                    print(f"[LOAD_CSV] No suitable timestamp column found")
+        else:
+            print(f"[LOAD_CSV] No 'Timestamp' column or Date/Time columns found in CSV")
 
-            print(f"[LOAD_CSV] config_path={self.config_path}, config_sensor_list has {len(self.config_sensor_list)} sensors")
-            print(f"[LOAD_CSV] new CSV has {len(new_sensor_list)} sensors")
-            
-            if self.config_path and self.config_sensor_list:
-                print(f"[LOAD_CSV] Triggering reconciliation...")
-                self.reconcile_csv(new_csv_data, new_sensor_list)
-            else:
-                print(f"[LOAD_CSV] Skipping reconciliation (no config loaded)")
-                self.csv_data = new_csv_data
-                self.data_changed.emit()
-            return True
-        except Exception as e:
-            print(f"Error loading CSV file: {e}")
-            return False
+        return new_csv_data
 
     def reconcile_csv(self, new_csv_data, new_sensor_list):
         """
@@ -206,9 +456,15 @@ class DataManager(QObject):
             self.data_changed.emit()
             return
 
-        dialog = MappingDialog(orphaned, new, matched, parent=self.parent)
-        if dialog.exec():
-            user_mappings = dialog.get_mappings()  # old_config_name -> new_csv_name
+        if self.interactive:
+            dialog = MappingDialog(orphaned, new, matched, parent=self.parent)
+            accepted = dialog.exec()
+        else:
+            # Nobody to ask: keep matched names, leave orphaned sensors unmapped
+            print(f"[RECONCILE_CSV] Non-interactive: {len(orphaned)} orphaned sensors left unmapped")
+            dialog, accepted = None, True
+        if accepted:
+            user_mappings = dialog.get_mappings() if dialog is not None else {}  # old_config_name -> new_csv_name
             
             # Update old mappings dict (legacy system)
             new_mappings_dict = {}
@@ -295,6 +551,8 @@ class DataManager(QObject):
             self.sensor_ranges = session_data.get('sensorRanges', {})
             # Load graph sensors (which sensors are checked for graphing)
             self.graph_sensors = set(session_data.get('graphSensors', []))
+            # Load per-consumer resample settings
+            self.resample_settings = self._load_resample_settings(session_data.get('resampleSettings'))
             # Load rated inputs
             self.rated_inputs = session_data.get('ratedInputs', {
                 'm_dot_rated_lbhr': None,
@@ -303,6 +561,15 @@ class DataManager(QObject):
                 'rated_evap_temp_f': None,
                 'rated_return_gas_temp_f': None,
             })
+            self.calculation_settings = self._load_calculation_settings(session_data.get('calculationSettings'))
+            # Saved eta_vol (Step 1) result: reopening skips recalculating it
+            if session_data.get('etaVol'):
+                try:
+                    from calculation_engine import restore_eta_vol_record
+                    if restore_eta_vol_record(session_data['etaVol']):
+                        print(f"[LOAD] Restored eta_vol = {session_data['etaVol']['result']['eta_vol']:.4f}")
+                except Exception as e:
+                    print(f"[LOAD] Could not restore eta_vol: {e}")
 
             # Load diagram model - preserve existing structure
             default_diagram_model = {
@@ -399,12 +666,14 @@ class DataManager(QObject):
                 if current_csv_sensors and self.config_sensor_list:
                     print(f"[LOAD_SESSION] CSV already loaded. Checking for sensor name differences...")
                     self.reconcile_csv(self.csv_data, current_csv_sensors)
+                    self._restore_stored_results()
                     return True  # reconcile_csv emits signals
             
             # Don't automatically load CSV - let user load it manually
 
             self.diagram_model_changed.emit()
             self.data_changed.emit()
+            self._restore_stored_results()
             return True
         except Exception as e:
             print(f"Error loading session file: {e}")
@@ -553,6 +822,7 @@ class DataManager(QObject):
     def set_time_range(self, time_range):
         """Sets the time range filter for data display."""
         self.time_range = time_range
+        self.invalidate_filter_cache(data_modified=False)
         self.data_changed.emit()
     
     def set_custom_time_range(self, start_timestamp, end_timestamp):
@@ -585,6 +855,7 @@ class DataManager(QObject):
         print(f"  End: {self.custom_time_range['end']}")
         print(f"  Duration: {self.custom_time_range['end'] - self.custom_time_range['start']}")
         
+        self.invalidate_filter_cache(data_modified=False)
         self.data_changed.emit()
     
     def get_custom_time_range(self):
@@ -596,6 +867,90 @@ class DataManager(QObject):
         self.value_aggregation = aggregation
         self.data_changed.emit()
     
+    def set_on_time_threshold(self, threshold_psig, enabled=None, hysteresis_psig=None):
+        """Sets the ON-time suction pressure threshold (and optionally filtering and hysteresis)."""
+        self.on_time_threshold_psig = float(threshold_psig)
+        if enabled is not None:
+            self.on_time_filtering_enabled = bool(enabled)
+        if hysteresis_psig is not None:
+            self.on_time_hysteresis_psig = max(float(hysteresis_psig), 0.0)
+        self.invalidate_filter_cache(data_modified=False)
+        self.data_changed.emit()
+    
+    # --- Filter result cache ---
+    def invalidate_filter_cache(self, data_modified=True):
+        """
+        Drops all memoized filter results. Call after modifying csv_data in place.
+        
+        Filter-setting changes pass data_modified=False, which keeps the
+        range statistics index (it depends on csv_data only).
+        """
+        self._data_version += 1
+        self._filter_cache.clear()
+        if data_modified:
+            self._range_index = None
+            self._resample_cache.clear()
+    
+    def _time_range_key(self):
+        """Hashable description of the active time window."""
+        if self.time_range == 'Custom' and self.custom_time_range:
+            return ('Custom', self.custom_time_range.get('start'), self.custom_time_range.get('end'))
+        return (self.time_range,)
+    
+    def _cached_filter(self, key, compute):
+        """
+        Returns the memoized result of compute() for key, computing it on a miss.
+        
+        Keys are prefixed with the data version, so anything cached before the
+        last load/reconcile/range/threshold change is never returned.
+        """
+        key = (self._data_version,) + key
+        try:
+            return self._filter_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable custom range values; skip memoization
+            return compute()
+        result = compute()
+        self._filter_cache[key] = result
+        while len(self._filter_cache) > self.FILTER_CACHE_SIZE:
+            self._filter_cache.pop(next(iter(self._filter_cache)))
+        return result
+    
+    def _find_suction_sensor(self):
+        """Returns the sensor mapped to the first Compressor's SP port, or None."""
+        from port_resolver import resolve_mapped_sensor
+        model = self.diagram_model
+        for comp_id, comp in model.get('components', {}).items():
+            if comp.get('type') == 'Compressor':
+                suction_sensor = resolve_mapped_sensor(model, 'Compressor', comp_id, 'SP')
+                if suction_sensor:
+                    return suction_sensor
+        return None
+    
+    def get_compressor_cycles(self, threshold_psig=None):
+        """
+        Returns the CompressorCycleIndex of the current time window, or None.
+        
+        This is the single ON/OFF definition used by the on-time filter, the
+        pressure threshold filter and the calculation output export. It holds
+        the row masks (aligned with get_filtered_data()) plus the cycle event
+        index. threshold_psig defaults to on_time_threshold_psig; the
+        hysteresis is always on_time_hysteresis_psig. The result is cached
+        with the filter results and must not be modified.
+        """
+        threshold = self.on_time_threshold_psig if threshold_psig is None else float(threshold_psig)
+        suction_sensor = self._find_suction_sensor()
+        key = ('cycles', self._time_range_key(), suction_sensor, threshold, self.on_time_hysteresis_psig)
+        return self._cached_filter(key, lambda: build_cycle_index(
+            self._time_filtered_data(), suction_sensor, threshold, self.on_time_hysteresis_psig))
+    
+    def get_cycle_statistics(self):
+        """Cycles/hour, mean ON and OFF time and % ON for the current window (None if SP is unmapped)."""
+        cycles = self.get_compressor_cycles()
+        return cycles.cycle_stats() if cycles is not None else None
+    
     def filter_by_pressure_threshold(self, threshold_psig):
         """
         Filters time-range filtered data by suction pressure threshold.
@@ -603,32 +958,26 @@ class DataManager(QObject):
         Respects the current time_range selection (All Data, 1 Hour, etc).
         
         Args:
-            threshold_psig: Minimum suction pressure threshold in PSI
+            threshold_psig: Suction pressure threshold in PSI
             
         Returns:
-            DataFrame with rows where suction pressure >= threshold_psig, or None if sensor not found
+            DataFrame with the compressor-OFF rows at this threshold (suction
+            pressure at or below it), or None if sensor not found
         """
+        suction_sensor = self._find_suction_sensor()
+        key = ('pressure', self._time_range_key(), threshold_psig, self.on_time_hysteresis_psig, suction_sensor)
+        return _share(self._cached_filter(
+            key, lambda: self._compute_pressure_filtered_data(threshold_psig, suction_sensor)))
+    
+    def _compute_pressure_filtered_data(self, threshold_psig, suction_sensor):
+        """Uncached body of filter_by_pressure_threshold."""
         # Get time-range filtered data (respects current time_range selection)
-        df = self.get_filtered_data()
+        df = self._time_filtered_data()
         
         if df is None or df.empty:
             print(f"[PRESSURE_FILTER] No time-filtered data available")
             return None
         
-        # Find suction pressure sensor from Compressor SP port mapping
-        model = self.diagram_model
-        components = model.get('components', {})
-        suction_sensor = None
-        
-        # Search for Compressor component and get its SP (suction pressure) port mapping
-        for comp_id, comp in components.items():
-            if comp.get('type') == 'Compressor':
-                from port_resolver import resolve_mapped_sensor
-                suction_sensor = resolve_mapped_sensor(model, 'Compressor', comp_id, 'SP')
-                if suction_sensor:
-                    print(f"[PRESSURE_FILTER] Found suction pressure sensor: {suction_sensor}")
-                    break
-        
         if not suction_sensor:
             print(f"[PRESSURE_FILTER] ERROR: Suction pressure sensor not mapped to Compressor SP port")
             print(f"[PRESSURE_FILTER] Please map suction pressure sensor in the Diagram tab first")
@@ -644,11 +993,12 @@ class DataManager(QObject):
         print(f"[PRESSURE_FILTER] Threshold: {threshold_psig} PSI")
         
         try:
-            # Filter rows where suction pressure < threshold (BELOW threshold)
-            filtered_df = df[df[suction_sensor] < threshold_psig].copy()
+            # Compressor-OFF rows (BELOW threshold) from the shared cycle index
+            cycles = self.get_compressor_cycles(threshold_psig)
+            filtered_df = df[cycles.off_mask]
             
             print(f"[PRESSURE_FILTER] Time-filtered rows: {len(df)}")
-            print(f"[PRESSURE_FILTER] Pressure-filtered rows (< {threshold_psig}): {len(filtered_df)} ({len(filtered_df)/len(df)*100:.1f}%)")
+            print(f"[PRESSURE_FILTER] Pressure-filtered rows (<= {threshold_psig}): {len(filtered_df)} ({len(filtered_df)/len(df)*100:.1f}%)")
             
             return filtered_df
             
@@ -661,62 +1011,154 @@ class DataManager(QObject):
     def get_on_time_filtered_data(self):
         """
         Returns DataFrame with only 'compressor ON' rows.
-        Filters by: Suction Pressure > threshold
+        Filters by: Suction Pressure > threshold (see get_compressor_cycles)
         """
-        df = self.get_filtered_data()  # Get time-filtered data first
+        suction_sensor = self._find_suction_sensor()
+        key = ('on_time', self._time_range_key(), self.on_time_filtering_enabled,
+               self.on_time_threshold_psig, self.on_time_hysteresis_psig, suction_sensor)
+        on_time_df, stats = self._cached_filter(
+            key, lambda: self._compute_on_time_filtered_data(suction_sensor))
+        if stats is not None:
+            # Store for UI display
+            self.on_time_percentage, self.on_time_row_count, self.total_row_count = stats
+        return _share(on_time_df)
+    
+    def _compute_on_time_filtered_data(self, suction_sensor):
+        """Uncached body of get_on_time_filtered_data; returns (frame, (pct, on_rows, total_rows))."""
+        df = self._time_filtered_data()
         
         if df is None or df.empty:
-            return None
+            return None, None
         
         if not self.on_time_filtering_enabled:
             # If filtering is disabled, return all data but still calculate stats
-            self.on_time_percentage = 100.0
-            self.on_time_row_count = len(df)
-            self.total_row_count = len(df)
-            return df
-        
-        # Find suction pressure sensor from compressor SP port
-        model = self.diagram_model
-        components = model.get('components', {})
-        suction_sensor = None
-        
-        for comp_id, comp in components.items():
-            if comp.get('type') == 'Compressor':
-                from port_resolver import resolve_mapped_sensor
-                suction_sensor = resolve_mapped_sensor(model, 'Compressor', comp_id, 'SP')
-                if suction_sensor:
-                    break
+            return df, (100.0, len(df), len(df))
         
-        if not suction_sensor or suction_sensor not in df.columns:
+        cycles = self.get_compressor_cycles()
+        if cycles is None:
             print(f"[ON-TIME] Warning: Suction pressure sensor not mapped or not in CSV")
             # Return all data if sensor not available
-            self.on_time_percentage = 100.0
-            self.on_time_row_count = len(df)
-            self.total_row_count = len(df)
-            return df
-        
-        # Filter rows where suction pressure > threshold
-        on_time_df = df[df[suction_sensor] > self.on_time_threshold_psig].copy()
+            return df, (100.0, len(df), len(df))
         
-        # Calculate % On-Time
-        total_rows = len(df)
-        on_rows = len(on_time_df)
-        on_time_pct = (on_rows / total_rows * 100) if total_rows > 0 else 0
+        on_time_df = df[cycles.on_mask]
         
-        print(f"[ON-TIME] Total rows: {total_rows}, ON rows: {on_rows}, % ON: {on_time_pct:.1f}%")
+        print(f"[ON-TIME] Total rows: {cycles.total_rows}, ON rows: {cycles.on_rows}, % ON: {cycles.on_percentage:.1f}%")
         print(f"[ON-TIME] Threshold: {self.on_time_threshold_psig} psig, Sensor: {suction_sensor}")
         
-        # Store for UI display
-        self.on_time_percentage = on_time_pct
-        self.on_time_row_count = on_rows
-        self.total_row_count = total_rows
-        
-        return on_time_df
+        return on_time_df, (cycles.on_percentage, cycles.on_rows, cycles.total_rows)
     
-    def get_filtered_data(self):
+    def get_filtered_data(self, consumer=None):
         """
         Returns the CSV data filtered by the current time range.
         Returns the full dataframe if no valid timestamp column or if 'All Data' is selected.
+        
+        consumer ('graph', 'calculations', 'comparison') selects that
+        consumer's resample setting; None always returns raw rows.
+        
+        Results are memoized per data version and time window; every caller
+        gets its own copy-on-write handle, so modifying it never touches the
+        cached frame or csv_data.
+        """
+        rule, method = self.get_resample(consumer)
+        if rule is None:
+            return _share(self._time_filtered_data())
+        key = ('time_resampled', self._time_range_key(), rule, method)
+        return _share(self._cached_filter(key, lambda: self._compute_resampled_window(rule, method)))
+    
+    # --- Resample stage (between load and filter) ---
+    def get_resample(self, consumer):
+        """(rule, method) used for consumer; rule None means raw data."""
+        setting = self.resample_settings.get(consumer) if consumer else None
+        if not setting:
+            return None, 'mean'
+        return setting.get('rule'), setting.get('method', 'mean')
+    
+    def set_resample(self, consumer, rule, method='mean'):
+        """Sets the resolution (e.g. '1min', None = raw) and bucket statistic for a consumer."""
+        if consumer not in RESAMPLE_CONSUMERS:
+            raise ValueError(f"Unknown consumer '{consumer}' (expected one of {RESAMPLE_CONSUMERS})")
+        if method not in RESAMPLE_METHODS:
+            raise ValueError(f"Unknown resample method '{method}' (expected one of {RESAMPLE_METHODS})")
+        if rule is not None and pd.Timedelta(rule) <= pd.Timedelta(0):
+            raise ValueError(f"Resample rule must be a positive duration, got '{rule}'")
+        self.resample_settings[consumer] = {'rule': rule, 'method': method}
+        self.data_changed.emit()
+    
+    def _load_resample_settings(self, saved):
+        """Resample settings from a session, falling back to the defaults per consumer."""
+        settings = {k: dict(v) for k, v in DEFAULT_RESAMPLE_SETTINGS.items()}
+        for consumer, setting in (saved or {}).items():
+            if consumer in settings and isinstance(setting, dict):
+                try:
+                    rule = setting.get('rule')
+                    if rule is not None:
+                        pd.Timedelta(rule)
+                    if setting.get('method', 'mean') in RESAMPLE_METHODS:
+                        settings[consumer] = {'rule': rule, 'method': setting.get('method', 'mean')}
+                except (ValueError, TypeError):
+                    print(f"[RESAMPLE] Ignoring invalid setting for {consumer}: {setting}")
+        return settings
+    
+    def _load_calculation_settings(self, saved):
+        """Calculation settings from a session; older sessions kept them inside ratedInputs."""
+        settings = dict(DEFAULT_CALCULATION_SETTINGS)
+        legacy = {key: self.rated_inputs.pop(key) for key in DEFAULT_CALCULATION_SETTINGS if key in self.rated_inputs}
+        for key, value in {**legacy, **(saved or {})}.items():
+            if key in settings and value is not None:
+                settings[key] = value
+        return settings
+    
+    def get_resampled_data(self, rule, method='mean'):
+        """
+        The whole csv_data resampled to rule (see resample_frame).
+        
+        Computed once per (rule, method) and kept until csv_data changes;
+        time-range and threshold changes reuse it. Treat as read-only.
+        """
+        return self._resampled(rule, method)[0]
+    
+    def _resampled(self, rule, method):
+        """(frame, epoch_ns) of the resampled csv_data; csv_data itself when nothing is gained."""
+        key = (pd.Timedelta(rule), method)
+        if key not in self._resample_cache:
+            resampled = resample_frame(self.csv_data, rule, method)
+            if resampled is self.csv_data:
+                entry = (self.csv_data, self._time_index)
+            else:
+                entry = self._index_csv_data(resampled)
+                print(f"[RESAMPLE] {len(self.csv_data)} rows -> {len(resampled)} rows ({rule} {method})")
+            self._resample_cache[key] = entry
+        return self._resample_cache[key]
+    
+    def _compute_resampled_window(self, rule, method):
+        """The current time window cut from the resampled frame (buckets overlapping the raw window)."""
+        frame, epoch = self._resampled(rule, method)
+        if frame is self.csv_data:
+            return self._time_filtered_data()
+        lo, hi = self._time_window_rows()
+        raw_epoch = self._time_index
+        if raw_epoch is None or (lo == 0 and hi >= len(self.csv_data)):
+            return frame
+        hi = min(hi, len(raw_epoch))
+        if hi <= lo or epoch is None:
+            return frame.iloc[0:0]
+        start = raw_epoch[lo] - pd.Timedelta(rule).value
+        r_lo = int(np.searchsorted(epoch, start, side='right'))
+        r_hi = int(np.searchsorted(epoch, raw_epoch[hi - 1], side='right'))
+        rows = frame.iloc[r_lo:r_hi]
+        return rows if _copy_on_write_enabled() else rows.copy()
+    
+    def _time_filtered_data(self):
+        """Memoized time-window frame shared by the filter methods; wrap with _share before handing out."""
+        return self._cached_filter(('time', self._time_range_key()), self._compute_filtered_data)
+    
+    def _compute_filtered_data(self):
+        """
+        Uncached body of get_filtered_data.
+        
+        Time windows are resolved with searchsorted on the sorted epoch index
+        built when csv_data is assigned, and the result is a positional slice
+        of csv_data rather than a masked copy.
         """
         print(f"[FILTERED_DATA] Called with time_range: {self.time_range}")
         
@@ -725,31 +1167,21 @@ class DataManager(QObject):
             return None
         
         print(f"[FILTERED_DATA] CSV data shape: {self.csv_data.shape}")
-        print(f"[FILTERED_DATA] CSV data columns: {list(self.csv_data.columns)[:5]}...")  # Only show first 5 columns
         
-        # If "All Data" is selected, return everything (as copy to avoid caching issues)
+        total_rows = len(self.csv_data)
+        
+        # If "All Data" is selected, return everything
         if self.time_range == 'All Data':
-            print(f"[FILTERED_DATA] Returning all data ({len(self.csv_data)} rows)")
-            return self.csv_data.copy()  # FIXED: Return copy instead of reference
+            print(f"[FILTERED_DATA] Returning all data ({total_rows} rows)")
+            return self._slice_rows(0, total_rows)
+        
+        epoch = self._time_index
         
         # If "Custom" is selected, use custom time range if available
         if self.time_range == 'Custom':
             print(f"[FILTERED_DATA] Custom time range selected")
-            if self.custom_time_range and 'Timestamp' in self.csv_data.columns:
+            if self.custom_time_range and epoch is not None and len(epoch) > 0:
                 try:
-                    df = self.csv_data.copy()
-                    
-                    # DIAGNOSTIC: Log original data timestamps
-                    log_conversion(
-                        stage="FILTER_DATA_ORIGINAL",
-                        description="Original data timestamps before filtering",
-                        value=df['Timestamp'],
-                        row_count=len(df)
-                    )
-                    
-                    if not is_datetime64_any_dtype(df['Timestamp']):
-                        df['Timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce')
-                    
                     # Convert custom range to pandas timestamps
                     start_time = pd.to_datetime(self.custom_time_range['start'])
                     end_time = pd.to_datetime(self.custom_time_range['end'])
@@ -770,50 +1202,29 @@ class DataManager(QObject):
                         original_type=type(self.custom_time_range['end']).__name__
                     )
                     
-                    # Compare the filter values with actual data
-                    compare_timestamps(
-                        "Start time vs First data point",
-                        start_time,
-                        df['Timestamp'].iloc[0]
-                    )
-                    compare_timestamps(
-                        "End time vs Last data point",
-                        end_time,
-                        df['Timestamp'].iloc[-1]
-                    )
+                    first_ts = self.csv_data['Timestamp'].iloc[0]
+                    last_ts = self.csv_data['Timestamp'].iloc[len(epoch) - 1]
+                    compare_timestamps("Start time vs First data point", start_time, first_ts)
+                    compare_timestamps("End time vs Last data point", end_time, last_ts)
                     
                     print(f"[CUSTOM RANGE] Applying filter: {start_time} to {end_time}")
-                    print(f"[CUSTOM RANGE] Data timestamp range: {df['Timestamp'].min()} to {df['Timestamp'].max()}")
+                    print(f"[CUSTOM RANGE] Data timestamp range: {first_ts} to {last_ts}")
                     
-                    # Apply the filter
-                    filtered_df = df[(df['Timestamp'] >= start_time) & (df['Timestamp'] <= end_time)]
+                    lo, hi = self._rows_between(start_time, end_time)
+                    filtered_df = self._slice_rows(lo, hi)
                     
                     print(f"[CUSTOM RANGE] Filtered from {start_time} to {end_time}, {len(filtered_df)} rows")
                     if len(filtered_df) > 0:
-                        print(f"[CUSTOM RANGE] Filtered data range: {filtered_df['Timestamp'].min()} to {filtered_df['Timestamp'].max()}")
-                        
-                        # DIAGNOSTIC: Log filtered result
-                        log_conversion(
-                            stage="FILTER_DATA_RESULT",
-                            description="Filtered data timestamps",
-                            value=filtered_df['Timestamp'],
-                            row_count=len(filtered_df),
-                            expected_count=len(df[(df['Timestamp'] >= start_time) & (df['Timestamp'] <= end_time)])
-                        )
-                        
-                        # DIAGNOSTIC: Comprehensive verification
-                        verify_range_selection(df, filtered_df, start_time, end_time)
+                        print(f"[CUSTOM RANGE] Filtered data range: {filtered_df['Timestamp'].iloc[0]} to {filtered_df['Timestamp'].iloc[-1]}")
                     else:
                         print(f"[CUSTOM RANGE] WARNING: Filtered result is EMPTY!")
                         # Log why filtering failed
                         print(f"[CUSTOM RANGE] Debug info:")
-                        print(f"  Data start: {df['Timestamp'].min()}")
-                        print(f"  Data end: {df['Timestamp'].max()}")
+                        print(f"  Data start: {first_ts}")
+                        print(f"  Data end: {last_ts}")
                         print(f"  Filter start: {start_time}")
                         print(f"  Filter end: {end_time}")
-                        print(f"  Data dtype: {df['Timestamp'].dtype}")
-                        print(f"  Filter start dtype: {type(start_time)}")
-                        print(f"  Filter end dtype: {type(end_time)}")
+                        print(f"  Data dtype: {self.csv_data['Timestamp'].dtype}")
                     
                     return filtered_df
                 except Exception as e:
@@ -824,120 +1235,201 @@ class DataManager(QObject):
                 print(f"[FILTERED_DATA] No custom time range or no Timestamp column, returning all data")
                 if not self.custom_time_range:
                     print(f"[FILTERED_DATA] custom_time_range is None")
-                if 'Timestamp' not in self.csv_data.columns:
-                    print(f"[FILTERED_DATA] Timestamp column not found in CSV data")
-            return self.csv_data.copy()
+                if epoch is None:
+                    print(f"[FILTERED_DATA] No usable Timestamp column in CSV data")
+            return self._slice_rows(0, total_rows)
+        
+        # Check if we have a usable Timestamp column
+        if epoch is None or len(epoch) == 0:
+            print(f"[FILTERED_DATA] No valid Timestamp column found, returning all data")
+            return self._slice_rows(0, total_rows)
+        
+        # Get the time range mapping
+        time_ranges = {
+            '1 Hour': 1,
+            '3 Hours': 3,
+            '8 Hours': 8,
+            '16 Hours': 16
+        }
+        
+        hours = time_ranges.get(self.time_range)
+        if hours is None:
+            print(f"[FILTERED_DATA] Unknown time range: {self.time_range}, returning all data")
+            return self._slice_rows(0, total_rows)
+        
+        # The index is sorted, so the last valid timestamp is the maximum
+        last_timestamp = pd.Timestamp(int(epoch[-1]))
+        cutoff_time = last_timestamp - pd.Timedelta(hours=hours)
+        lo = int(np.searchsorted(epoch, cutoff_time.value, side='left'))
+        
+        print(f"[DATA FILTER] Time range: {self.time_range} ({hours} hours)")
+        print(f"[DATA FILTER] Time span: {cutoff_time.strftime('%Y-%m-%d %H:%M:%S')} to {last_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"[DATA FILTER] Total rows: {total_rows}, Filtered rows: {len(epoch) - lo}")
+        
+        return self._slice_rows(lo, len(epoch))
+    
+    def _rows_between(self, start_time, end_time):
+        """Positional (lo, hi) bounds of the rows with start_time <= Timestamp <= end_time (None = open end)."""
+        epoch = self._time_index
+        if epoch is None:
+            return 0, 0
+        lo = 0 if start_time is None else int(np.searchsorted(epoch, _epoch_ns(start_time), side='left'))
+        hi = len(epoch) if end_time is None else int(np.searchsorted(epoch, _epoch_ns(end_time), side='right'))
+        return lo, max(lo, hi)
+    
+    def _time_window_rows(self):
+        """
+        Positional (lo, hi) bounds of the current time window, without diagnostics.
         
-        # Check if we have a Timestamp column
-        if 'Timestamp' not in self.csv_data.columns:
-            print(f"[FILTERED_DATA] No Timestamp column found, returning all data")
-            print(f"[FILTERED_DATA] Available columns: {list(self.csv_data.columns)}")
-            return self.csv_data.copy()
+        Mirrors _compute_filtered_data: 'All Data', unknown ranges and missing
+        timestamps cover every row.
+        """
+        total_rows = len(self.csv_data) if self.csv_data is not None else 0
+        epoch = self._time_index
+        if self.time_range == 'All Data' or epoch is None or len(epoch) == 0:
+            return 0, total_rows
+        if self.time_range == 'Custom':
+            if not self.custom_time_range:
+                return 0, total_rows
+            try:
+                return self._rows_between(self.custom_time_range['start'], self.custom_time_range['end'])
+            except Exception:
+                return 0, total_rows
+        hours = {'1 Hour': 1, '3 Hours': 3, '8 Hours': 8, '16 Hours': 16}.get(self.time_range)
+        if hours is None:
+            return 0, total_rows
+        cutoff_time = pd.Timestamp(int(epoch[-1])) - pd.Timedelta(hours=hours)
+        return int(np.searchsorted(epoch, cutoff_time.value, side='left')), len(epoch)
+    
+    def get_range_statistics(self, sensor_names, start_time=None, end_time=None):
+        """
+        Returns {sensor: {'count', 'mean', 'std', 'min', 'max'}} for a time window.
+        
+        With no start/end the current time range is used. Answers come from
+        the prefix-sum index in range_stats, so they cost the same for a
+        minute or a month of data and are cheap enough to refresh while the
+        graph's range region is being dragged. Non-numeric or unknown sensors
+        map to None.
+        """
+        if self.csv_data is None or self.csv_data.empty:
+            return {name: None for name in sensor_names}
+        if self._range_index is None:
+            self._range_index = RangeStatsIndex(self.csv_data)
+        if start_time is None and end_time is None:
+            lo, hi = self._time_window_rows()
+        else:
+            lo, hi = self._rows_between(start_time, end_time)
+        return self._range_index.stats_for(sensor_names, lo, hi)
+    
+    def _slice_rows(self, start, stop):
+        """
+        Positional slice of csv_data handed out by get_filtered_data.
+        
+        With pandas copy-on-write the slice shares memory with csv_data until a
+        caller modifies it; without it we keep the old defensive copy.
+        """
+        rows = self.csv_data.iloc[start:stop]
+        return rows if _copy_on_write_enabled() else rows.copy()
+    
+    @property
+    def csv_data(self):
+        """The loaded CSV frame, kept sorted by Timestamp."""
+        return self._csv_data
+    
+    @csv_data.setter
+    def csv_data(self, new_csv_data):
+        self._csv_data, self._time_index = self._index_csv_data(new_csv_data)
+        self.invalidate_filter_cache()
+    
+    def _index_csv_data(self, df):
+        """
+        Sorts df by Timestamp and builds the epoch index used by get_filtered_data.
         
+        The sort is stable with NaT rows last and keeps the original index
+        labels; already ordered logger files are left untouched. Returns
+        (df, epoch_ns) where epoch_ns is an int64 array of the leading non-NaT
+        timestamps, or (df, None) if there is no usable Timestamp column.
+        """
+        if df is None or df.empty or 'Timestamp' not in df.columns:
+            return df, None
         try:
-            # Always work with a fresh copy to avoid any caching issues
-            df = self.csv_data.copy()
-            
-            # Ensure Timestamp column is datetime type
             if not is_datetime64_any_dtype(df['Timestamp']):
-                print(f"[FILTERED_DATA] Converting Timestamp column to datetime...")
-                df['Timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce')
-                # Check if conversion was successful
-                if df['Timestamp'].isna().all():
-                    print(f"[FILTERED_DATA] ERROR: Timestamp conversion failed - all values are NaT")
-                    return self.csv_data.copy()
-            
-            # Get the time range mapping
-            time_ranges = {
-                '1 Hour': 1,
-                '3 Hours': 3,
-                '8 Hours': 8,
-                '16 Hours': 16
-            }
-            
-            hours = time_ranges.get(self.time_range)
-            if hours is None:
-                print(f"[FILTERED_DATA] Unknown time range: {self.time_range}, returning all data")
-                return self.csv_data.copy()
-            
-            # Get the last timestamp and calculate the cutoff time
-            last_timestamp = df['Timestamp'].max()
-            cutoff_time = last_timestamp - pd.Timedelta(hours=hours)
+                converted = pd.to_datetime(df['Timestamp'], errors='coerce')
+                if converted.isna().all():
+                    return df, None
+                df = df.assign(Timestamp=converted)
             
-            print(f"[DATA FILTER] Time range: {self.time_range} ({hours} hours)")
-            print(f"[DATA FILTER] Last timestamp: {last_timestamp}")
-            print(f"[DATA FILTER] Cutoff time: {cutoff_time}")
-            print(f"[DATA FILTER] Time span: {cutoff_time.strftime('%Y-%m-%d %H:%M:%S')} to {last_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+            # pandas 3 parses to datetime64[us]; the graph's int64 // 10**9 epoch
+            # conversions assume nanoseconds
+            if df['Timestamp'].dt.tz is None and df['Timestamp'].dtype != 'datetime64[ns]':
+                df = df.assign(Timestamp=df['Timestamp'].astype('datetime64[ns]'))
             
-            # Filter the data
-            filtered_df = df[df['Timestamp'] >= cutoff_time].copy()
-            
-            # Debug output
-            print(f"[DATA FILTER] Total rows: {len(self.csv_data)}, Filtered rows: {len(filtered_df)}")
-            
-            if len(filtered_df) == 0:
-                print(f"[DATA FILTER] WARNING: Filter resulted in 0 rows! Returning all data")
-                return self.csv_data.copy()
-            
-            # Show a sample of the first and last filtered timestamps
-            if len(filtered_df) > 0:
-                first_ts = filtered_df['Timestamp'].iloc[0]
-                last_ts = filtered_df['Timestamp'].iloc[-1]
-                print(f"[DATA FILTER] First filtered row: {first_ts}")
-                print(f"[DATA FILTER] Last filtered row: {last_ts}")
-            
-            return filtered_df
+            if not df['Timestamp'].is_monotonic_increasing:
+                df = df.sort_values('Timestamp', kind='stable', na_position='last')
+                print(f"[TIME_INDEX] Sorted {len(df)} rows by Timestamp")
             
+            timestamps = df['Timestamp']
+            if getattr(timestamps.dt, 'tz', None) is not None:
+                timestamps = timestamps.dt.tz_convert(None)
+            valid_rows = int(timestamps.notna().sum())
+            epoch = timestamps.to_numpy(dtype='datetime64[ns]')[:valid_rows].view('int64')
+            return df, epoch
         except Exception as e:
-            print(f"[FILTERED_DATA] ERROR filtering data by time range: {e}")
-            import traceback
-            traceback.print_exc()
-            return self.csv_data.copy()
+            print(f"[TIME_INDEX] Could not build time index: {e}")
+            return df, None
+    
+    # Maps value_aggregation to the snapshot statistic used by get_sensor_value
+    AGGREGATION_STATS = {'Average': 'mean', 'Maximum': 'max', 'Minimum': 'min'}
+    
+    def get_aggregate_snapshot(self, on_time_only=False):
+        """
+        Returns mean/min/max/last/count for every numeric column of the filtered data.
+        
+        The snapshot is computed in one vectorized pass over the frame and
+        memoized with the filter results, so repeated port lookups are plain
+        dictionary reads: snapshot['mean'][sensor_name]. Columns without any
+        valid value are missing from every statistic except 'count'.
+        Treat the returned dict as read-only.
+        """
+        if on_time_only:
+            key = ('snapshot_on_time', self._time_range_key(), self.on_time_filtering_enabled,
+                   self.on_time_threshold_psig, self._find_suction_sensor())
+            source = lambda: self.get_on_time_filtered_data()
+        else:
+            key = ('snapshot', self._time_range_key())
+            source = self._time_filtered_data
+        return self._cached_filter(key, lambda: _aggregate_snapshot(source()))
     
     def get_sensor_value(self, sensor_name):
         """Returns the aggregated value for a sensor from filtered CSV data based on the aggregation method."""
-        print(f"[SENSOR_VALUE] Getting value for sensor: {sensor_name}")
-        
-        filtered_data = self.get_filtered_data()
-        print(f"[SENSOR_VALUE] Filtered data status: {filtered_data is not None}")
-        if filtered_data is not None:
-            print(f"[SENSOR_VALUE] Filtered data shape: {filtered_data.shape}")
-            print(f"[SENSOR_VALUE] Filtered data columns: {list(filtered_data.columns)}")
+        stat = self.AGGREGATION_STATS.get(self.value_aggregation, 'last')
+        snapshot = self.get_aggregate_snapshot()
+        if sensor_name in snapshot[stat]:
+            return snapshot[stat][sensor_name]
         
-        if filtered_data is not None and sensor_name in filtered_data.columns:
-            print(f"[SENSOR_VALUE] Sensor found in filtered data")
-            sensor_data = filtered_data[sensor_name].dropna()
-            print(f"[SENSOR_VALUE] Sensor data after dropna: {len(sensor_data)} values")
-            
-            if not sensor_data.empty:
-                if self.value_aggregation == 'Average':
-                    result = sensor_data.mean()
-                    print(f"[SENSOR_VALUE] Average calculated: {result}")
-                    return result
-                elif self.value_aggregation == 'Maximum':
-                    result = sensor_data.max()
-                    print(f"[SENSOR_VALUE] Maximum calculated: {result}")
-                    return result
-                elif self.value_aggregation == 'Minimum':
-                    result = sensor_data.min()
-                    print(f"[SENSOR_VALUE] Minimum calculated: {result}")
-                    return result
-                else:
-                    result = sensor_data.iloc[-1]  # Fallback to last value
-                    print(f"[SENSOR_VALUE] Last value: {result}")
-                    return result
-            else:
-                print(f"[SENSOR_VALUE] Sensor data is empty after dropna()")
-        else:
-            if filtered_data is None:
-                print(f"[SENSOR_VALUE] Filtered data is None")
-            elif sensor_name not in filtered_data.columns:
-                print(f"[SENSOR_VALUE] Sensor '{sensor_name}' not found in filtered data columns")
+        # Non-numeric columns are not part of the snapshot; aggregate them directly
+        filtered_data = self._time_filtered_data()
+        if filtered_data is None or sensor_name not in filtered_data.columns:
+            print(f"[SENSOR_VALUE] Sensor '{sensor_name}' not found in filtered data")
+            return None
+        if snapshot['count'].get(sensor_name) == 0:
+            return None
         
-        print(f"[SENSOR_VALUE] Returning None for sensor: {sensor_name}")
-        return None
-
-    
+        sensor_data = filtered_data[sensor_name].dropna()
+        if sensor_data.empty:
+            print(f"[SENSOR_VALUE] Sensor data is empty after dropna()")
+            return None
+        try:
+            if stat == 'mean':
+                return sensor_data.mean()
+            if stat == 'max':
+                return sensor_data.max()
+            if stat == 'min':
+                return sensor_data.min()
+        except Exception as e:
+            print(f"[SENSOR_VALUE] Cannot aggregate '{sensor_name}': {e}")
+            return None
+        return sensor_data.iloc[-1]  # Fallback to last value
     
     def get_data_info(self):
         """
@@ -1065,8 +1557,11 @@ class DataManager(QObject):
                 "sensorGroups": self._prepare_sensor_groups(),
                 "groupStates": self._prepare_group_states(),
                 "ratedInputs": self.rated_inputs,  # Save rated inputs for volumetric efficiency calculation
+                "calculationSettings": self.calculation_settings,  # Property backend etc. (not data sheet values)
+                "etaVol": self._prepare_eta_vol(),  # Step 1 result for ratedInputs (restored on load)
                 "diagramModel": sanitized_diagram,  # Save diagram designer data (sanitized)
                 "graphSensors": list(self.graph_sensors),  # Save which sensors are checked for graphing
+                "resampleSettings": self.resample_settings,  # Per-consumer resolution (rule None = raw)
                 "ui": {
                     "selectedSensors": list(self.selected_sensors),
                     "currentMode": self.current_mode,
@@ -1729,6 +2224,88 @@ class DataManager(QObject):
             
         return group_states
     
+    def _prepare_eta_vol(self):
+        """Prepares the eta_vol record for the current rated inputs (None if unavailable)."""
+        try:
+            from calculation_engine import eta_vol_record
+            if 'error' in self.get_eta_vol():
+                return None
+            return eta_vol_record(self.rated_inputs, self.refrigerant)
+        except Exception as e:
+            print(f"[SAVE] Could not store eta_vol: {e}")
+            return None
+    
+    def get_eta_vol(self):
+        """
+        Step 1 result (eta_vol, method, warnings, ...) for the current rated inputs.
+        
+        Memoized per (rated inputs, refrigerant) and restored from the session,
+        so this is instant unless the rated inputs just changed.
+        """
+        from calculation_engine import cached_volumetric_efficiency
+        return cached_volumetric_efficiency(self.rated_inputs or {}, self.refrigerant or 'R290')
+    
+    # --- Stored calculation results (see results_cache.py) ---
+    def results_key(self, inputs=None):
+        """
+        Key of the Calculations batch for the current CSV, time window and
+        resolution plus the resolved batch inputs (sensor map, eta_vol,
+        compressor specs, refrigerant, property backend); None without a CSV
+        file or when the inputs cannot be prepared.
+        
+        inputs is the prepare_batch_inputs() result of the run being keyed;
+        None prepares it from the current state.
+        """
+        csv_path = getattr(self, 'csv_path', None)
+        if not csv_path or not os.path.isfile(csv_path) or self.csv_data is None or self.csv_data.empty:
+            return None
+        if inputs is None:
+            from calculation_orchestrator import prepare_batch_inputs
+            inputs = prepare_batch_inputs(self, self.get_filtered_data(consumer='calculations'))
+        if 'error' in inputs:
+            return None
+        from calculation_engine import ENGINE_VERSION
+        from results_cache import build_results_key, csv_content_hash
+        return build_results_key(
+            csv_content_hash(csv_path),
+            self.csv_data.columns,
+            inputs,
+            self._time_range_key(),
+            self.get_resample('calculations'),
+            ENGINE_VERSION,
+        )
+    
+    def store_results(self, results_df, key=None):
+        """Saves Calculations results beside the CSV under key (default: the current key)."""
+        try:
+            from results_cache import store_results
+            key = key or self.results_key()
+            if key is None:
+                return False
+            return store_results(self.csv_path, results_df, key)
+        except Exception as e:
+            print(f"[RESULTS] Could not store results: {e}")
+            return False
+    
+    def load_stored_results(self):
+        """Stored Calculations results valid for the current state, or None."""
+        try:
+            from results_cache import has_stored_results, load_results
+            if not has_stored_results(getattr(self, 'csv_path', None)):
+                return None
+            key = self.results_key()
+            return load_results(self.csv_path, key) if key else None
+        except Exception as e:
+            print(f"[RESULTS] Could not load stored results: {e}")
+            return None
+    
+    def _restore_stored_results(self):
+        """Hands matching stored results to the Calculations / P-h tabs after a load."""
+        results_df = self.load_stored_results()
+        if results_df is not None:
+            print(f"[RESULTS] Restored {len(results_df)} calculated rows without recalculating")
+            self.results_loaded.emit(results_df)
+    
     def _index_to_excel_column(self, index):
         """Converts a 0-based column index to Excel column letter(s)."""
         result = ""
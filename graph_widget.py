@@ -92,7 +92,7 @@ class GraphWidget(QWidget):
             return
 
         # Use filtered data based on time range
-        df = self.data_manager.get_filtered_data()
+        df = self.data_manager.get_filtered_data(consumer='graph')
         sensors_to_plot = self.data_manager.graph_sensors
 
         print(f"[GRAPH_UPDATE] Data check - df: {df is not None}, sensors: {sensors_to_plot}, empty: {df.empty if df is not None else 'N/A'}")
@@ -178,6 +178,7 @@ class GraphWidget(QWidget):
         
         print(f"[GRAPH_UPDATE] Setting up stats table with {len(sensors_to_plot)} sensors")
         self.stats_table.setRowCount(len(sensors_to_plot))
+        range_stats = self.data_manager.get_range_statistics(list(sensors_to_plot))
         
         print(f"[GRAPH_UPDATE] Starting to plot {len(sensors_to_plot)} sensors")
         for i, sensor_name in enumerate(sensors_to_plot):
@@ -211,25 +212,48 @@ class GraphWidget(QWidget):
             color_item.setBackground(pg.mkColor(colors[i % len(colors)]))
             self.stats_table.setItem(i, 1, color_item)
             
-            # Calculate stats
-            if sensor_name in df.columns:
-                valid_data = df[sensor_name].dropna()
-                if not valid_data.empty:
-                    avg_val = valid_data.mean()
-                    min_val = valid_data.min()
-                    max_val = valid_data.max()
-                    delta_val = max_val - min_val
+            # Stats come from the DataManager's range index (no per-sensor rescan)
+            self._set_stats_row(i, range_stats.get(sensor_name))
 
-                    self.stats_table.setItem(i, 2, QTableWidgetItem(f"{avg_val:.2f}"))
-                    self.stats_table.setItem(i, 3, QTableWidgetItem(f"{min_val:.2f}"))
-                    self.stats_table.setItem(i, 4, QTableWidgetItem(f"{max_val:.2f}"))
-                    self.stats_table.setItem(i, 5, QTableWidgetItem(f"{delta_val:.2f}"))
-                else:
-                    for j in range(2, 6):
-                        self.stats_table.setItem(i, j, QTableWidgetItem("N/A"))
-            else:
-                for j in range(2, 6):
-                    self.stats_table.setItem(i, j, QTableWidgetItem("N/A"))
+    def _set_stats_row(self, row, stats):
+        """Fills the Avg/Min/Max/Delta cells of a stats table row."""
+        if not stats or not stats.get('count'):
+            for j in range(2, 6):
+                self.stats_table.setItem(row, j, QTableWidgetItem("N/A"))
+            return
+        min_val = stats['min']
+        max_val = stats['max']
+        self.stats_table.setItem(row, 2, QTableWidgetItem(f"{stats['mean']:.2f}"))
+        self.stats_table.setItem(row, 3, QTableWidgetItem(f"{min_val:.2f}"))
+        self.stats_table.setItem(row, 4, QTableWidgetItem(f"{max_val:.2f}"))
+        self.stats_table.setItem(row, 5, QTableWidgetItem(f"{max_val - min_val:.2f}"))
+
+    def _region_to_local_datetimes(self, start_unix, end_unix):
+        """Converts range region x values (UTC-shifted Unix seconds) back to naive local datetimes."""
+        import time
+        offset_sec = time.altzone if time.daylight else time.timezone
+        start_dt = pd.to_datetime(start_unix, unit='s') - pd.Timedelta(seconds=offset_sec)
+        end_dt = pd.to_datetime(end_unix, unit='s') - pd.Timedelta(seconds=offset_sec)
+        return start_dt, end_dt
+
+    def update_region_stats(self):
+        """Live stats for the range region while it is dragged (before Apply)."""
+        if not self.range_region:
+            return
+        try:
+            start_dt, end_dt = self._region_to_local_datetimes(*self.range_region.getRegion())
+            self._refresh_stats_table(start_dt, end_dt)
+        except Exception as e:
+            print(f"[GRAPH RANGE] Could not update live range stats: {e}")
+
+    def _refresh_stats_table(self, start_dt=None, end_dt=None):
+        """Re-fills the stats of the sensors listed in the table (current time range if no bounds)."""
+        rows = [(row, self.stats_table.item(row, 0).text())
+                for row in range(self.stats_table.rowCount())
+                if self.stats_table.item(row, 0) is not None]
+        range_stats = self.data_manager.get_range_statistics([name for _, name in rows], start_dt, end_dt)
+        for row, sensor_name in rows:
+            self._set_stats_row(row, range_stats.get(sensor_name))
 
     def export_graph(self):
         """Exports the current graph view to an image file."""
@@ -260,12 +284,13 @@ class GraphWidget(QWidget):
                 hoverPen=pg.mkPen(color=QColor(255, 165, 0), width=5)  # Orange on hover
             )
             self.plot_widget.addItem(self.range_region)
+            self.range_region.sigRegionChanged.connect(self.update_region_stats)
             
             # Enable apply button
             self.apply_range_btn.setEnabled(True)
             
             # Position the region based on actual data timestamps if available
-            df = self.data_manager.get_filtered_data()
+            df = self.data_manager.get_filtered_data(consumer='graph')
             if df is not None and 'Timestamp' in df.columns:
                 try:
                     timestamps = pd.to_datetime(df['Timestamp']).astype('int64') // 10**9
@@ -299,6 +324,9 @@ class GraphWidget(QWidget):
                 self.plot_widget.removeItem(self.range_region)
                 self.range_region = None
             
+            # Back to the stats of the applied time range
+            self._refresh_stats_table()
+            
             # Disable apply button
             self.apply_range_btn.setEnabled(False)
     
@@ -326,7 +354,7 @@ class GraphWidget(QWidget):
         )
         
         # Get the data to determine if we're using timestamps or indices
-        df = self.data_manager.get_filtered_data()
+        df = self.data_manager.get_filtered_data(consumer='graph')
         if df is None or df.empty:
             print(f"[GRAPH RANGE] No data available")
             return
@@ -9,7 +9,7 @@ Updated for Goal-2C to include rated capacity and rated power.
 """
 
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QDoubleSpinBox,
-                             QDialogButtonBox, QLabel, QGroupBox)
+                             QDialogButtonBox, QLabel, QGroupBox, QComboBox, QSpinBox)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
@@ -42,6 +42,14 @@ class InputDialog(QDialog):
         ('rated_return_gas_temp_f', 'Rated Return Gas Temperature (°F)'),
     ]
 
+    # CoolProp backend choices: (internal_name, user-friendly_label)
+    BACKEND_CHOICES = [
+        ('HEOS', 'HEOS (exact)'),
+        ('BICUBIC&HEOS', 'BICUBIC&HEOS (tabular, fast)'),
+        ('TTSE&HEOS', 'TTSE&HEOS (tabular, fastest)'),
+        ('TABLES', 'Engine tables (interpolated, fastest)'),
+    ]
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Enter Rated Performance Inputs")
@@ -99,6 +107,30 @@ class InputDialog(QDialog):
         input_group.setLayout(form_layout)
         layout.addWidget(input_group)
 
+        # Calculation settings (not part of the data sheet values)
+        settings_group = QGroupBox("Calculation Settings")
+        settings_layout = QFormLayout()
+        settings_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        self.backend_combo = QComboBox()
+        for backend_name, backend_label in self.BACKEND_CHOICES:
+            self.backend_combo.addItem(backend_label, backend_name)
+        self.backend_combo.setToolTip(
+            "Tabular backends interpolate precomputed CoolProp tables: much faster,\n"
+            "slightly less accurate. Use 'Backend Accuracy' in the Calculations tab to compare."
+        )
+        settings_layout.addRow("Property Backend:", self.backend_combo)
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(0, 64)
+        self.workers_spin.setSpecialValueText("Auto (one per CPU core)")
+        self.workers_spin.setAlignment(Qt.AlignmentFlag.AlignRight)
+        self.workers_spin.setToolTip(
+            "Worker processes for large batch calculations. 1 = single core.\n"
+            "Small data sets always run on a single core."
+        )
+        settings_layout.addRow("Worker Processes:", self.workers_spin)
+        settings_group.setLayout(settings_layout)
+        layout.addWidget(settings_group)
+
         # Button box (OK / Cancel)
         button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
@@ -122,6 +154,23 @@ class InputDialog(QDialog):
             data[field_name] = None if value == 0.0 else value
         return data
 
+    def get_settings(self) -> dict:
+        """Calculation settings chosen in the dialog (stored apart from the rated inputs)."""
+        return {
+            'property_backend': self.backend_combo.currentData(),
+            'batch_workers': self.workers_spin.value(),
+        }
+
+    def set_settings(self, settings: dict):
+        """Pre-select the calculation settings."""
+        settings = settings or {}
+        backend_index = self.backend_combo.findData(settings.get('property_backend') or 'HEOS')
+        self.backend_combo.setCurrentIndex(max(backend_index, 0))
+        try:
+            self.workers_spin.setValue(int(settings.get('batch_workers') or 0))
+        except (ValueError, TypeError):
+            self.workers_spin.setValue(0)
+
     def set_data(self, data: dict):
         """
         Pre-fill the spinboxes with existing data.
@@ -13,7 +13,7 @@ Points per module (averaged across full columns):
 Returns enthalpy h in kJ/kg and pressure P in kPa for each point.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import numpy as np
 import pandas as pd
 import logging
@@ -23,6 +23,8 @@ try:
 except Exception:
     PropsSI = None
 
+from property_backend import get_property_backend
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,22 +71,29 @@ def _f_to_k(temp_f: float) -> float:
     return (temp_f + 459.67) * 5.0 / 9.0
 
 
-def _enthalpy_kj_kg(temp_f: float, P_pa: float, refrigerant: str) -> float:
+def _enthalpy_kj_kg(temp_f: float, P_pa: float, refrigerant: str, backend: Optional[str] = None) -> float:
     if PropsSI is None:
         return np.nan
     T_K = _f_to_k(temp_f)
     if np.isnan(T_K) or np.isnan(P_pa) or P_pa <= 0:
         return np.nan
     try:
+        if backend:
+            # Property backend by name, e.g. 'TABLES' for the engine's interpolation tables
+            return float(get_property_backend(refrigerant, backend).props_pt(P_pa, T_K)[0] / 1000.0)
         return float(PropsSI('H', 'T', T_K, 'P', P_pa, refrigerant) / 1000.0)
     except Exception:
         return np.nan
 
 
-def compute_averaged_points(df: pd.DataFrame, refrigerant: str = 'R290') -> Dict[str, Dict[str, Dict[str, float]]]:
+def compute_averaged_points(df: pd.DataFrame, refrigerant: str = 'R290',
+                            backend: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
     """
     Compute averaged P–h points for LH/CTR/RH modules.
 
+    backend optionally selects a property backend (see property_backend);
+    the default evaluates with CoolProp PropsSI.
+
     Returns:
         {
           'LH': { 'T1b': {'h': .., 'P': ..}, 'T2b': {...}, 'T3b': {...}, 'T4b': {...} },
@@ -135,9 +144,9 @@ def compute_averaged_points(df: pd.DataFrame, refrigerant: str = 'R290') -> Dict
         # Per latest requirement: point 1b keeps the same enthalpy (x) as T4b,
         # but uses suction pressure for y. So x = h(T4b@Pcond), y = Psuc.
         # We first compute h_T4b at Pcond, then reuse that value for 1b.x
-        h_T2b = _enthalpy_kj_kg(T2b_f, P_suc_pa, refrigerant)
-        h_T3b = _enthalpy_kj_kg(T3b_f, P_cond_pa, refrigerant)
-        h_T4b = _enthalpy_kj_kg(T4b_f, P_cond_pa, refrigerant)
+        h_T2b = _enthalpy_kj_kg(T2b_f, P_suc_pa, refrigerant, backend)
+        h_T3b = _enthalpy_kj_kg(T3b_f, P_cond_pa, refrigerant, backend)
+        h_T4b = _enthalpy_kj_kg(T4b_f, P_cond_pa, refrigerant, backend)
         h_T1b = h_T4b
 
         out[module]['T1b'] = {'h': h_T1b, 'P': (P_suc_pa / 1000.0 if not np.isnan(P_suc_pa) else np.nan)}
@@ -10,14 +10,18 @@ import pandas as pd
 from CoolProp.CoolProp import PropsSI
 import warnings
 
+from property_backend import get_property_backend
+
 warnings.filterwarnings('ignore')
 
 
 class PhDiagramGenerator:
     """Generates P-h diagram data for R290 refrigeration cycles."""
     
-    def __init__(self, refrigerant='R290'):
+    def __init__(self, refrigerant='R290', backend=None):
         self.refrigerant = refrigerant
+        # Optional property backend name (e.g. 'TABLES') for vectorized saturation data
+        self.backend = backend
         
     def generate_saturation_data(self, P_min_kpa=100, P_max_kpa=4500, num_points=50):
         """
@@ -35,30 +39,19 @@ class PhDiagramGenerator:
                                    np.log10(P_max_kpa * 1000), 
                                    num_points)
         pressures_kpa = pressures_pa / 1000
-        
-        h_liquid = []
-        h_vapor = []
-        valid_pressures = []
-        
-        for P_pa in pressures_pa:
-            try:
-                # Saturated liquid (Q=0)
-                h_f = PropsSI('H', 'P', P_pa, 'Q', 0, self.refrigerant) / 1000  # kJ/kg
-                # Saturated vapor (Q=1)
-                h_g = PropsSI('H', 'P', P_pa, 'Q', 1, self.refrigerant) / 1000  # kJ/kg
-                
-                # Only include valid points
-                if 0 < h_f < 1000 and 0 < h_g < 1000:
-                    h_liquid.append(h_f)
-                    h_vapor.append(h_g)
-                    valid_pressures.append(P_pa / 1000)  # Convert back to kPa
-            except:
-                pass
-        
+
+        # Saturated liquid (Q=0) and vapor (Q=1) through the shared saturation
+        # cache; without an explicit backend this is exact HEOS
+        props = get_property_backend(self.refrigerant, self.backend)
+        h_f = props.props_pq(pressures_pa, 0.0)[1] / 1000  # kJ/kg
+        h_g = props.props_pq(pressures_pa, 1.0)[1] / 1000
+
+        # Only include valid points
+        valid = (h_f > 0) & (h_f < 1000) & (h_g > 0) & (h_g < 1000)
         return {
-            'pressures': np.array(valid_pressures),
-            'h_liquid': np.array(h_liquid),
-            'h_vapor': np.array(h_vapor)
+            'pressures': pressures_kpa[valid],
+            'h_liquid': h_f[valid],
+            'h_vapor': h_g[valid]
         }
     
     def extract_cycle_data(self, filtered_df):
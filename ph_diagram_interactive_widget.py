@@ -17,6 +17,7 @@ from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
 from ph_diagram_generator import PhDiagramGenerator
+from property_backend import TABLE_BACKEND
 
 
 class PhDiagramInteractiveWidget(QWidget):
@@ -28,7 +29,7 @@ class PhDiagramInteractiveWidget(QWidget):
     def __init__(self, data_manager):
         super().__init__()
         self.data_manager = data_manager
-        self.generator = PhDiagramGenerator('R290')
+        self.generator = PhDiagramGenerator('R290', backend=TABLE_BACKEND)
         
         self.current_data = None
         self.sat_data = None
@@ -9,6 +9,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from CoolProp.CoolProp import PropsSI
 from matplotlib.patches import Rectangle
+from property_backend import get_property_backend
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -16,8 +17,10 @@ warnings.filterwarnings('ignore')
 class PhDiagramPlotter:
     """Generates P-h diagrams for R290 with circuit-specific overlays."""
     
-    def __init__(self, refrigerant='R290'):
+    def __init__(self, refrigerant='R290', backend=None):
         self.refrigerant = refrigerant
+        # Optional property backend name (e.g. 'TABLES') for vectorized background lines
+        self.backend = backend
         self.T_crit = PropsSI('Tcrit', refrigerant)  # Critical temperature [K]
         self.P_crit = PropsSI('Pcrit', refrigerant)  # Critical pressure [Pa]
         
@@ -43,19 +46,12 @@ class PhDiagramPlotter:
             h_sat_liquid, h_sat_vapor, P_sat arrays
         """
         pressures = np.logspace(np.log10(P_min), np.log10(P_max), num_points)
-        h_f = []  # Saturated liquid enthalpy
-        h_g = []  # Saturated vapor enthalpy
-        
-        for P in pressures:
-            try:
-                h_f_val = PropsSI('H', 'P', P, 'Q', 0, self.refrigerant) / 1000  # Convert to kJ/kg
-                h_g_val = PropsSI('H', 'P', P, 'Q', 1, self.refrigerant) / 1000
-                h_f.append(h_f_val)
-                h_g.append(h_g_val)
-            except:
-                pass
-        
-        return np.array(h_f), np.array(h_g), pressures  # Return pressure in Pa
+        # Shared saturation cache; exact HEOS unless a backend was given
+        props = get_property_backend(self.refrigerant, self.backend)
+        h_f = props.props_pq(pressures, 0.0)[1] / 1000  # Convert to kJ/kg
+        h_g = props.props_pq(pressures, 1.0)[1] / 1000
+        valid = ~np.isnan(h_f) & ~np.isnan(h_g)
+        return h_f[valid], h_g[valid], pressures[valid]  # Return pressure in Pa
     
     def get_isotherm_line(self, T, P_min=0.05e6, P_max=4.0e6, num_points=50):
         """
@@ -71,6 +67,12 @@ class PhDiagramPlotter:
             h array, P array
         """
         pressures = np.linspace(P_min, P_max, num_points)
+        if self.backend:
+            props = get_property_backend(self.refrigerant, self.backend)
+            h_values = props.props_pt(pressures, T)[0] / 1000
+            valid = ~np.isnan(h_values)
+            return h_values[valid], pressures[valid]
+
         h_values = []
         valid_pressures = []
         
@@ -14,6 +14,7 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import pandas as pd
 from ph_diagram_plotter import PhDiagramPlotter
+from property_backend import TABLE_BACKEND
 
 
 class PhDiagramWidget(QWidget):
@@ -24,7 +25,7 @@ class PhDiagramWidget(QWidget):
     def __init__(self, data_manager):
         super().__init__()
         self.data_manager = data_manager
-        self.plotter = PhDiagramPlotter('R290')
+        self.plotter = PhDiagramPlotter('R290', backend=TABLE_BACKEND)
         self.current_data = None
         self.current_circuit_data = None
         
@@ -125,48 +125,108 @@ def format_port_label(component_type: str, component_props: Dict[str, Any], port
     return f"{side}{port_name}".strip()
 
 
-def list_all_ports(dm) -> List[Dict[str, Any]]:
+class PortSnapshot:
+    """
+    Every component port resolved once against the current filtered data.
+
+    Building it walks the diagram once: each port's mapped sensor, sensor
+    number and aggregated value (DataManager.get_aggregate_snapshot, one
+    vectorized pass over the filtered frame per filter state). After that,
+    components(), sensor() and value() are dictionary reads. Ports outside
+    the schema (e.g. more outlet circuits than the schema count) are
+    resolved on first use.
+
+    Build a new snapshot when the diagram, filters or data change.
+    """
+
+    def __init__(self, dm):
+        self.dm = dm
+        self.model: Dict[str, Any] = dm.diagram_model
+        self._components: Dict[str, Dict] = self.model.get('components', {}) or {}
+        self._sensor_numbers: Dict[str, int] = {}
+        for i, name in enumerate(dm.get_sensor_list()):
+            self._sensor_numbers.setdefault(name, i + 1)
+        try:
+            stat = dm.AGGREGATION_STATS.get(dm.value_aggregation, 'last')
+            self._aggregates: Dict[str, float] = dm.get_aggregate_snapshot()[stat]
+        except Exception:
+            self._aggregates = {}
+        self._values: Dict[str, Optional[float]] = {}
+
+        self.ports: List[Dict[str, Any]] = []
+        self._by_port: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for comp_id, comp in self._components.items():
+            ctype = comp.get('type')
+            props = comp.get('properties', {}) or {}
+            for port in enumerate_ports_for_component(ctype, props):
+                entry = self._resolve(comp_id, ctype, port)
+                entry['label'] = format_port_label(ctype, props, port)
+                self.ports.append(entry)
+
+    def _resolve(self, comp_id: str, ctype: Optional[str], port: str) -> Dict[str, Any]:
+        sensor = resolve_mapped_sensor(self.model, ctype, comp_id, port)
+        entry = {
+            'componentId': comp_id,
+            'type': ctype,
+            'properties': self._components.get(comp_id, {}).get('properties', {}) or {},
+            'port': port,
+            'roleKeyPrimary': f"{ctype}.{comp_id}.{port}",
+            'roleKeyFallback': f"{comp_id}.{port}",
+            'sensor': sensor,
+            'sensorNumber': self._sensor_numbers.get(sensor) if sensor else None,
+            'value': self._sensor_value(sensor),
+        }
+        self._by_port[(comp_id, port)] = entry
+        return entry
+
+    def _sensor_value(self, sensor: Optional[str]) -> Optional[float]:
+        if not sensor:
+            return None
+        if sensor in self._aggregates:
+            return self._aggregates[sensor]
+        if sensor not in self._values:
+            # Not numeric or no valid data: same answer as DataManager.get_sensor_value
+            self._values[sensor] = get_sensor_value(self.dm, sensor)
+        return self._values[sensor]
+
+    def _port(self, comp_id: str, port: str) -> Dict[str, Any]:
+        entry = self._by_port.get((comp_id, port))
+        if entry is None:
+            entry = self._resolve(comp_id, self._components.get(comp_id, {}).get('type'), port)
+        return entry
+
+    def components(self, component_type: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """(componentId, properties) of every component of this type, in diagram order."""
+        return [(comp_id, comp.get('properties', {}) or {})
+                for comp_id, comp in self._components.items() if comp.get('type') == component_type]
+
+    def sensor(self, comp_id: str, port: str) -> Optional[str]:
+        """Mapped sensor (CSV column) of a port, or None."""
+        return self._port(comp_id, port)['sensor']
+
+    def value(self, comp_id: str, port: str) -> Optional[float]:
+        """Aggregated value of a port's mapped sensor, or None."""
+        return self._port(comp_id, port)['value']
+
+
+def list_all_ports(dm, snapshot: Optional[PortSnapshot] = None) -> List[Dict[str, Any]]:
     """Return a list of port dicts with resolved sensor and value.
 
     Each dict: { componentId, type, properties, port, label, roleKeyPrimary,
                  roleKeyFallback, sensor, sensorNumber, value }
     """
-    out: List[Dict[str, Any]] = []
-    model = dm.diagram_model
-    components: Dict[str, Dict] = model.get('components', {}) or {}
-
-    for comp_id, comp in components.items():
-        ctype = comp.get('type')
-        props = comp.get('properties', {}) or {}
-        for port in enumerate_ports_for_component(ctype, props):
-            sensor = resolve_mapped_sensor(model, ctype, comp_id, port)
-            out.append({
-                'componentId': comp_id,
-                'type': ctype,
-                'properties': props,
-                'port': port,
-                'label': format_port_label(ctype, props, port),
-                'roleKeyPrimary': f"{ctype}.{comp_id}.{port}",
-                'roleKeyFallback': f"{comp_id}.{port}",
-                'sensor': sensor,
-                'sensorNumber': get_sensor_number(dm, sensor),
-                'value': get_sensor_value(dm, sensor),
-            })
-    return out
-
-
-def get_pressures_from_compressor(dm) -> Dict[str, Optional[float]]:
+    snapshot = snapshot or PortSnapshot(dm)
+    return [dict(entry) for entry in snapshot.ports]
+
+
+def get_pressures_from_compressor(dm, snapshot: Optional[PortSnapshot] = None) -> Dict[str, Optional[float]]:
     """Return suction and discharge pressures based on compressor ports (if mapped)."""
-    model = dm.diagram_model
-    components: Dict[str, Dict] = model.get('components', {}) or {}
+    snapshot = snapshot or PortSnapshot(dm)
     suction_val: Optional[float] = None
     discharge_val: Optional[float] = None
-    for comp_id, comp in components.items():
-        if comp.get('type') != 'Compressor':
-            continue
+    for comp_id, _ in snapshot.components('Compressor'):
         for port in ('inlet', 'outlet'):
-            sensor = resolve_mapped_sensor(model, 'Compressor', comp_id, port)
-            val = get_sensor_value(dm, sensor)
+            val = snapshot.value(comp_id, port)
             if port == 'inlet' and val is not None:
                 suction_val = val
             if port == 'outlet' and val is not None:
@@ -174,21 +234,16 @@ def get_pressures_from_compressor(dm) -> Dict[str, Optional[float]]:
     return {'suction': suction_val, 'discharge': discharge_val}
 
 
-def get_evaporator_outlet_temps(dm) -> Dict[str, List[float]]:
+def get_evaporator_outlet_temps(dm, snapshot: Optional[PortSnapshot] = None) -> Dict[str, List[float]]:
     """Return outlet temps grouped by evaporator circuit_label (Left/Center/Right)."""
-    model = dm.diagram_model
-    components: Dict[str, Dict] = model.get('components', {}) or {}
+    snapshot = snapshot or PortSnapshot(dm)
     groups: Dict[str, List[float]] = {'Left': [], 'Center': [], 'Right': []}
-    for comp_id, comp in components.items():
-        if comp.get('type') != 'Evaporator':
-            continue
-        props = comp.get('properties', {}) or {}
+    for comp_id, props in snapshot.components('Evaporator'):
         label = props.get('circuit_label') or ''
         for port in enumerate_ports_for_component('Evaporator', props):
             if not port.startswith('outlet_circuit_'):
                 continue
-            sensor = resolve_mapped_sensor(model, 'Evaporator', comp_id, port)
-            val = get_sensor_value(dm, sensor)
+            val = snapshot.value(comp_id, port)
             if val is not None and label in groups:
                 groups[label].append(val)
     return groups
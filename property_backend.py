@@ -0,0 +1,338 @@
+"""
+property_backend.py
+
+Batched refrigerant property evaluation on CoolProp's low-level AbstractState.
+
+CP.PropsSI parses the fluid name and builds a fresh state on every call; the
+row performance engine made about 25 of those calls per row, several of them
+for the same state point. PropertyBackend keeps one AbstractState per
+(backend, refrigerant) and evaluates whole arrays: a single update() per
+state point yields every property of that point (h, s and rho together).
+
+Inputs and outputs are SI, exactly as with PropsSI (Pa, K, J/kg, J/kg/K,
+kg/m^3). Array inputs broadcast against each other; scalar inputs return
+floats. NaN inputs, and points CoolProp rejects, give NaN instead of raising
+so one bad logger row never aborts a batch.
+
+Saturation queries (props_pq, t_sat) go through one process-wide LRU
+SaturationCache keyed by (refrigerant, backend, quantized pressure, quality):
+logged pressures only take a few distinct values, so most rows are answered
+without touching CoolProp. StatePointCache keeps the batch engine's (P, T)
+state points between reruns.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    import CoolProp.CoolProp as CP
+except Exception:  # pragma: no cover - CoolProp may not be available in some environments
+    CP = None  # type: ignore
+
+DEFAULT_BACKEND = 'HEOS'
+
+# Engine-owned interpolation tables (property_tables.py)
+TABLE_BACKEND = 'TABLES'
+
+# Selectable backends: exact Helmholtz EOS, CoolProp's tabular interpolation
+# over HEOS (tables built once per fluid and cached by CoolProp under
+# ~/.CoolProp/Tables), or the engine's own tables
+PROPERTY_BACKENDS = ('HEOS', 'BICUBIC&HEOS', 'TTSE&HEOS', TABLE_BACKEND)
+
+# AbstractState objects are not thread-safe: keep one set per thread
+_thread_local = threading.local()
+
+# Saturation lookups use the pressure rounded to this step. It is far below
+# the logger resolution (0.1 psi = 689 Pa) and moves T_sat by < 1e-3 K.
+SATURATION_PRESSURE_QUANTUM_PA = 1.0
+SATURATION_CACHE_SIZE = 4096
+
+# Single-phase (P, T) state points kept for incremental recalculation
+STATE_POINT_CACHE_SIZE = 250000
+
+
+class PropertyCache:
+    """
+    Thread-safe LRU cache of fixed-width property tuples.
+
+    hits counts values served from the cache, misses the distinct keys that
+    had to be computed, evictions the entries dropped for size.
+    """
+
+    def __init__(self, maxsize: int, width: int):
+        self.maxsize = maxsize
+        self.width = width
+        self._entries: 'OrderedDict[Tuple, Tuple[float, ...]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, prefix: Tuple, keys: np.ndarray, compute: Callable[[np.ndarray], np.ndarray],
+                requests: int) -> np.ndarray:
+        """
+        (m, width) values for m distinct key rows (m, k).
+
+        compute(missing_key_rows) returns the (n, width) values of the keys
+        that are not cached; requests is the number of lookups those m keys
+        stand for (for the hit counter).
+        """
+        values = np.empty((len(keys), self.width))
+        missing = []
+        with self._lock:
+            for k, row in enumerate(keys):
+                key = prefix + tuple(row.tolist())
+                entry = self._entries.get(key)
+                if entry is None:
+                    missing.append(k)
+                else:
+                    self._entries.move_to_end(key)
+                    values[k] = entry
+            self.misses += len(missing)
+            self.hits += requests - len(missing)
+
+        if missing:
+            missing = np.array(missing)
+            computed = np.asarray(compute(keys[missing])).reshape(len(missing), self.width)
+            values[missing] = computed
+            with self._lock:
+                for k, row in zip(missing, computed):
+                    self._entries[prefix + tuple(keys[k].tolist())] = tuple(row)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return values
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+class SaturationCache(PropertyCache):
+    """
+    Saturation properties (T, h, s, rho) keyed by (refrigerant, backend,
+    pressure step, quality). Values are computed at the quantized pressure
+    so a key always maps to the same result.
+    """
+
+    def __init__(self, maxsize: int = SATURATION_CACHE_SIZE,
+                 quantum_pa: float = SATURATION_PRESSURE_QUANTUM_PA):
+        super().__init__(maxsize, 4)
+        self.quantum_pa = quantum_pa
+
+    def lookup(self, refrigerant: str, backend: str, pressure_pa, quality: float,
+               compute: Callable[[np.ndarray, float], Tuple[np.ndarray, ...]]) -> np.ndarray:
+        """
+        (n, 4) array of T, h, s, rho for the flattened pressures.
+
+        compute(pressures, quality) evaluates the keys that are not cached.
+        """
+        pressure = np.asarray(pressure_pa, dtype='float64').ravel()
+        out = np.full((pressure.size, 4), np.nan)
+        valid = ~np.isnan(pressure)
+        if not valid.any() or quality != quality:
+            return out
+
+        steps, inverse = np.unique(np.round(pressure[valid] / self.quantum_pa), return_inverse=True)
+        values = self._lookup(
+            (refrigerant, backend, quality), steps[:, None],
+            lambda rows: np.column_stack(compute(rows[:, 0] * self.quantum_pa, quality)),
+            int(valid.sum()))
+        out[valid] = values[inverse.ravel()]
+        return out
+
+
+class StatePointCache(PropertyCache):
+    """
+    Single-phase (h, s, rho) keyed by (refrigerant, backend, P, T) with the
+    exact input values, so cached results are bit-identical to a fresh
+    evaluation. A rerun over an overlapping time window or a remapped sensor
+    only evaluates the (P, T) pairs it has not seen.
+    """
+
+    def __init__(self, maxsize: int = STATE_POINT_CACHE_SIZE):
+        super().__init__(maxsize, 3)
+
+    def lookup(self, backend_key: Tuple, pairs: np.ndarray, requests: int,
+               compute: Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, ...]]) -> np.ndarray:
+        """
+        (m, 3) array of h, s, rho for m distinct (P, T) rows.
+
+        backend_key is (refrigerant, backend name); compute(p, t) evaluates
+        the pairs that are not cached.
+        """
+        return self._lookup(tuple(backend_key), pairs,
+                            lambda rows: np.column_stack(compute(rows[:, 0], rows[:, 1])), requests)
+
+
+# Shared by every PropertyBackend (engine, tables fallback, P-h generators)
+SATURATION_CACHE = SaturationCache()
+
+# Batch engine state points, reused across Calculations tab reruns
+STATE_POINT_CACHE = StatePointCache()
+
+
+def get_saturation_cache() -> SaturationCache:
+    return SATURATION_CACHE
+
+
+def get_state_point_cache() -> StatePointCache:
+    return STATE_POINT_CACHE
+
+
+class PropertyBackend:
+    """Array-oriented property calls on one AbstractState."""
+
+    def __init__(self, refrigerant: str = 'R290', backend: str = DEFAULT_BACKEND,
+                 use_saturation_cache: bool = True):
+        if CP is None:
+            raise RuntimeError("CoolProp not available")
+        self.refrigerant = refrigerant
+        self.backend = backend
+        self._state = CP.AbstractState(backend, refrigerant)
+        self.tabular = backend != 'HEOS'
+        self.use_saturation_cache = use_saturation_cache
+        # Identifies the property source in cache keys
+        self.cache_key = (refrigerant, backend)
+
+    def _evaluate(self, input_pair, first, second, outputs: Tuple[str, ...], phases=None):
+        """
+        update(input_pair, first, second) per element and read the named outputs.
+
+        phases optionally imposes a CoolProp phase per element (NaN = let
+        CoolProp decide).
+        """
+        scalar = np.ndim(first) == 0 and np.ndim(second) == 0
+        first, second = np.broadcast_arrays(np.asarray(first, dtype='float64'),
+                                            np.asarray(second, dtype='float64'))
+        shape = first.shape
+        first = first.ravel()
+        second = second.ravel()
+        if phases is not None:
+            phases = np.broadcast_to(np.asarray(phases, dtype='float64'), shape).ravel()
+
+        values = np.full((len(outputs), first.size), np.nan)
+        state = self._state
+        getters = [getattr(state, name) for name in outputs]
+        for i in range(first.size):
+            a = first[i]
+            b = second[i]
+            if a != a or b != b:  # NaN input
+                continue
+            imposed = phases is not None and phases[i] == phases[i]
+            try:
+                if imposed:
+                    state.specify_phase(int(phases[i]))
+                state.update(input_pair, a, b)
+                for k, getter in enumerate(getters):
+                    values[k, i] = getter()
+            except Exception:
+                # Outside the fluid's valid range; leave NaN for this point
+                pass
+            finally:
+                if imposed:
+                    state.unspecify_phase()
+
+        if scalar:
+            return tuple(float(v[0]) for v in values)
+        return tuple(v.reshape(shape) for v in values)
+
+    # --- Single-phase / general state points ---
+    def props_pt(self, pressure_pa, temp_k):
+        """(h, s, rho) at pressure and temperature."""
+        phases = None
+        if self.tabular:
+            # Tabular backends can pick the wrong side of the dome for PT
+            # points close to saturation (an error of the full latent heat),
+            # so impose liquid/gas from T vs T_sat(P) as HEOS would decide it
+            t_sat = self.t_sat(pressure_pa, 0.0)
+            with np.errstate(invalid='ignore'):
+                phases = np.where(np.isnan(t_sat), np.nan,
+                                  np.where(np.asarray(temp_k) < t_sat, CP.iphase_liquid, CP.iphase_gas))
+        return self._evaluate(CP.PT_INPUTS, pressure_pa, temp_k, ('hmass', 'smass', 'rhomass'), phases)
+
+    def props_ph(self, pressure_pa, h_jkg):
+        """(T, s, rho, quality) at pressure and enthalpy; quality is -1 outside the dome."""
+        return self._evaluate(CP.HmassP_INPUTS, h_jkg, pressure_pa, ('T', 'smass', 'rhomass', 'Q'))
+
+    def props_ps(self, pressure_pa, s_jkgk):
+        """(T, h) at pressure and entropy (isentropic compression end points)."""
+        return self._evaluate(CP.PSmass_INPUTS, pressure_pa, s_jkgk, ('T', 'hmass'))
+
+    # --- Saturation ---
+    def _props_pq_exact(self, pressure_pa, quality):
+        return self._evaluate(CP.PQ_INPUTS, pressure_pa, quality, ('T', 'hmass', 'smass', 'rhomass'))
+
+    def props_pq(self, pressure_pa, quality):
+        """(T, h, s, rho) on the saturation curve at pressure and quality."""
+        if not self.use_saturation_cache or np.ndim(quality) != 0:
+            return self._props_pq_exact(pressure_pa, quality)
+        values = SATURATION_CACHE.lookup(self.refrigerant, self.backend, pressure_pa, float(quality),
+                                         self._props_pq_exact)
+        if np.ndim(pressure_pa) == 0:
+            return tuple(float(v) for v in values[0])
+        shape = np.shape(pressure_pa)
+        return tuple(values[:, k].reshape(shape) for k in range(4))
+
+    def t_sat(self, pressure_pa, quality=0.0):
+        """Saturation temperature at pressure (K)."""
+        return self.props_pq(pressure_pa, quality)[0]
+
+    def p_sat(self, temp_k, quality=0.0):
+        """Saturation pressure at temperature (Pa)."""
+        return self._evaluate(CP.QT_INPUTS, quality, temp_k, ('p',))[0]
+
+
+def resolve_backend_name(backend: Optional[str]) -> str:
+    """Validated backend name; unknown or empty names fall back to HEOS."""
+    if not backend:
+        return DEFAULT_BACKEND
+    for name in PROPERTY_BACKENDS:
+        if str(backend).strip().upper() == name:
+            return name
+    print(f"[PROPERTY BACKEND] Unknown backend '{backend}', using {DEFAULT_BACKEND}")
+    return DEFAULT_BACKEND
+
+
+def get_property_backend(refrigerant: str = 'R290', backend: Optional[str] = DEFAULT_BACKEND) -> PropertyBackend:
+    """
+    Shared PropertyBackend for (refrigerant, backend) on the calling thread.
+
+    A tabular backend that cannot be built (e.g. tables unavailable for the
+    fluid) falls back to exact HEOS.
+    """
+    backend = resolve_backend_name(backend)
+    backends: Dict[Tuple[str, str], PropertyBackend] = getattr(_thread_local, 'backends', None)
+    if backends is None:
+        backends = _thread_local.backends = {}
+    key = (backend, refrigerant)
+    if key not in backends:
+        try:
+            if backend == TABLE_BACKEND:
+                from property_tables import TablePropertyBackend
+                backends[key] = TablePropertyBackend(refrigerant)
+            else:
+                backends[key] = PropertyBackend(refrigerant, backend)
+        except Exception as e:
+            if backend == DEFAULT_BACKEND:
+                raise
+            print(f"[PROPERTY BACKEND] Could not build {backend} for {refrigerant} ({e}), using {DEFAULT_BACKEND}")
+            backends[key] = get_property_backend(refrigerant, DEFAULT_BACKEND)
+    return backends[key]
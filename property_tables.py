@@ -0,0 +1,434 @@
+"""
+property_tables.py
+
+Engine-owned interpolation tables for refrigerant properties.
+
+For each refrigerant three grids are generated once from CoolProp (HEOS) and
+stored next to the app in property_tables/<refrigerant>.npz:
+
+- saturation: P -> T_f, T_g, h_f, h_g, s_f, s_g, rho_f, rho_g
+- vapor:      (P, superheat T - T_g(P)) -> h, s, rho
+- liquid:     (P, subcooling T_f(P) - T) -> h, s, rho
+
+All grids are uniform in log(P) and in the temperature offset from the
+saturation line, so single-phase properties stay smooth inside each grid
+(no interpolation across the dome) and cell lookup is plain arithmetic.
+Queries take whole arrays and use NumPy linear (bilinear) or cubic
+Catmull-Rom (bicubic) interpolation. Points outside the tables return NaN;
+TablePropertyBackend fills those from exact HEOS.
+
+Error bounds are measured at generation time against HEOS at every cell
+centre (where interpolation error peaks) and stored with the table.
+
+Regenerate from the command line:
+    python property_tables.py R290 [R410A ...] [--check]
+"""
+
+import argparse
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    import CoolProp.CoolProp as CP
+except Exception:  # pragma: no cover - CoolProp may not be available in some environments
+    CP = None  # type: ignore
+
+from property_backend import TABLE_BACKEND, PropertyBackend
+
+# Bump when the grid layout or stored fields change
+TABLE_FORMAT_VERSION = 1
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'property_tables')
+DEFAULT_METHOD = 'cubic'
+METHODS = ('linear', 'cubic')
+
+# Grid specification; stored with the table so a changed spec triggers regeneration
+DEFAULT_GRID = {
+    'p_min_pa': 20e3,
+    'p_max_fraction': 0.95,  # of the critical pressure
+    'n_p': 200,
+    'n_sat': 400,
+    'superheat_max_k': 160.0,
+    'n_superheat': 161,
+    'subcool_max_k': 80.0,
+    'n_subcool': 81,
+}
+
+SAT_FIELDS = ('T_f', 'T_g', 'h_f', 'h_g', 's_f', 's_g', 'rho_f', 'rho_g')
+PHASE_FIELDS = ('h', 's', 'rho')
+
+_tables: Dict[str, 'PropertyTable'] = {}
+_tables_lock = threading.Lock()
+
+
+def coolprop_version() -> str:
+    try:
+        return CP.get_global_param_string('version')
+    except Exception:
+        return 'unknown'
+
+
+def table_path(refrigerant: str) -> str:
+    return os.path.join(TABLE_DIR, f"{refrigerant}.npz")
+
+
+# --- Interpolation helpers ---
+
+def _pad(values: np.ndarray, axis: int) -> np.ndarray:
+    """One linearly extrapolated ghost node at each end of axis (for the cubic stencil)."""
+    first = np.take(values, [0], axis=axis)
+    second = np.take(values, [1], axis=axis)
+    last = np.take(values, [-1], axis=axis)
+    before_last = np.take(values, [-2], axis=axis)
+    return np.concatenate([2 * first - second, values, 2 * last - before_last], axis=axis)
+
+
+def _axis_stencil(x: np.ndarray, start: float, step: float, n: int, method: str):
+    """
+    Cell index (into the padded axis), stencil offsets and weights for
+    positions x on a uniform axis; inside is False for NaN / out-of-range x.
+    """
+    with np.errstate(invalid='ignore'):
+        u = (x - start) / step
+        inside = (u >= 0) & (u <= n - 1)
+    u = np.where(inside, u, 0.0)
+    i = np.minimum(np.floor(u).astype(np.int64), n - 2)
+    t = u - i
+    if method == 'linear':
+        return inside, i + 1, (0, 1), (1 - t, t)
+    t2 = t * t
+    t3 = t2 * t
+    weights = (
+        (-t3 + 2 * t2 - t) / 2,
+        (3 * t3 - 5 * t2 + 2) / 2,
+        (-3 * t3 + 4 * t2 + t) / 2,
+        (t3 - t2) / 2,
+    )
+    return inside, i + 1, (-1, 0, 1, 2), weights
+
+
+def _interp_1d(padded: np.ndarray, axis: Tuple[float, float, int], x: np.ndarray, method: str) -> np.ndarray:
+    """padded: (n + 2, k) -> (len(x), k)"""
+    inside, i, offsets, weights = _axis_stencil(x, *axis, method)
+    out = np.zeros((len(x), padded.shape[1]))
+    for offset, weight in zip(offsets, weights):
+        out += weight[:, None] * padded[i + offset]
+    out[~inside] = np.nan
+    return out
+
+
+def _interp_2d(padded: np.ndarray, x_axis, y_axis, x: np.ndarray, y: np.ndarray, method: str) -> np.ndarray:
+    """padded: (nx + 2, ny + 2, k) -> (len(x), k)"""
+    inside_x, ix, offsets_x, weights_x = _axis_stencil(x, *x_axis, method)
+    inside_y, iy, offsets_y, weights_y = _axis_stencil(y, *y_axis, method)
+    out = np.zeros((len(x), padded.shape[2]))
+    for ox, wx in zip(offsets_x, weights_x):
+        for oy, wy in zip(offsets_y, weights_y):
+            out += (wx * wy)[:, None] * padded[ix + ox, iy + oy]
+    out[~(inside_x & inside_y)] = np.nan
+    return out
+
+
+def _as_float_array(value) -> np.ndarray:
+    return np.atleast_1d(np.asarray(value, dtype='float64'))
+
+
+class PropertyTable:
+    """Saturation, liquid and vapor property grids for one refrigerant."""
+
+    def __init__(self, refrigerant: str, arrays: Dict[str, np.ndarray], meta: Dict):
+        self.refrigerant = refrigerant
+        self.meta = meta
+        grid = meta['grid']
+        self.log_p_min = float(meta['log_p_min'])
+        self.log_p_max = float(meta['log_p_max'])
+
+        n_p, n_sat = grid['n_p'], grid['n_sat']
+        self._p_axis = (self.log_p_min, (self.log_p_max - self.log_p_min) / (n_p - 1), n_p)
+        self._sat_axis = (self.log_p_min, (self.log_p_max - self.log_p_min) / (n_sat - 1), n_sat)
+        self._superheat_axis = (0.0, grid['superheat_max_k'] / (grid['n_superheat'] - 1), grid['n_superheat'])
+        self._subcool_axis = (0.0, grid['subcool_max_k'] / (grid['n_subcool'] - 1), grid['n_subcool'])
+
+        self.arrays = arrays
+        self._sat = _pad(arrays['saturation'], 0)
+        self._vapor = _pad(_pad(arrays['vapor'], 0), 1)
+        self._liquid = _pad(_pad(arrays['liquid'], 0), 1)
+
+    @property
+    def error_bounds(self) -> Dict:
+        """Max abs / relative error vs HEOS at cell centres, per method, grid and property."""
+        return self.meta.get('error_bounds', {})
+
+    # --- Generation ---
+    @classmethod
+    def generate(cls, refrigerant: str, grid: Optional[Dict] = None, measure_errors: bool = True) -> 'PropertyTable':
+        """Build the grids from CoolProp HEOS (a few seconds per refrigerant)."""
+        if CP is None:
+            raise RuntimeError("CoolProp not available")
+        grid = dict(DEFAULT_GRID, **(grid or {}))
+        exact = PropertyBackend(refrigerant, 'HEOS', use_saturation_cache=False)
+        p_crit = CP.PropsSI('Pcrit', refrigerant)
+        log_p_min = np.log(grid['p_min_pa'])
+        log_p_max = np.log(grid['p_max_fraction'] * p_crit)
+
+        sat_p = np.exp(np.linspace(log_p_min, log_p_max, grid['n_sat']))
+        saturation = _exact_saturation(exact, sat_p)
+
+        p = np.exp(np.linspace(log_p_min, log_p_max, grid['n_p']))
+        superheat = np.linspace(0.0, grid['superheat_max_k'], grid['n_superheat'])
+        subcool = np.linspace(0.0, grid['subcool_max_k'], grid['n_subcool'])
+        vapor = _exact_phase_grid(exact, p, superheat, gas=True)
+        liquid = _exact_phase_grid(exact, p, subcool, gas=False)
+
+        meta = {
+            'format_version': TABLE_FORMAT_VERSION,
+            'refrigerant': refrigerant,
+            'coolprop_version': coolprop_version(),
+            'grid': grid,
+            'log_p_min': float(log_p_min),
+            'log_p_max': float(log_p_max),
+        }
+        table = cls(refrigerant, {'saturation': saturation, 'vapor': vapor, 'liquid': liquid}, meta)
+        if measure_errors:
+            table.meta['error_bounds'] = table.measure_error_bounds(exact)
+        return table
+
+    def measure_error_bounds(self, exact: Optional[PropertyBackend] = None) -> Dict:
+        """Compare interpolated values with HEOS at every cell centre of every grid."""
+        exact = exact or PropertyBackend(self.refrigerant, 'HEOS', use_saturation_cache=False)
+
+        def centres(axis):
+            start, step, n = axis
+            return start + step * (np.arange(n - 1) + 0.5)
+
+        def bounds(approx, reference, fields):
+            result = {}
+            for k, field in enumerate(fields):
+                a, r = approx[:, k], reference[:, k]
+                ok = ~np.isnan(a) & ~np.isnan(r)
+                if not ok.any():
+                    continue
+                diff = np.abs(a[ok] - r[ok])
+                rel = diff / np.maximum(np.abs(r[ok]), 1e-12)
+                result[field] = {'max_abs': float(diff.max()), 'max_rel': float(rel.max())}
+            return result
+
+        sat_p = np.exp(centres(self._sat_axis))
+        sat_exact = _exact_saturation(exact, sat_p)
+        grid_p = np.exp(centres(self._p_axis))
+        vapor_dt = centres(self._superheat_axis)
+        liquid_dt = centres(self._subcool_axis)
+        vapor_exact = _exact_phase_grid(exact, grid_p, vapor_dt, gas=True).reshape(-1, len(PHASE_FIELDS))
+        liquid_exact = _exact_phase_grid(exact, grid_p, liquid_dt, gas=False).reshape(-1, len(PHASE_FIELDS))
+        log_p_vapor, dt_vapor = (a.ravel() for a in np.meshgrid(np.log(grid_p), vapor_dt, indexing='ij'))
+        log_p_liquid, dt_liquid = (a.ravel() for a in np.meshgrid(np.log(grid_p), liquid_dt, indexing='ij'))
+
+        result = {}
+        for method in METHODS:
+            result[method] = {
+                'saturation': bounds(_interp_1d(self._sat, self._sat_axis, np.log(sat_p), method), sat_exact, SAT_FIELDS),
+                'vapor': bounds(_interp_2d(self._vapor, self._p_axis, self._superheat_axis, log_p_vapor, dt_vapor, method),
+                                vapor_exact, PHASE_FIELDS),
+                'liquid': bounds(_interp_2d(self._liquid, self._p_axis, self._subcool_axis, log_p_liquid, dt_liquid, method),
+                                 liquid_exact, PHASE_FIELDS),
+            }
+        return result
+
+    # --- Persistence ---
+    def save(self, path: Optional[str] = None) -> str:
+        path = path or table_path(self.refrigerant)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(tmp_path, meta=np.array(json.dumps(self.meta)), **self.arrays)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> 'PropertyTable':
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            arrays = {name: data[name] for name in ('saturation', 'vapor', 'liquid')}
+        return cls(meta['refrigerant'], arrays, meta)
+
+    def is_current(self, grid: Optional[Dict] = None) -> bool:
+        """True if the table matches this code's format, the installed CoolProp and the grid spec."""
+        return (self.meta.get('format_version') == TABLE_FORMAT_VERSION
+                and self.meta.get('coolprop_version') == coolprop_version()
+                and self.meta.get('grid') == dict(DEFAULT_GRID, **(grid or {})))
+
+    # --- Queries (SI units, arrays) ---
+    def saturation(self, pressure_pa, method: str = DEFAULT_METHOD) -> Dict[str, np.ndarray]:
+        """Saturation properties at pressure; keys as in SAT_FIELDS."""
+        p = _as_float_array(pressure_pa)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = _interp_1d(self._sat, self._sat_axis, np.log(p), method)
+        return {field: values[:, k] for k, field in enumerate(SAT_FIELDS)}
+
+    def props_pt(self, pressure_pa, temp_k, method: str = DEFAULT_METHOD) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(h, s, rho) at pressure and temperature, from the liquid or vapor grid."""
+        p, t = np.broadcast_arrays(_as_float_array(pressure_pa), _as_float_array(temp_k))
+        p = p.ravel()
+        t = t.ravel()
+        sat = self.saturation(p, method)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_p = np.log(p)
+            superheat = t - sat['T_g']
+            subcool = sat['T_f'] - t
+        vapor = superheat >= 0
+        liquid = subcool > 0
+        out = np.full((len(p), len(PHASE_FIELDS)), np.nan)
+        if vapor.any():
+            out[vapor] = _interp_2d(self._vapor, self._p_axis, self._superheat_axis, log_p[vapor], superheat[vapor], method)
+        if liquid.any():
+            out[liquid] = _interp_2d(self._liquid, self._p_axis, self._subcool_axis, log_p[liquid], subcool[liquid], method)
+        return out[:, 0], out[:, 1], out[:, 2]
+
+
+def _exact_saturation(exact: PropertyBackend, pressure_pa: np.ndarray) -> np.ndarray:
+    t_f, h_f, s_f, rho_f = exact.props_pq(pressure_pa, 0.0)
+    t_g, h_g, s_g, rho_g = exact.props_pq(pressure_pa, 1.0)
+    return np.column_stack([t_f, t_g, h_f, h_g, s_f, s_g, rho_f, rho_g])
+
+
+def _exact_phase_grid(exact: PropertyBackend, pressure_pa: np.ndarray, offsets_k: np.ndarray, gas: bool) -> np.ndarray:
+    """(len(P), len(offsets), 3) grid of h, s, rho; offset 0 is the saturation line itself."""
+    quality = 1.0 if gas else 0.0
+    t_sat, h_sat, s_sat, rho_sat = exact.props_pq(pressure_pa, quality)
+    p = np.repeat(pressure_pa[:, None], len(offsets_k), axis=1)
+    t = t_sat[:, None] + offsets_k[None, :] if gas else t_sat[:, None] - offsets_k[None, :]
+    phase = CP.iphase_gas if gas else CP.iphase_liquid
+    h, s, rho = exact._evaluate(CP.PT_INPUTS, p, t, ('hmass', 'smass', 'rhomass'), phases=np.full(p.shape, phase))
+    grid = np.stack([h, s, rho], axis=-1)
+    on_saturation = offsets_k == 0
+    grid[:, on_saturation, :] = np.column_stack([h_sat, s_sat, rho_sat])[:, None, :]
+    return grid
+
+
+def get_property_table(refrigerant: str = 'R290', generate: bool = True) -> Optional[PropertyTable]:
+    """
+    Shared PropertyTable for refrigerant, loaded from TABLE_DIR.
+
+    A missing or outdated table file is regenerated (and saved) when generate
+    is True; otherwise None is returned.
+    """
+    with _tables_lock:
+        table = _tables.get(refrigerant)
+        if table is not None:
+            return table
+
+        path = table_path(refrigerant)
+        if os.path.exists(path):
+            try:
+                table = PropertyTable.load(path)
+                if not table.is_current():
+                    print(f"[PROPERTY TABLES] {path} is outdated, regenerating")
+                    table = None
+            except Exception as e:
+                print(f"[PROPERTY TABLES] Could not read {path}: {e}")
+                table = None
+
+        if table is None:
+            if not generate:
+                return None
+            print(f"[PROPERTY TABLES] Generating tables for {refrigerant}...")
+            table = PropertyTable.generate(refrigerant)
+            try:
+                table.save(path)
+                print(f"[PROPERTY TABLES] Saved {path}")
+            except Exception as e:
+                print(f"[PROPERTY TABLES] Could not save {path}: {e}")
+
+        _tables[refrigerant] = table
+        return table
+
+
+class TablePropertyBackend(PropertyBackend):
+    """
+    PropertyBackend answering PT and saturation queries from a PropertyTable.
+
+    Points the table does not cover, and all other input pairs (P-h, P-s),
+    are evaluated exactly with HEOS.
+    """
+
+    def __init__(self, refrigerant: str = 'R290', table: Optional[PropertyTable] = None,
+                 method: str = DEFAULT_METHOD):
+        super().__init__(refrigerant, 'HEOS')
+        self.table = table or get_property_table(refrigerant)
+        self.method = method
+        self.cache_key = (refrigerant, TABLE_BACKEND, method)
+
+    def _fill_missing(self, values: Tuple[np.ndarray, ...], inputs: Tuple, exact) -> Tuple:
+        """Replace NaN table results (with valid inputs) by exact(*inputs) for those points."""
+        first, second = np.broadcast_arrays(_as_float_array(inputs[0]), _as_float_array(inputs[1]))
+        first, second = first.ravel(), second.ravel()
+        missing = np.isnan(values[0]) & ~np.isnan(first) & ~np.isnan(second)
+        if missing.any():
+            filled = exact(first[missing], second[missing])
+            for target, source in zip(values, filled):
+                target[missing] = source
+        return values
+
+    def _shape(self, values: Tuple[np.ndarray, ...], first, second):
+        if np.ndim(first) == 0 and np.ndim(second) == 0:
+            return tuple(float(v[0]) for v in values)
+        shape = np.broadcast_shapes(np.shape(first), np.shape(second))
+        return tuple(v.reshape(shape) for v in values)
+
+    def props_pt(self, pressure_pa, temp_k):
+        values = self.table.props_pt(pressure_pa, temp_k, self.method)
+        values = self._fill_missing(values, (pressure_pa, temp_k), super().props_pt)
+        return self._shape(values, pressure_pa, temp_k)
+
+    def props_pq(self, pressure_pa, quality):
+        if np.ndim(quality) != 0 or float(quality) not in (0.0, 1.0):
+            return super().props_pq(pressure_pa, quality)
+        sat = self.table.saturation(pressure_pa, self.method)
+        side = 'g' if float(quality) == 1.0 else 'f'
+        values = tuple(sat[f'{name}_{side}'] for name in ('T', 'h', 's', 'rho'))
+        values = self._fill_missing(values, (pressure_pa, quality), super().props_pq)
+        return self._shape(values, pressure_pa, quality)
+
+    def t_sat(self, pressure_pa, quality=0.0):
+        return self.props_pq(pressure_pa, quality)[0]
+
+
+def _format_bounds(bounds: Dict) -> str:
+    lines = []
+    for method, grids in bounds.items():
+        lines.append(f"  {method}:")
+        for grid_name, fields in grids.items():
+            parts = [f"{field} {b['max_rel'] * 100:.1e} % ({b['max_abs']:.2g})" for field, b in fields.items()]
+            lines.append(f"    {grid_name:<10} " + ", ".join(parts))
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Regenerate engine property interpolation tables.")
+    parser.add_argument('refrigerants', nargs='*', default=['R290'], help="CoolProp fluid names (default R290)")
+    parser.add_argument('--check', action='store_true', help="Only print the error bounds of existing tables")
+    args = parser.parse_args(argv)
+
+    status = 0
+    for refrigerant in args.refrigerants:
+        path = table_path(refrigerant)
+        try:
+            if args.check:
+                table = PropertyTable.load(path)
+                print(f"{refrigerant}: {path} (current: {table.is_current()})")
+            else:
+                table = PropertyTable.generate(refrigerant)
+                table.save(path)
+                print(f"{refrigerant}: wrote {path}")
+            print("Max relative (absolute, SI) error vs HEOS at cell centres:")
+            print(_format_bounds(table.error_bounds))
+        except Exception as e:
+            print(f"{refrigerant}: FAILED - {e}")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+"""
+range_stats.py
+
+Constant-time statistics over arbitrary row windows of the loaded CSV.
+
+RangeStatsIndex keeps, per numeric column, NaN-aware prefix sums of the
+values, of their squares and of the valid-sample count, so count/mean/std of
+any [lo, hi) row window take two array lookups. Min/max use a sparse table
+over fixed-size row blocks: whole blocks are answered from the table in O(1)
+and the partial blocks at either end are scanned directly. That keeps memory
+at O(n) per column instead of the O(n log n) of a row-level sparse table.
+
+Columns are indexed lazily on first use, so a wide file only pays for the
+sensors that are actually queried. Rows are positional; DataManager maps
+timestamps to row bounds with its sorted epoch index.
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+# Rows per min/max block; partial blocks at the window edges are scanned directly
+DEFAULT_BLOCK_SIZE = 256
+
+
+def _sparse_table(base: np.ndarray, op) -> list:
+    """Level k holds op over [i, i + 2**k) block runs of base."""
+    table = [base]
+    span = 1
+    while span * 2 <= len(base):
+        prev = table[-1]
+        table.append(op(prev[:-span], prev[span:]))
+        span *= 2
+    return table
+
+
+def _nan_reduce(op, values: np.ndarray) -> float:
+    """fmin/fmax reduction that ignores NaN and tolerates empty input."""
+    if values.size == 0:
+        return np.nan
+    return float(op.reduce(values))
+
+
+class _ColumnIndex:
+    """Prefix sums and block sparse tables for one column."""
+
+    def __init__(self, values: np.ndarray, block_size: int):
+        self.values = values
+        self.block_size = block_size
+        valid = ~np.isnan(values)
+
+        # Shift by the first valid sample so sums of squares keep their precision
+        first_valid = values[valid][:1]
+        self.shift = float(first_valid[0]) if first_valid.size else 0.0
+        centered = np.where(valid, values - self.shift, 0.0)
+        self.csum = np.concatenate(([0.0], np.cumsum(centered)))
+        self.csq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+        self.ccount = np.concatenate(([0], np.cumsum(valid, dtype=np.int64)))
+
+        n_blocks = -(-len(values) // block_size)
+        padded = np.full(n_blocks * block_size, np.nan)
+        padded[:len(values)] = values
+        blocks = padded.reshape(n_blocks, block_size)
+        self.min_table = _sparse_table(np.fmin.reduce(blocks, axis=1), np.fmin)
+        self.max_table = _sparse_table(np.fmax.reduce(blocks, axis=1), np.fmax)
+
+    def _extreme(self, lo: int, hi: int, table: list, op) -> float:
+        bs = self.block_size
+        first_block = -(-lo // bs)
+        end_block = hi // bs
+        if first_block >= end_block:
+            return _nan_reduce(op, self.values[lo:hi])
+
+        level = int(end_block - first_block).bit_length() - 1
+        span = 1 << level
+        result = op(table[level][first_block], table[level][end_block - span])
+        head = _nan_reduce(op, self.values[lo:first_block * bs])
+        tail = _nan_reduce(op, self.values[end_block * bs:hi])
+        return float(op(op(result, head), tail))
+
+    def stats(self, lo: int, hi: int) -> Dict[str, Optional[float]]:
+        count = int(self.ccount[hi] - self.ccount[lo])
+        if count == 0:
+            return {'count': 0, 'mean': None, 'std': None, 'min': None, 'max': None}
+
+        total = self.csum[hi] - self.csum[lo]
+        squares = self.csq[hi] - self.csq[lo]
+        mean = self.shift + total / count
+        # Sample standard deviation (ddof=1), matching pandas Series.std()
+        std = None
+        if count > 1:
+            variance = (squares - total * total / count) / (count - 1)
+            std = float(np.sqrt(max(variance, 0.0)))
+        return {
+            'count': count,
+            'mean': float(mean),
+            'std': std,
+            'min': self._extreme(lo, hi, self.min_table, np.fmin),
+            'max': self._extreme(lo, hi, self.max_table, np.fmax),
+        }
+
+
+class RangeStatsIndex:
+    """
+    count/mean/std/min/max of any positional row window of a DataFrame.
+
+    Build once per loaded frame; queries never rescan the window (apart from
+    at most two partial min/max blocks).
+    """
+
+    def __init__(self, df: pd.DataFrame, block_size: int = DEFAULT_BLOCK_SIZE):
+        self._df = df
+        self.block_size = block_size
+        self._columns: Dict[str, _ColumnIndex] = {}
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    def _column(self, name: str) -> Optional[_ColumnIndex]:
+        index = self._columns.get(name)
+        if index is not None:
+            return index
+        if name not in self._df.columns or not pd.api.types.is_numeric_dtype(self._df[name]):
+            return None
+        values = self._df[name].to_numpy(dtype='float64', na_value=np.nan)
+        index = _ColumnIndex(values, self.block_size)
+        self._columns[name] = index
+        return index
+
+    def stats(self, column: str, lo: int = 0, hi: Optional[int] = None) -> Optional[Dict[str, Optional[float]]]:
+        """Statistics of rows [lo, hi) of column, or None if it is missing or non-numeric."""
+        index = self._column(column)
+        if index is None:
+            return None
+        n = len(self._df)
+        hi = n if hi is None else hi
+        lo = min(max(int(lo), 0), n)
+        hi = min(max(int(hi), lo), n)
+        return index.stats(lo, hi)
+
+    def stats_for(self, columns: Iterable[str], lo: int = 0, hi: Optional[int] = None) -> Dict[str, Optional[Dict[str, Optional[float]]]]:
+        """stats() for several columns over the same window."""
+        return {column: self.stats(column, lo, hi) for column in columns}
@@ -0,0 +1,148 @@
+"""
+results_cache.py
+
+Sidecar store for Calculations tab results.
+
+A finished batch (the frame shown in the Calculations tab and plotted on the
+P-h tab) is written next to the CSV it was calculated from as
+"<name>.csv.ddtresults" (Parquet) with a JSON key file
+"<name>.csv.ddtresults.json". As for csv_cache.py, the sidecar is never
+pickled: without pyarrow results are simply not stored.
+
+The key records everything the results depend on: the CSV content hash,
+the resolved batch inputs (role -> column sensor map, eta_vol, compressor
+specs, refrigerant, property backend), the calculation input window and
+resolution, and calculation_engine.ENGINE_VERSION. Stored results
+are only returned when the key built from the current session matches
+exactly; otherwise the caller recalculates. One entry is kept per CSV, so
+the last calculation wins.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+import pandas as pd
+
+from csv_cache import _parquet_available, _read_key, _write_key, hash_file, validate_cache
+
+# Bump when the stored layout changes
+RESULTS_FORMAT_VERSION = 1
+RESULTS_SUFFIX = '.ddtresults'
+
+
+def results_paths(csv_path: str):
+    """Return (data_path, key_path) of the results sidecar for a CSV file."""
+    data_path = f"{csv_path}{RESULTS_SUFFIX}"
+    return data_path, f"{data_path}.json"
+
+
+def has_stored_results(csv_path: Optional[str]) -> bool:
+    """True if a results sidecar exists for csv_path (cheap; does not validate it)."""
+    if not csv_path:
+        return False
+    return all(os.path.exists(path) for path in results_paths(csv_path))
+
+
+def csv_content_hash(csv_path: str) -> str:
+    """SHA-1 of the CSV, taken from its parse cache key when that is still valid."""
+    stored = validate_cache(csv_path)
+    if stored and stored.get('sha1'):
+        return stored['sha1']
+    return hash_file(csv_path)
+
+
+def _json_value(value):
+    """value as it reads back from the JSON key file (timestamps etc. via str)."""
+    return json.loads(json.dumps(value, default=str))
+
+
+def _digest(value) -> str:
+    """Stable SHA-1 of a JSON-compatible value (timestamps etc. via str)."""
+    text = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def build_results_key(csv_sha1: str, columns, inputs: Dict, window, resample, engine_version: int) -> Dict:
+    """
+    Identity key of a calculation; equal keys mean identical results.
+
+    inputs is calculation_orchestrator.prepare_batch_inputs() output: the
+    resolved role -> column sensor map, eta_vol, compressor specs,
+    refrigerant and property backend. The worker count is left out, it does
+    not change results.
+    """
+    return {
+        'version': RESULTS_FORMAT_VERSION,
+        'engine_version': engine_version,
+        'csv_sha1': csv_sha1,
+        'columns_sha1': _digest(list(columns)),
+        'sensor_map_sha1': _digest(inputs.get('sensor_map') or {}),
+        'eta_vol': _json_value(inputs.get('eta_vol')),
+        'comp_specs': _json_value(inputs.get('comp_specs') or {}),
+        'refrigerant': inputs.get('refrigerant'),
+        'property_backend': inputs.get('property_backend'),
+        'window': _json_value(list(window)),
+        'resample': _json_value(list(resample)),
+    }
+
+
+def load_results(csv_path: str, key: Dict) -> Optional[pd.DataFrame]:
+    """Return the stored results for csv_path if their key equals key, else None."""
+    if not _parquet_available():
+        return None
+    try:
+        if not has_stored_results(csv_path):
+            return None
+        data_path, key_path = results_paths(csv_path)
+        stored = _read_key(key_path)
+        if not stored:
+            return None
+        changed = [name for name, value in key.items() if stored.get(name) != value]
+        if changed:
+            print(f"[RESULTS_CACHE] Stored results are stale ({', '.join(changed)} changed)")
+            return None
+        if stored.get('format') != 'parquet':
+            return None
+        df = pd.read_parquet(data_path)
+        print(f"[RESULTS_CACHE] Loaded {len(df)} result rows from {data_path}")
+        return df
+    except Exception as e:
+        print(f"[RESULTS_CACHE] Could not read stored results: {e}")
+        return None
+
+
+def store_results(csv_path: str, df: pd.DataFrame, key: Dict) -> bool:
+    """Write df as the results sidecar of csv_path under key. Returns True on success."""
+    if df is None or df.empty or not _parquet_available():
+        return False
+    data_path, key_path = results_paths(csv_path)
+    tmp_path = f"{data_path}.tmp"
+    try:
+        df.to_parquet(tmp_path)
+        # Drop the old key first so a failed key write never pairs it with new data
+        if os.path.exists(key_path):
+            os.remove(key_path)
+        os.replace(tmp_path, data_path)
+        _write_key(key_path, dict(key, format='parquet', rows=len(df)))
+        print(f"[RESULTS_CACHE] Stored {len(df)} result rows (parquet) in {data_path}")
+        return True
+    except Exception as e:
+        print(f"[RESULTS_CACHE] Could not store results for {csv_path}: {e}")
+        try:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        except Exception:
+            pass
+        return False
+
+
+def clear_results(csv_path: str) -> None:
+    """Remove the results sidecar files for csv_path, if any."""
+    for path in results_paths(csv_path):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except Exception as e:
+            print(f"[RESULTS_CACHE] Could not remove {path}: {e}")
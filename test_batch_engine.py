@@ -0,0 +1,103 @@
+"""
+test_batch_engine.py
+
+Tests that the column-wise batch engine (calculate_batch_performance and
+its chunked form) gives the same columns and values as applying
+calculate_row_performance to every row.
+
+Usage:
+    python -m pytest test_batch_engine.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import calculation_engine
+from calculation_engine import (
+    calculate_batch_performance,
+    calculate_row_performance,
+    combine_batch_chunks,
+    iter_batch_performance,
+)
+
+pytestmark = pytest.mark.skipif(calculation_engine.CP is None, reason="CoolProp not installed")
+
+# One logged operating point (psig, F, rpm) per mapped role
+OPERATING_POINT = {
+    'P_suc': 37.2, 'P_disch': 108.5, 'RPM': 3513.8, 'T_2b': 47.6, 'T_3a': 133.8, 'T_3b': 136.4, 'T_4a': 77.7,
+    'T_1a-lh': 27.2, 'T_1b-lh': 28.6, 'T_2a-LH': 47.0, 'T_4b-lh': 74.7,
+    'T_1a-ctr': 25.6, 'T_2a-ctr': 40.0, 'T_4b-ctr': 75.5,
+    'T_1a-rh': 25.2, 'T_2a-RH': 40.2, 'T_4b-rh': 74.2,
+    'Cond.water.out': 85.2, 'Cond.water.in': 74.8,
+}
+ETA_VOL = 0.85
+COMP_SPECS = {'displacement_m3': 1.8e-5}
+
+
+def _frame(n=30, seed=3):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({f"Sensor {role}": value + rng.normal(0.0, 2.0, n) for role, value in OPERATING_POINT.items()})
+    df.loc[3, 'Sensor P_suc'] = np.nan        # missing pressure: error row
+    df.loc[4, 'Sensor P_disch'] = np.nan
+    df.loc[5, 'Sensor T_3a'] = np.nan         # missing temperature: NaN outputs only
+    df.loc[6, 'Sensor T_2a-LH'] = np.nan
+    df.loc[7, 'Sensor T_2b'] = -500.0         # below absolute zero: CoolProp rejects the row
+    df.loc[8, 'Sensor P_suc'] = 5000.0        # no saturation state: CoolProp rejects the row
+    return df
+
+
+def _sensor_map(unmapped=()):
+    return {role: f"Sensor {role}" for role in OPERATING_POINT if role not in unmapped}
+
+
+def _row_wise(df, sensor_map):
+    return df.apply(lambda row: calculate_row_performance(row, sensor_map, ETA_VOL, COMP_SPECS), axis=1)
+
+
+def _assert_same_results(batch, rows, columns=None):
+    columns = list(rows.columns) if columns is None else columns
+    assert set(batch.columns) == set(columns)
+    if 'error' in columns:
+        # Messages may be worded differently; the failing rows must be the same
+        assert (batch['error'].notna() == rows['error'].notna()).all()
+    values = [c for c in columns if c != 'error']
+    np.testing.assert_allclose(batch[values].to_numpy(dtype=float), rows[values].to_numpy(dtype=float),
+                               rtol=1e-9, equal_nan=True)
+
+
+def test_batch_matches_row_wise():
+    df, sensor_map = _frame(), _sensor_map()
+    rows = _row_wise(df, sensor_map)
+    batch = calculate_batch_performance(df, sensor_map, ETA_VOL, COMP_SPECS)
+    assert batch['error'].notna().tolist() == [i in (3, 4, 7, 8) for i in range(len(df))]
+    _assert_same_results(batch, rows)
+
+
+def test_batch_matches_row_wise_with_unmapped_roles():
+    df = _frame()
+    sensor_map = _sensor_map(unmapped=('RPM', 'T_1a-rh', 'T_2a-RH', 'T_4b-rh', 'Cond.water.in'))
+    _assert_same_results(calculate_batch_performance(df, sensor_map, ETA_VOL, COMP_SPECS), _row_wise(df, sensor_map))
+
+
+def test_column_subset_matches_row_wise():
+    df, sensor_map = _frame(), _sensor_map()
+    requested = ['T_sat.lh', 'S.H_total', 'h_2b', 'h_4b_CTR']
+    batch = calculate_batch_performance(df, sensor_map, ETA_VOL, COMP_SPECS, columns=requested)
+    assert set(requested) <= set(batch.columns)
+    _assert_same_results(batch[requested], _row_wise(df, sensor_map), columns=requested)
+
+
+def test_combined_chunks_equal_one_batch():
+    df, sensor_map = _frame(), _sensor_map(unmapped=('T_4b-rh',))
+    whole = calculate_batch_performance(df, sensor_map, ETA_VOL, COMP_SPECS)
+    parts = [part for _, _, part in iter_batch_performance(df, sensor_map, ETA_VOL, COMP_SPECS, chunk_rows=7)]
+    assert len(parts) == 5
+    combined = combine_batch_chunks(parts)
+    assert list(combined.columns) == list(whole.columns)
+    assert combined.equals(whole)
@@ -0,0 +1,91 @@
+"""
+test_compressor_cycles.py
+
+Tests for the shared compressor ON/OFF definition (compressor_cycles.py):
+threshold and hysteresis switching, rows without a reading and the
+run-length encoded cycle events.
+
+Usage:
+    python -m pytest test_compressor_cycles.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from compressor_cycles import CompressorCycleIndex, build_cycle_index, compressor_state
+
+
+def test_without_hysteresis_state_is_the_threshold_test():
+    pressure = np.array([30.0, 40.0, 41.0, 39.0, 45.0])
+    assert compressor_state(pressure, 40.0).tolist() == [False, False, True, False, True]
+
+
+def test_hysteresis_holds_state_inside_the_band():
+    # ON above 40; OFF again only at or below 35
+    pressure = np.array([30.0, 38.0, 41.0, 38.0, 36.0, 35.0, 38.0, 42.0])
+    state = compressor_state(pressure, 40.0, hysteresis=5.0)
+    assert state.tolist() == [False, False, True, True, True, False, False, True]
+
+
+def test_noise_around_threshold_is_one_cycle_with_hysteresis():
+    pressure = np.array([30.0, 41.0, 39.5, 40.5, 39.8, 41.0, 30.0])
+    assert len([e for e in CompressorCycleIndex(pressure, 40.0).events if e['state'] == 'ON']) == 3
+    index = CompressorCycleIndex(pressure, 40.0, hysteresis=2.0)
+    assert [e['state'] for e in index.events] == ['OFF', 'ON', 'OFF']
+    assert index.cycle_stats()['cycles'] == 1
+
+
+def test_missing_readings_hold_state_but_are_not_counted():
+    pressure = np.array([50.0, np.nan, 50.0, 20.0, np.nan])
+    index = CompressorCycleIndex(pressure, 40.0)
+    assert index.state.tolist() == [True, True, True, False, False]
+    assert index.on_mask.tolist() == [True, False, True, False, False]
+    assert index.off_mask.tolist() == [False, False, False, True, False]
+    assert index.on_rows == 2
+    assert index.on_percentage == pytest.approx(40.0)
+    assert [(e['start_row'], e['stop_row']) for e in index.events] == [(0, 3), (3, 5)]
+
+
+def test_leading_undecided_rows_count_as_off():
+    pressure = np.array([np.nan, 38.0, 50.0])
+    assert compressor_state(pressure, 40.0, hysteresis=5.0).tolist() == [False, False, True]
+
+
+def test_event_durations_and_cycle_stats():
+    # One minute samples: OFF 2, ON 3, OFF 2, ON 1, OFF 2
+    pressure = np.array([10, 10, 50, 50, 50, 10, 10, 50, 10, 10], dtype=float)
+    timestamps = pd.date_range('2025-01-01', periods=len(pressure), freq='min')
+    index = CompressorCycleIndex(pressure, 40.0, timestamps=timestamps)
+
+    assert [(e['state'], e['start_row'], e['stop_row'], e['duration_s']) for e in index.events] == [
+        ('OFF', 0, 2, 120.0), ('ON', 2, 5, 180.0), ('OFF', 5, 7, 120.0), ('ON', 7, 8, 60.0), ('OFF', 8, 10, 120.0),
+    ]
+    stats = index.cycle_stats()
+    assert stats['cycles'] == 2
+    assert stats['cycles_per_hour'] == pytest.approx(2 / (600 / 3600))
+    assert stats['mean_on_time_s'] == pytest.approx(120.0)
+    # Only the OFF run fully inside the window counts
+    assert stats['mean_off_time_s'] == pytest.approx(120.0)
+
+
+def test_no_timestamps_means_no_durations():
+    index = CompressorCycleIndex(np.array([10.0, 50.0, 10.0]), 40.0)
+    assert all(e['duration_s'] is None for e in index.events)
+    assert index.cycle_stats()['cycles_per_hour'] is None
+
+
+def test_build_cycle_index_from_frame():
+    df = pd.DataFrame({
+        'Timestamp': pd.date_range('2025-01-01', periods=4, freq='min'),
+        'Suction': ['10', '50', 'bad', '10'],
+    })
+    index = build_cycle_index(df, 'Suction', 40.0)
+    assert index.sensor == 'Suction'
+    assert index.on_mask.tolist() == [False, True, False, False]
+    assert build_cycle_index(df, 'Missing', 40.0) is None
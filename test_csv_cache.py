@@ -0,0 +1,94 @@
+"""
+test_csv_cache.py
+
+Tests for the CSV sidecar cache (csv_cache.py): when a stored entry is
+reused, when it is refreshed and when it is treated as stale.
+
+Usage:
+    python -m pytest test_csv_cache.py
+"""
+
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import csv_cache
+from csv_cache import cache_paths, load_cached_frame, store_cached_frame, validate_cache
+
+pytestmark = pytest.mark.skipif(not csv_cache._parquet_available(), reason="pyarrow not installed")
+
+
+def _cached_csv(tmp_path):
+    csv_path = str(tmp_path / 'log.csv')
+    with open(csv_path, 'w', encoding='utf-8') as f:
+        f.write("Date,Time,P\n03/04/2025,10:00:00,1.5\n03/04/2025,10:01:00,2.5\n")
+    df = pd.DataFrame({'P': [1.5, 2.5]})
+    assert store_cached_frame(csv_path, df)
+    return csv_path, df
+
+
+def test_unchanged_file_loads_from_cache(tmp_path):
+    csv_path, df = _cached_csv(tmp_path)
+    cached = load_cached_frame(csv_path)
+    assert cached is not None
+    assert cached.equals(df)
+
+
+def test_touched_file_is_revalidated_by_hash(tmp_path):
+    csv_path, df = _cached_csv(tmp_path)
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    stored = validate_cache(csv_path)
+    assert stored is not None
+    assert stored['mtime_ns'] == os.stat(csv_path).st_mtime_ns
+    # The refreshed key is written back, so the next check needs no hash
+    with open(cache_paths(csv_path)[1], 'r', encoding='utf-8') as f:
+        assert json.load(f)['mtime_ns'] == stored['mtime_ns']
+
+
+def test_same_size_different_content_is_stale(tmp_path):
+    csv_path, _ = _cached_csv(tmp_path)
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    with open(csv_path, 'w', encoding='utf-8') as f:
+        f.write(text.replace('1.5', '9.5'))
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    assert validate_cache(csv_path) is None
+    assert load_cached_frame(csv_path) is None
+
+
+def test_size_change_is_stale(tmp_path):
+    csv_path, _ = _cached_csv(tmp_path)
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write("03/04/2025,10:02:00,3.5\n")
+    assert validate_cache(csv_path) is None
+
+
+def test_other_format_version_is_stale(tmp_path):
+    csv_path, _ = _cached_csv(tmp_path)
+    key_path = cache_paths(csv_path)[1]
+    with open(key_path, 'r', encoding='utf-8') as f:
+        key = json.load(f)
+    key['version'] = csv_cache.CACHE_FORMAT_VERSION - 1
+    with open(key_path, 'w', encoding='utf-8') as f:
+        json.dump(key, f)
+    assert validate_cache(csv_path) is None
+
+
+def test_non_parquet_entry_is_ignored(tmp_path):
+    csv_path, _ = _cached_csv(tmp_path)
+    key_path = cache_paths(csv_path)[1]
+    with open(key_path, 'r', encoding='utf-8') as f:
+        key = json.load(f)
+    key['format'] = 'pickle'
+    with open(key_path, 'w', encoding='utf-8') as f:
+        json.dump(key, f)
+    assert load_cached_frame(csv_path) is None
@@ -0,0 +1,53 @@
+"""
+test_csv_streaming.py
+
+Tests for the chunked CSV load (DataManager._read_csv_chunked): a streamed
+file must get the same timestamps as a single-pass load, also when the first
+chunks cannot tell day-first from month-first.
+
+Usage:
+    python -m pytest test_csv_streaming.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data_manager import DataManager
+
+
+def _write_log(path, stamps, date_format):
+    pd.DataFrame({
+        'Date': stamps.strftime(date_format),
+        'Time': stamps.strftime('%H:%M:%S'),
+        'P': np.arange(len(stamps), dtype=float),
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+def test_day_first_file_with_ambiguous_first_chunks(tmp_path):
+    # Two days per chunk: the chunks for 1-12 April fit month-first as well
+    stamps = pd.date_range('2025-04-01', '2025-04-20 23:00', freq='h')
+    csv_path = _write_log(tmp_path / 'log.csv', stamps, '%d/%m/%Y')
+
+    streamed = DataManager()._read_csv_chunked(csv_path, chunk_rows=48)
+    single = DataManager()._read_csv_file(csv_path)
+
+    assert (streamed['Timestamp'].values == stamps.values).all()
+    assert (single['Timestamp'].values == stamps.values).all()
+    assert streamed['P'].tolist() == single['P'].tolist()
+
+
+def test_ambiguous_file_streams_like_a_single_pass(tmp_path):
+    stamps = pd.date_range('2025-03-04', periods=96, freq='h')
+    csv_path = _write_log(tmp_path / 'log.csv', stamps, '%m/%d/%Y')
+
+    streamed = DataManager()._read_csv_chunked(csv_path, chunk_rows=24)
+    single = DataManager()._read_csv_file(csv_path)
+
+    assert (streamed['Timestamp'].values == single['Timestamp'].values).all()
+    assert (streamed['Timestamp'].values == stamps.values).all()
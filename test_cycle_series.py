@@ -0,0 +1,171 @@
+"""
+test_cycle_series.py
+
+Tests that the array variants compute_8_point_cycle_series,
+compute_single_coil_series and compute_cycle_series give, element by
+element, what the scalar compute_8_point_cycle, _compute_single_coil and
+compute_cycle return, including missing temperatures and rejected rows.
+
+Usage:
+    python -m pytest test_cycle_series.py
+"""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import calculation_engine
+from calculation_engine import (
+    _compute_single_coil,
+    compute_8_point_cycle,
+    compute_8_point_cycle_series,
+    compute_cycle,
+    compute_cycle_series,
+    compute_single_coil_series,
+)
+
+pytestmark = pytest.mark.skipif(calculation_engine.CP is None, reason="CoolProp not installed")
+
+RTOL = 1e-7
+
+
+def _scalar(value):
+    """Array element as the scalar functions take it: None when not measured."""
+    return None if value is None or math.isnan(value) else float(value)
+
+
+def _assert_close(series_value, scalar_value):
+    if scalar_value is None:
+        assert np.isnan(series_value)
+    else:
+        assert series_value == pytest.approx(scalar_value, rel=RTOL)
+
+
+# --- compute_8_point_cycle ---
+
+# R290 suction / liquid pressure (Pa abs) and state temperatures (K) per element:
+# 0 complete, 1 no TXV inlet (T_4b NaN), 2 compressor outlet not measured (0),
+# 3 compressor inlet below absolute zero (CoolProp rejects it), 4 complete
+P_SUCTION = np.array([358e3, 360e3, 355e3, 358e3, 340e3])
+P_LIQUID = np.array([850e3, 860e3, 845e3, 850e3, 900e3])
+TEMPERATURES = {
+    'T_3a': np.array([330.0, 331.0, 0.0, 330.0, 335.0]),
+    'T_3b': np.array([331.0, 332.0, 331.5, 331.0, 336.0]),
+    'T_4a': np.array([298.0, 299.0, 298.5, 298.0, 301.0]),
+    'T_4b': np.array([296.0, np.nan, 296.5, 296.0, 299.0]),
+    'T_2a': np.array([281.0, 282.0, 281.5, 281.0, 280.0]),
+    'T_2b': np.array([282.0, 283.0, 282.5, -5.0, 281.0]),
+}
+STATE_COLUMNS = {'T_K': 'T_{}_K', 'h_kJkg': 'h_{}_kJkg', 's_kJkgK': 's_{}_kJkgK', 'rho_kgm3': 'rho_{}_kgm3',
+                 'T_sat_K': 'T_sat_{}_K', 'superheat_F': 'superheat_{}_F', 'subcooling_F': 'subcooling_{}_F',
+                 'vapor_quality': 'quality_{}'}
+
+
+def _scalar_8_point(i):
+    temperatures = {key: _scalar(values[i]) for key, values in TEMPERATURES.items()}
+    return compute_8_point_cycle(P_SUCTION[i], P_LIQUID[i], temperatures, 'R290')
+
+
+@pytest.fixture(scope='module')
+def eight_point_series():
+    return compute_8_point_cycle_series(P_SUCTION, P_LIQUID, TEMPERATURES, 'R290')
+
+
+@pytest.mark.parametrize('i', [0, 1, 2, 4])
+def test_8_point_states_match_scalar(eight_point_series, i):
+    scalar = _scalar_8_point(i)
+    assert not scalar['errors']
+    row = eight_point_series.iloc[i]
+    for name in ('3a', '3b', '4a', '4b', '2a', '2b', '1'):
+        state = scalar['states'].get(name)
+        for key, column in STATE_COLUMNS.items():
+            column = column.format(name)
+            if column not in row.index:
+                continue
+            _assert_close(row[column], None if state is None else state.get(key))
+
+
+@pytest.mark.parametrize('i', [0, 1, 2, 4])
+def test_8_point_performance_matches_scalar(eight_point_series, i):
+    scalar = _scalar_8_point(i)
+    row = eight_point_series.iloc[i]
+    for key in ('refrigeration_effect_kJkg', 'compressor_work_kJkg', 'heat_rejected_kJkg', 'cop'):
+        _assert_close(row[key], scalar['performance'].get(key))
+    _assert_close(row['density_compressor_inlet_kgm3'], scalar.get('density_compressor_inlet_kgm3'))
+
+
+def test_8_point_missing_inputs_only_blank_their_columns(eight_point_series):
+    # No T_4b: no state 1 and no cycle performance, the other states are there
+    assert np.isnan(eight_point_series.loc[1, ['h_4b_kJkg', 'h_1_kJkg', 'quality_1', 'cop']].astype(float)).all()
+    assert not np.isnan(eight_point_series.loc[1, 'h_2b_kJkg'])
+    # T_3a not measured: no heat rejection, COP still computed
+    assert np.isnan(eight_point_series.loc[2, 'heat_rejected_kJkg'])
+    assert not np.isnan(eight_point_series.loc[2, 'cop'])
+
+
+def test_8_point_rejected_element_is_nan(eight_point_series):
+    assert _scalar_8_point(3)['errors']
+    row = eight_point_series.iloc[3]
+    assert np.isnan(row[['h_2b_kJkg', 'refrigeration_effect_kJkg', 'cop', 'density_compressor_inlet_kgm3']].astype(float)).all()
+    # Other rows are unaffected
+    assert not np.isnan(eight_point_series.loc[4, 'cop'])
+
+
+# --- _compute_single_coil / compute_cycle ---
+
+# R410A suction / discharge pressure (Pa abs); element 3 is above the critical
+# pressure, so it has no saturation state and the scalar version raises
+COIL_SUCTION = np.array([800e3, 820e3, 790e3, 6e6])
+COIL_DISCHARGE = np.array([2.5e6, 2.6e6, 2.4e6, 2.5e6])
+COIL_OUTLET = np.array([285.0, np.nan, 290.0, 285.0])
+
+COIL_KEYS = {'usedTempK': 'T_1_K', 'tSatK': 'T_sat_K', 'superheatF': 'superheat_F',
+             'refrigerationEffectKJkg': 'refrigeration_effect_kJkg', 'compressorWorkKJkg': 'compressor_work_kJkg',
+             'heatRejectedKJkg': 'heat_rejected_kJkg', 'cop': 'cop'}
+
+
+def _assert_coil_matches(row, scalar):
+    for key, column in COIL_KEYS.items():
+        _assert_close(row[column], scalar[key])
+    for point in ('1', '2', '3', '4'):
+        _assert_close(row[f'h_{point}_kJkg'], scalar[f'p{point}']['h_kJkg'])
+        _assert_close(row[f'T_{point}_K'], scalar[f'p{point}']['t_K'])
+
+
+@pytest.mark.parametrize('i', [0, 1, 2])
+def test_single_coil_matches_scalar(i):
+    series = compute_single_coil_series(COIL_SUCTION, COIL_DISCHARGE, COIL_OUTLET, 'R410A')
+    scalar = _compute_single_coil(COIL_SUCTION[i], COIL_DISCHARGE[i], _scalar(COIL_OUTLET[i]), 'R410A')
+    _assert_coil_matches(series.iloc[i], scalar)
+
+
+def test_single_coil_rejected_element_is_nan():
+    with pytest.raises(ValueError):
+        _compute_single_coil(COIL_SUCTION[3], COIL_DISCHARGE[3], COIL_OUTLET[3], 'R410A')
+    series = compute_single_coil_series(COIL_SUCTION, COIL_DISCHARGE, COIL_OUTLET, 'R410A')
+    assert np.isnan(series.loc[3, ['T_sat_K', 'h_1_kJkg', 'cop']].astype(float)).all()
+    assert not np.isnan(series.loc[:2, 'cop']).any()
+
+
+@pytest.mark.parametrize('method', ['Average', 'Maximum', 'Minimum', 'Last'])
+def test_cycle_matches_scalar(method):
+    # Two outlet sensors on the left coil (one missing in element 1), one in the center, none on the right
+    coils = {
+        'left': [np.array([285.0, np.nan, 288.0]), np.array([287.0, 286.0, 289.0])],
+        'center': [np.array([284.0, 283.0, np.nan])],
+        'right': [],
+    }
+    series = compute_cycle_series(COIL_SUCTION[:3], COIL_DISCHARGE[:3], coils, method, 'R410A')
+    for i in range(3):
+        scalar = compute_cycle(
+            COIL_SUCTION[i], COIL_DISCHARGE[i],
+            {name: [_scalar(values[i]) for values in sensors] for name, sensors in coils.items()},
+            method, 'R410A')
+        assert scalar['ok'], scalar['errors']
+        for name in ('left', 'center', 'right'):
+            _assert_coil_matches(series[name].iloc[i], scalar['coils'][name]['calc'])
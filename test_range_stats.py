@@ -0,0 +1,75 @@
+"""
+test_range_stats.py
+
+Tests for RangeStatsIndex (range_stats.py): every window statistic must
+equal what pandas computes on the same rows, NaNs included.
+
+Usage:
+    python -m pytest test_range_stats.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from range_stats import RangeStatsIndex
+
+
+def _frame(n=1000, seed=7):
+    rng = np.random.default_rng(seed)
+    values = 500.0 + rng.normal(0.0, 25.0, n)
+    values[rng.random(n) < 0.1] = np.nan
+    values[300:340] = np.nan
+    return pd.DataFrame({'P': values, 'Label': ['x'] * n})
+
+
+def _assert_matches_pandas(index, df, lo, hi):
+    window = df['P'].iloc[lo:hi]
+    stats = index.stats('P', lo, hi)
+    assert stats['count'] == window.count()
+    if window.count() == 0:
+        assert stats['mean'] is None and stats['min'] is None and stats['max'] is None
+        return
+    assert stats['mean'] == pytest.approx(window.mean(), rel=1e-12)
+    assert stats['min'] == window.min()
+    assert stats['max'] == window.max()
+    if window.count() > 1:
+        assert stats['std'] == pytest.approx(window.std(), rel=1e-9)
+    else:
+        assert stats['std'] is None
+
+
+@pytest.mark.parametrize('block_size', [1, 16, 256])
+def test_random_windows_match_pandas(block_size):
+    df = _frame()
+    index = RangeStatsIndex(df, block_size=block_size)
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        lo, hi = sorted(rng.integers(0, len(df) + 1, size=2))
+        _assert_matches_pandas(index, df, int(lo), int(hi))
+
+
+def test_edge_windows_match_pandas():
+    df = _frame()
+    index = RangeStatsIndex(df, block_size=64)
+    for lo, hi in [(0, len(df)), (0, 1), (64, 128), (63, 129), (300, 340), (299, 341), (len(df) - 1, len(df)), (5, 5)]:
+        _assert_matches_pandas(index, df, lo, hi)
+
+
+def test_bounds_are_clamped():
+    df = _frame(n=100)
+    index = RangeStatsIndex(df)
+    assert index.stats('P', -10, 10_000) == index.stats('P', 0, 100)
+    assert index.stats('P', 80, 20)['count'] == 0
+
+
+def test_missing_and_non_numeric_columns():
+    index = RangeStatsIndex(_frame(n=10))
+    assert index.stats('Label') is None
+    assert index.stats('nope') is None
+    assert set(index.stats_for(['P', 'nope'])) == {'P', 'nope'}
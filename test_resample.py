@@ -0,0 +1,87 @@
+"""
+test_resample.py
+
+Tests for the resample stage between load and filter (data_manager.py):
+bucket statistics, coarse data passed through unchanged, and a custom time
+window cut from the resampled frame.
+
+Usage:
+    python -m pytest test_resample.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data_manager import DataManager, resample_frame
+
+
+def _one_second_log(minutes=10, seed=5):
+    stamps = pd.date_range('2025-04-03 10:00:00', periods=minutes * 60, freq='s')
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Timestamp': stamps,
+        'P': rng.normal(40.0, 5.0, len(stamps)),
+        'T': np.arange(len(stamps), dtype=float),
+        'Label': [f"row {i}" for i in range(len(stamps))],
+    })
+
+
+@pytest.mark.parametrize('method', ['mean', 'min', 'max', 'last'])
+def test_bucket_statistics(method):
+    df = _one_second_log()
+    out = resample_frame(df, '1min', method)
+    expected = df.groupby(df['Timestamp'].dt.floor('1min'))[['P', 'T']].agg(method)
+
+    assert list(out.columns) == list(df.columns)
+    assert out['Timestamp'].tolist() == expected.index.tolist()
+    np.testing.assert_allclose(out['P'], expected['P'])
+    np.testing.assert_allclose(out['T'], expected['T'])
+    # Text columns keep the last value of the bucket
+    assert out['Label'].iloc[0] == 'row 59'
+
+
+def test_empty_buckets_are_dropped():
+    df = _one_second_log(minutes=5)
+    df = df[(df['Timestamp'] < '2025-04-03 10:02') | (df['Timestamp'] >= '2025-04-03 10:03')]
+    out = resample_frame(df, '1min')
+    assert out['Timestamp'].dt.minute.tolist() == [0, 1, 3, 4]
+
+
+def test_coarse_data_is_returned_unchanged():
+    df = pd.DataFrame({
+        'Timestamp': pd.date_range('2025-04-03 10:00', periods=20, freq='5min'),
+        'P': np.arange(20, dtype=float),
+    })
+    assert resample_frame(df, '1min') is df
+    assert resample_frame(df, '5min') is df
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        resample_frame(_one_second_log(minutes=1), '1min', 'median')
+
+
+def test_custom_window_is_cut_from_the_resampled_frame():
+    df = _one_second_log()
+    data_manager = DataManager()
+    data_manager.csv_data = df
+    data_manager.set_resample('calculations', '1min', 'mean')
+    start, end = pd.Timestamp('2025-04-03 10:02:30'), pd.Timestamp('2025-04-03 10:05:10')
+    data_manager.set_custom_time_range(start, end)
+
+    window = data_manager.get_filtered_data(consumer='calculations')
+    resampled = resample_frame(df, '1min', 'mean')
+    # Every bucket that overlaps the raw window, including the partial ones at its ends
+    expected = resampled[(resampled['Timestamp'] > start - pd.Timedelta('1min')) & (resampled['Timestamp'] <= end)]
+    assert window['Timestamp'].dt.strftime('%H:%M').tolist() == ['10:02', '10:03', '10:04', '10:05']
+    np.testing.assert_allclose(window['P'], expected['P'])
+
+    raw = data_manager.get_filtered_data(consumer='graph')
+    assert raw['Timestamp'].min() >= start and raw['Timestamp'].max() <= end
+    assert len(raw) == 161
@@ -0,0 +1,86 @@
+"""
+test_results_cache.py
+
+Tests for the Calculations results sidecar (results_cache.py): stored
+results come back only for an identical key, and any input that changes the
+results makes them stale.
+
+Usage:
+    python -m pytest test_results_cache.py
+"""
+
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import csv_cache
+from results_cache import build_results_key, load_results, results_paths, store_results
+
+pytestmark = pytest.mark.skipif(not csv_cache._parquet_available(), reason="pyarrow not installed")
+
+INPUTS = {
+    'sensor_map': {'P_suc': 'Suction Pressure', 'P_disch': 'Discharge Pressure', 'T_2b': 'Suction Temp'},
+    'eta_vol': 0.85,
+    'comp_specs': {'displacement_cm3': 12.5},
+    'refrigerant': 'R290',
+    'property_backend': 'HEOS',
+    'batch_workers': 4,
+}
+WINDOW = (pd.Timestamp('2025-04-03 10:00'), pd.Timestamp('2025-04-03 12:00'))
+
+
+def _key(inputs=None, window=WINDOW, resample=('1min', 'mean'), engine_version=1):
+    return build_results_key('abc123', ['Timestamp', 'Suction Pressure'], inputs or INPUTS,
+                             window, resample, engine_version)
+
+
+def _stored(tmp_path):
+    csv_path = str(tmp_path / 'log.csv')
+    with open(csv_path, 'w', encoding='utf-8') as f:
+        f.write("Date,Time\n")
+    df = pd.DataFrame({'T_2b': [40.0, 41.0], 'h_2b': [580.0, 581.5]})
+    assert store_results(csv_path, df, _key())
+    return csv_path, df
+
+
+def test_identical_key_returns_results(tmp_path):
+    csv_path, df = _stored(tmp_path)
+    loaded = load_results(csv_path, _key())
+    assert loaded is not None
+    assert loaded.equals(df)
+
+
+def test_key_survives_the_json_round_trip(tmp_path):
+    csv_path, _ = _stored(tmp_path)
+    with open(results_paths(csv_path)[1], 'r', encoding='utf-8') as f:
+        stored = json.load(f)
+    assert {name: stored[name] for name in _key()} == _key()
+
+
+def test_worker_count_does_not_invalidate(tmp_path):
+    csv_path, _ = _stored(tmp_path)
+    assert load_results(csv_path, _key(dict(INPUTS, batch_workers=1))) is not None
+
+
+@pytest.mark.parametrize('change', [
+    {'sensor_map': dict(INPUTS['sensor_map'], T_2b='Other Temp')},
+    {'eta_vol': 0.9},
+    {'comp_specs': {'displacement_cm3': 13.0}},
+    {'refrigerant': 'R134a'},
+    {'property_backend': 'TABLES'},
+])
+def test_changed_inputs_are_stale(tmp_path, change):
+    csv_path, _ = _stored(tmp_path)
+    assert load_results(csv_path, _key(dict(INPUTS, **change))) is None
+
+
+def test_changed_window_resample_or_engine_are_stale(tmp_path):
+    csv_path, _ = _stored(tmp_path)
+    assert load_results(csv_path, _key(window=(WINDOW[0], pd.Timestamp('2025-04-03 13:00')))) is None
+    assert load_results(csv_path, _key(resample=(None, 'mean'))) is None
+    assert load_results(csv_path, _key(engine_version=2)) is None
@@ -0,0 +1,85 @@
+"""
+test_timestamp_fast_path.py
+
+Tests for the explicit-format fast path of timestamp_fixer.py: the format
+must fit every row, and nothing inferred from one file may leak into the next.
+
+Usage:
+    python -m pytest test_timestamp_fast_path.py
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from timestamp_fixer import TimestampFixer, fix_ambiguous_dates
+
+
+def _day_first_frame():
+    """Hourly 10 Mar - 5 Apr 2025 written day-first: both ends are ambiguous (day <= 12), the middle is not."""
+    stamps = pd.date_range('2025-03-10', '2025-04-05 23:00', freq='h')
+    return pd.DataFrame({'Date': stamps.strftime('%d/%m/%Y'), 'Time': stamps.strftime('%H:%M:%S')}), stamps
+
+
+def test_format_must_fit_every_row():
+    df, expected = _day_first_frame()
+    parsed = fix_ambiguous_dates(df['Date'], df['Time'])
+    assert (parsed.values == expected.values).all()
+
+
+def test_month_first_is_kept_for_ambiguous_files():
+    df = pd.DataFrame({'Date': ['04/03/2025', '04/03/2025'], 'Time': ['10:00:00', '10:01:00']})
+    parsed = fix_ambiguous_dates(df['Date'], df['Time'])
+    assert parsed.iloc[0] == pd.Timestamp('2025-04-03 10:00:00')
+
+
+def test_inferred_format_does_not_leak_between_files():
+    day_first, _ = _day_first_frame()
+    fix_ambiguous_dates(day_first['Date'], day_first['Time'])
+    month_first = pd.DataFrame({'Date': ['04/03/2025'], 'Time': ['10:00:00']})
+    parsed = fix_ambiguous_dates(month_first['Date'], month_first['Time'])
+    assert parsed.iloc[0] == pd.Timestamp('2025-04-03 10:00:00')
+
+
+def test_chunks_of_one_file_share_the_format():
+    fixer = TimestampFixer()
+    first = pd.DataFrame({'Date': ['25/03/2025'], 'Time': ['10:00:00']})
+    second = pd.DataFrame({'Date': ['04/03/2025'], 'Time': ['10:00:00']})
+    fix_ambiguous_dates(first['Date'], first['Time'], fixer=fixer)
+    parsed = fix_ambiguous_dates(second['Date'], second['Time'], fixer=fixer)
+    assert fixer.inferred_format == '%d/%m/%Y %H:%M:%S'
+    assert parsed.iloc[0] == pd.Timestamp('2025-03-04 10:00:00')
+
+
+def test_unparseable_rows_fall_back_to_strategy_search():
+    df = pd.DataFrame({'Date': ['03/25/2025', '25/03/2025'], 'Time': ['10:00:00', '10:00:00']})
+    parsed = fix_ambiguous_dates(df['Date'], df['Time'])
+    assert parsed.iloc[0] == pd.Timestamp('2025-03-25 10:00:00')
+
+
+def test_only_failed_rows_go_through_the_strategies():
+    stamps = pd.date_range('2025-03-01', periods=7 * 24 * 60, freq='min')
+    df = pd.DataFrame({'Date': stamps.strftime('%m/%d/%Y'), 'Time': stamps.strftime('%H:%M:%S')})
+    df.loc[5000, 'Date'] = 'corrupt'
+    fixer = TimestampFixer()
+    strategy_rows = []
+    parse_with_strategies = fixer._parse_with_strategies
+    fixer._parse_with_strategies = lambda s, p: strategy_rows.append(len(s)) or parse_with_strategies(s, p)
+
+    parsed = fix_ambiguous_dates(df['Date'], df['Time'], fixer=fixer)
+    assert strategy_rows == [1]
+    assert pd.isna(parsed.iloc[5000])
+    assert (parsed.drop(index=5000).values == stamps.delete(5000).values).all()
+
+
+def test_corrupt_row_does_not_flip_a_day_first_file():
+    df, expected = _day_first_frame()
+    df.loc[len(df) - 1, 'Time'] = '??'
+    fixer = TimestampFixer()
+    parsed = fix_ambiguous_dates(df['Date'], df['Time'], fixer=fixer)
+    assert fixer.inferred_format == '%d/%m/%Y %H:%M:%S'
+    assert fixer.format_confirmed
+    assert (parsed.iloc[:-1].values == expected[:-1].values).all()
@@ -7,11 +7,49 @@ import pandas as pd
 from datetime import datetime, timedelta
 import re
 
+# Explicit formats tried by the fast path, in order. Month-first layouts come
+# before day-first ones to match the 'explicit_slash' strategy and pandas'
+# own inference for ambiguous dates such as 4/5/2025.
+FAST_PATH_FORMATS = [
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y %H:%M',
+    '%m/%d/%Y %I:%M:%S %p',
+    '%m/%d/%Y %I:%M %p',
+    '%m/%d/%y %H:%M:%S',
+    '%m/%d/%y %H:%M',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y/%m/%d %H:%M:%S',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y %H:%M',
+    '%d-%m-%Y %H:%M:%S',
+    '%m/%d/%Y',
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+]
+
+# Number of rows taken from each end of the series to screen candidate formats
+# (a candidate is then confirmed on every row)
+FORMAT_SAMPLE_ROWS = 20
+
 class TimestampFixer:
-    """Utility class for fixing common timestamp parsing issues."""
+    """
+    Utility class for fixing common timestamp parsing issues.
+    
+    Use one instance per file: the format inferred by the fast path is kept
+    on the instance and tried first for later chunks of the same file.
+    format_confirmed turns True once a chunk fits that format and no other
+    (e.g. a day > 12 ruled out month-first); until then a streaming loader
+    must be ready to re-parse the chunks it already has.
+    """
     
     def __init__(self):
         self.current_year = datetime.now().year
+        # Format inferred by the fast path for this file; reused while it
+        # still fits so that chunked loads parse every chunk the same way
+        self.inferred_format = None
+        self.format_confirmed = False
         
     def fix_ambiguous_dates(self, date_series, time_series=None):
         """
@@ -40,8 +78,15 @@ class TimestampFixer:
         else:
             timestamp_str = date_series.astype(str)
         
+        # Fast path: one vectorized parse with an inferred explicit format.
+        # Future years need the correction strategies, so skip it for those.
+        timestamps = None
+        if not date_patterns['future_years']:
+            timestamps = self._parse_fast_path(timestamp_str, date_patterns)
+        
         # Try different parsing strategies
-        timestamps = self._parse_with_strategies(timestamp_str, date_patterns)
+        if timestamps is None:
+            timestamps = self._parse_with_strategies(timestamp_str, date_patterns)
         
         # Validate and correct if needed
         timestamps = self._validate_and_correct_timestamps(timestamps)
@@ -89,6 +134,86 @@ class TimestampFixer:
         
         return patterns
     
+    def _candidate_formats(self, sample_strings):
+        """Candidate formats that parse most sample strings, this file's earlier format first."""
+        if len(sample_strings) == 0:
+            return []
+        
+        candidates = list(FAST_PATH_FORMATS)
+        if self.inferred_format in candidates:
+            candidates.remove(self.inferred_format)
+        if self.inferred_format:
+            candidates.insert(0, self.inferred_format)
+        
+        fitting = []
+        for fmt in candidates:
+            try:
+                parsed = pd.to_datetime(sample_strings, format=fmt, errors='coerce')
+            except Exception:
+                continue
+            # A stray footer or corrupt row in the sample must not rule a format out
+            if parsed.notna().sum() * 2 > len(sample_strings):
+                fitting.append(fmt)
+        return fitting
+    
+    def _parse_fast_path(self, timestamp_str, patterns):
+        """
+        Parse the whole series once with an explicit format inferred from a sample.
+        
+        Candidates are screened on the first and last FORMAT_SAMPLE_ROWS rows
+        and then tried on every row; the one leaving the fewest rows unparsed
+        wins, so a format that fits the sample but not the rest (e.g.
+        month-first on a day-first file whose ends have days <= 12) loses to
+        the order that fits everything. Only the rows the winner cannot parse
+        go through _parse_with_strategies. Returns None when no format parses
+        most rows, so the caller can fall back to the full strategy search.
+        
+        The format is confirmed once it leaves strictly fewer rows unparsed
+        than any rival; with only ambiguous dates such as 03/04 the preferred
+        one is used but the format stays unconfirmed.
+        """
+        valid_mask = timestamp_str.notna() & ~timestamp_str.isin(['', 'nan', 'NaT', 'nan nan'])
+        valid = timestamp_str[valid_mask]
+        if valid.empty:
+            return None
+        sample = pd.concat([valid.head(FORMAT_SAMPLE_ROWS), valid.tail(FORMAT_SAMPLE_ROWS)]).unique()
+        
+        # (unparsed rows, format, timestamps) per candidate, in preference order
+        tried = []
+        for fmt in self._candidate_formats(sample):
+            timestamps = pd.to_datetime(timestamp_str, format=fmt, errors='coerce')
+            failed = int((timestamps.isna() & valid_mask).sum())
+            tried.append((failed, fmt, timestamps))
+            if failed == 0 and (self.format_confirmed or sum(1 for t in tried if t[0] == 0) > 1):
+                # A settled format needs no rival; one full-fit rival is enough to stay unsettled
+                break
+        
+        if not tried:
+            print(f"[TIMESTAMP_FIXER] No explicit format fits the sample, using strategy search")
+            return None
+        
+        failed, fmt, timestamps = min(tried, key=lambda t: t[0])
+        rivals = [t for t in tried if t[1] != fmt]
+        if failed * 2 > len(valid):
+            print(f"[TIMESTAMP_FIXER] No explicit format parses most rows, using strategy search")
+            return None
+        
+        if self.inferred_format and fmt != self.inferred_format:
+            print(f"[TIMESTAMP_FIXER] Date format changed from '{self.inferred_format}' to '{fmt}'")
+        self.inferred_format = fmt
+        tied = [t[1] for t in rivals if t[0] == failed]
+        if not tied:
+            self.format_confirmed = True
+        print(f"[TIMESTAMP_FIXER] Fast path parsed {len(valid) - failed} rows with format '{fmt}'"
+              + (f" ('{tied[0]}' fits as well)" if tied and not self.format_confirmed else ""))
+        
+        if failed:
+            failed_mask = timestamps.isna() & valid_mask
+            print(f"[TIMESTAMP_FIXER] {failed} rows do not match '{fmt}', trying the strategies on those rows")
+            timestamps = timestamps.copy()
+            timestamps[failed_mask] = self._parse_with_strategies(timestamp_str[failed_mask], patterns)
+        return timestamps
+    
     def _parse_with_strategies(self, timestamp_str, patterns):
         """Try different parsing strategies based on detected patterns."""
         strategies = []
@@ -207,7 +332,12 @@ def get_timestamp_fixer():
         _timestamp_fixer = TimestampFixer()
     return _timestamp_fixer
 
-def fix_ambiguous_dates(date_series, time_series=None):
-    """Convenience function for fixing ambiguous dates."""
-    fixer = get_timestamp_fixer()
+def fix_ambiguous_dates(date_series, time_series=None, fixer=None):
+    """
+    Convenience function for fixing ambiguous dates.
+    
+    Pass the same TimestampFixer for every chunk of one file; by default each
+    call gets a fresh one, so nothing inferred from one file affects the next.
+    """
+    fixer = fixer or TimestampFixer()
     return fixer.fix_ambiguous_dates(date_series, time_series)